@@ -1,7 +1,8 @@
-from typing import Type
+from typing import Optional, Type
 
 from pydantic import BaseModel
 
+from ..scheduler import RefreshRate
 from ...davinci.enums import ResolveStatus
 
 
@@ -13,12 +14,16 @@ class ActionBase:
         description: str,
         required_status: ResolveStatus,
         input_model: Type[BaseModel] = None,
+        refresh_rate: Optional[RefreshRate] = None,
+        event_types: Optional[tuple[Type, ...]] = None,
     ):
         self.name = name
         self.display_name = display_name
         self.description = description
         self.required_status = required_status
         self.input_model = input_model
+        self.refresh_rate = refresh_rate
+        self.event_types = event_types  # update() only runs when one of these events is published, see events.py
 
     def __repr__(self):
         return f"Action '{self.display_name}'"
@@ -6,10 +6,16 @@ from pydantic import ValidationError
 
 from .action_base import ActionBase
 from .action_status import ActionStatus
+from .cancellation import ActionCancelled, CancellationToken
+from .progress import Progress, ProgressReporter
+from ..events import EventBus
+from ..scheduler import RefreshRate
 from ..settings import AppSettings
 from ...davinci.context import TimelineContext, TimelineDiff
 from ...davinci.enums import ResolveStatus
+from ...davinci.getter_cache import GetterCache
 from ...davinci.resolve_app import ResolveApp
+from ...davinci.rpc_stats import RpcMonitor, RpcStats
 from ...utils import log
 from ...utils.timer import Timer
 from ... import utils
@@ -61,15 +67,25 @@ class ActionStatusControl:
 
 
 class ActionControl:
-    def __init__(self, action: ActionBase):
+    def __init__(self, action: ActionBase, event_bus: Optional[EventBus] = None):
         self.action = action
         self.input_data = None
         self.run_in_background = hasattr(self.action, "update")
+        self.pending_events = []
+
+        if event_bus is not None and self.run_in_background:
+            for event_type in self.event_types:
+                event_bus.subscribe(event_type, self.pending_events.append)
         self.status_control = ActionStatusControl(target_status=(ActionStatus.Started if self.run_in_background else ActionStatus.Stopped))
 
         self.error_count = 0
         self.error_timer = Timer()
 
+        self.rpc_stats = RpcStats()
+        self.cancellation_token = CancellationToken()
+        # last published progress of start(), read by the GUI from its own thread
+        self.progress: Optional[Progress] = None
+
     @property
     def action_type(self):
         return type(self.action)
@@ -90,10 +106,28 @@ class ActionControl:
     def input_model(self):
         return self.action.input_model
 
+    @property
+    def event_types(self) -> set:
+        # events of the action itself and of its inputs
+        event_types = set(self.action.event_types or ())
+
+        if self.input_model is not None:
+            for field in self.input_model.__fields__.values():
+                event_types.update(getattr(field.type_, "event_types", ()))
+
+        return event_types
+
     @property
     def is_starting(self):
         return self.status_control.should_start()
 
+    @property
+    def refresh_rate(self) -> Optional[RefreshRate]:
+        if not self.run_in_background or not self.status_control.is_started():
+            return None
+
+        return self.action.refresh_rate
+
     def _parse_input(self, input_data: dict):
         validated_input_data = None
 
@@ -131,8 +165,16 @@ class ActionControl:
         if self.input_data is None:
             self.input_data = self.input_model()
 
+        events = self.pending_events.copy()
+        self.pending_events.clear()
+
         for field_name, field_data in self.input_data:
-            if hasattr(field_data, "update"):
+            if hasattr(field_data, "on_events"):
+                field_events = [event for event in events if isinstance(event, field_data.event_types)]
+
+                if len(field_events) > 0:
+                    field_data.on_events(field_events)
+            elif hasattr(field_data, "update"):
                 utils.forward_partial_args(field_data.update)(
                     timeline_context=timeline_context,
                     timeline_diff=timeline_diff,
@@ -150,15 +192,26 @@ class ActionControl:
             self.status_control.on_aciton_stop()
 
         if can_run:
+            action_events = [event for event in events if isinstance(event, self.action.event_types)] if self.action.event_types is not None else None
+
+            # event driven actions only run when there is something for them
+            if action_events is not None and len(action_events) == 0:
+                self.status_control.on_aciton_start()
+                return
+
             with self.on_try_action():
                 utils.forward_partial_args(self.action.update)(
                     app_settings=app_settings,
                     resolve_app=resolve_app,
                     timeline_context=timeline_context,
                     timeline_diff=timeline_diff,
+                    events=action_events,
                     input_data=self.input_data,
                 )
 
+            if self.rpc_stats.get_count() > 0:
+                log.debug(f"[{self.action}] Scripting calls: {self.rpc_stats.format()}")
+
     def start(
         self,
         app_settings: AppSettings,
@@ -174,7 +227,7 @@ class ActionControl:
             if not self.run_in_background:
                 log.error(f"[{self.action}] Resolve App is not in ready status (expected={self.action.required_status.name})")
             else:
-                log.warning(f"[{self.action}] Resolve App is not in ready status (expected={self.action.required_status.name}). Will retry after 10s")
+                log.warning(f"[{self.action}] Resolve App is not in ready status (expected={self.action.required_status.name}). Will retry when it is ready")
 
             return
 
@@ -195,21 +248,44 @@ class ActionControl:
         log.info(f"[{self.action}] Start action")
         log.flush()
 
+        self.cancellation_token = CancellationToken()
+        self.progress = None
+
+        # reads fresh values, and releases the handles it visited once done
+        GetterCache.new_generation()
+
         with self.on_try_action():
             utils.forward_partial_args(self.action.start)(
                 app_settings=app_settings,
                 resolve_app=resolve_app,
                 timeline_context=timeline_context,
                 input_data=validated_input_data,
+                cancellation_token=self.cancellation_token,
+                progress_reporter=ProgressReporter(f"[{self.action}]", self.set_progress),
             )
 
+        GetterCache.new_generation()
+        log.info(f"[{self.action}] Scripting calls: {self.rpc_stats.format()}")
+
         if not self.run_in_background:
             self.status_control.stop()
 
+    def set_progress(self, progress: Progress):
+        self.progress = progress
+
+    # only sets the token, so it is safe to call from another thread while start() runs
+    def cancel(self):
+        self.cancellation_token.cancel()
+
     def stop(self):
+        self.cancel()
+
         if self.status_control.stop() == StatusControlResult.Changed:
             log.info(f"[{self.action}] Stop action")
 
+            if hasattr(self.action, "on_stop"):
+                self.action.on_stop()
+
     @contextmanager
     def on_try_action(self):
         if self.error_timer.expired():
@@ -219,7 +295,14 @@ class ActionControl:
 
         try:
             self.status_control.on_aciton_start()
-            yield
+
+            with RpcMonitor.measure() as rpc_stats:
+                self.rpc_stats = rpc_stats
+                yield
+        except ActionCancelled:
+            log.info(f"[{self.action}] Action cancelled")
+
+            self.status_control.on_aciton_stop()
         except Exception as e:
             log.exception(e)
             log.error(f"[{self.action}] Error during action.")
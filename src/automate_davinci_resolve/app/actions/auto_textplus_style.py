@@ -1,19 +1,35 @@
-from typing import Optional
+import itertools
+from typing import NamedTuple, Optional
 
 from pydantic import BaseModel, Field
 
 from .action_base import ActionBase
+from .plan import Plan, apply_style_calls, find_textplus_calls, preserve_input_calls
+from ..events import ItemsAdded
 from ..inputs.tracks import MultipleVideoTracksInput
+from ..scheduler import RefreshRate
 from ..settings import AppSettings
 from ...davinci import textplus_utils
-from ...davinci.context import TimelineDiff
+from ...davinci.context import TimelineContext
 from ...davinci.enums import ResolveStatus
 from ...davinci.resolve_app import ResolveApp
+from ...davinci.style_library import StyleLibrary
+from ...davinci.textplus_style import StyleFingerprints, TextplusStyle
+from ...davinci.track import Track
 from ...utils import log
+from ...utils.lru_cache import LruCache
 
 
 class Inputs(BaseModel):
     ignored_tracks: MultipleVideoTracksInput = Field([], title="Ignored Video Tracks")
+    library_style: Optional[str] = Field(None, title="Library Style")
+    dry_run: bool = Field(False, title="Dry Run")
+
+
+class ReferenceStyle(NamedTuple):
+    item_id: Optional[str]  # None for a library style
+    leading_item_ids: list[str]  # items before the reference, without Text+
+    style: TextplusStyle
 
 
 class Action(ActionBase):
@@ -21,36 +37,50 @@ class Action(ActionBase):
         super().__init__(
             name="auto_textplus_style",
             display_name="Auto Text+ Style",
-            description="Detect newly added Text+ clips and apply style to them, using the style of 1st Text+ clip in the same track.",
+            description="Detect newly added Text+ clips and apply style to them, using a library style or the style of 1st Text+ clip in the same track.",
             required_status=ResolveStatus.TimelineOpen,
             input_model=Inputs,
+            refresh_rate=RefreshRate(min_interval=0.25, max_interval=2.0),
+            event_types=(ItemsAdded,),
         )
 
+        # by (timeline id, track index)
+        self.reference_styles = LruCache(capacity=64)
+
     def update(
         self,
         app_settings: AppSettings,
         resolve_app: ResolveApp,
-        timeline_diff: Optional[TimelineDiff],
+        events: list,
         input_data: Inputs,
+        timeline_context: Optional[TimelineContext] = None,
     ):
-        if timeline_diff is None:
-            return
-
         textplus_settings_path = f"{app_settings.temp_dir}/{self.name}.setting"
+        patched_settings_path = f"{app_settings.temp_dir}/{self.name}.patched.setting"
 
-        # no need to check items in newly added track (diff["added"]["video_tracks"]["root"])
-        # becuz high chance items are moved from same track
+        plan = Plan(self.name) if input_data.dry_run else None
+        library_reference = None
 
-        for old_track_index, track_diff in timeline_diff.diff.get("added", {}).get("video_tracks", {}).items():
-            if old_track_index == "root":
-                continue
+        if input_data.library_style:
+            # parsed once and kept by the library, so each update only looks it up
+            library_style = StyleLibrary.open(app_settings.style_library_dir).get(input_data.library_style)
 
-            new_track_index = timeline_diff.get_new_track_index(old_track_index)
-            newly_added_item_ids = track_diff.get("items", {}).get("root", set())
+            if library_style is None:
+                log.warning(f"[{self}] Style '{input_data.library_style}' is not in the library")
+                return
 
-            if new_track_index is None:
+            library_reference = ReferenceStyle(item_id=None, leading_item_ids=[], style=library_style)
+
+        # no need to check items in newly added track (no ItemsAdded for them)
+        # becuz high chance items are moved from same track
+
+        for event in events:
+            if not isinstance(event, ItemsAdded):
                 continue
 
+            new_track_index = event.track_index
+            newly_added_item_ids = event.item_ids
+
             if new_track_index in input_data.ignored_tracks:
                 continue
 
@@ -58,17 +88,130 @@ class Action(ActionBase):
                 continue
 
             track = resolve_app.get_current_timeline().get_track("video", new_track_index)
-            reference_textplus = None
-
-            for item in track.timeline_items:
-                if reference_textplus is None:
-                    reference_textplus = textplus_utils.find_textplus(item)
-                    if reference_textplus is not None:
-                        if not textplus_utils.save_settings(reference_textplus, textplus_settings_path):
-                            log.warning(f"[{self}] Failed to save reference Text+ settings to '{textplus_settings_path}'. Skip track.")
-                            break
-
-                elif item.GetUniqueId() in newly_added_item_ids:
-                    textplus = textplus_utils.find_textplus(item)
-                    if textplus is not None:
-                        textplus_utils.load_settings(textplus, textplus_settings_path, exclude_data_ids=["StyledText"])
+            reference = library_reference
+
+            if reference is None:
+                reference = self.get_cached_reference(timeline_context, new_track_index)
+
+                if reference is not None:
+                    reference = self.refresh_reference(track, reference, textplus_settings_path)
+                else:
+                    reference = self.find_reference(track, textplus_settings_path)
+
+                if reference is None:
+                    continue
+
+                if timeline_context is not None:
+                    self.reference_styles.put((timeline_context.id, new_track_index), reference)
+
+            # only new items are visited, through the item index shared with capture_context
+            for item_id in newly_added_item_ids:
+                item = track.get_item(item_id)
+
+                if item is None or item_id == reference.item_id or item_id in reference.leading_item_ids:
+                    continue
+
+                # clips moved from another track may already be in style
+                if reference.style.is_known_applied(item_id):
+                    if plan is not None:
+                        plan.add_change("new clips already in style")
+
+                    continue
+
+                textplus = textplus_utils.find_textplus(item)
+
+                if textplus is None:
+                    continue
+
+                if plan is not None:
+                    self.plan_item(plan, reference)
+                elif reference.style.apply(textplus, patched_settings_path=patched_settings_path):
+                    StyleFingerprints.put(item_id, reference.style.fingerprint)
+                else:
+                    log.warning(f"[{self}] Failed to load settings for clip '{item_id}' of track {new_track_index}")
+
+        if plan is not None and len(plan.changes) > 0:
+            log.info(f"[{self}] {plan.format()}")
+
+    # calls a new clip not known in style takes in a real run: it is restyled without reading its style first
+    def plan_item(self, plan: Plan, reference: ReferenceStyle):
+        plan.add_calls(find_textplus_calls)
+        plan.add_calls(preserve_input_calls, len(reference.style.exclude_data_ids))
+        plan.add_calls(apply_style_calls)
+        plan.add_change("new clips to restyle")
+
+    def on_stop(self):
+        self.reference_styles.clear()
+
+    # reference is the 1st Text+ clip in the track
+    def find_reference(self, track: Track, textplus_settings_path: str):
+        leading_item_ids = []
+
+        for item in track.timeline_items:
+            reference_textplus = textplus_utils.find_textplus(item)
+
+            if reference_textplus is None:
+                leading_item_ids.append(track.get_item_id(item))
+                continue
+
+            reference_style = TextplusStyle.save(reference_textplus, textplus_settings_path, exclude_data_ids=["StyledText"])
+
+            if reference_style is None:
+                log.warning(f"[{self}] Failed to save reference Text+ settings to '{textplus_settings_path}'. Skip track.")
+                return None
+
+            reference_item_id = track.get_item_id(item)
+            StyleFingerprints.put(reference_item_id, reference_style.fingerprint)
+
+            return ReferenceStyle(item_id=reference_item_id, leading_item_ids=leading_item_ids, style=reference_style)
+
+        return None
+
+    # one SaveSettings of the reference per update with new clips, instead of one per new clip
+    def refresh_reference(self, track: Track, reference: ReferenceStyle, textplus_settings_path: str):
+        item = track.get_item(reference.item_id)
+        textplus = textplus_utils.find_textplus(item) if item is not None else None
+
+        if textplus is None:
+            return None
+
+        style = TextplusStyle.save(textplus, textplus_settings_path, exclude_data_ids=reference.style.exclude_data_ids)
+
+        if style is None:
+            log.warning(f"[{self}] Failed to save reference Text+ settings to '{textplus_settings_path}'. Skip track.")
+            return None
+
+        StyleFingerprints.put(reference.item_id, style.fingerprint)
+
+        if style.fingerprint == reference.style.fingerprint:
+            return reference
+
+        log.info(f"[{self}] Reference Text+ of track {track.index} was edited, use its new style")
+
+        return reference._replace(style=style)
+
+    # the cached reference holds while the same items lead the track, and no other style is known for it.
+    # its style is read again by refresh_reference(), so edits made in Fusion are picked up.
+    def get_cached_reference(self, timeline_context: Optional[TimelineContext], track_index: int):
+        if timeline_context is None:
+            return None
+
+        key = (timeline_context.id, track_index)
+        reference = self.reference_styles.get(key)
+        track_context = timeline_context.video_tracks.get(track_index)
+
+        if reference is None or track_context is None:
+            return None
+
+        item_ids = iter(track_context.items.keys())
+        current_leading_item_ids = list(itertools.islice(item_ids, len(reference.leading_item_ids)))
+
+        if current_leading_item_ids != reference.leading_item_ids or next(item_ids, None) != reference.item_id:
+            self.reference_styles.pop(key)
+            return None
+
+        if StyleFingerprints.get(reference.item_id) not in (None, reference.style.fingerprint):
+            self.reference_styles.pop(key)
+            return None
+
+        return reference
@@ -0,0 +1,22 @@
+import threading
+
+
+class ActionCancelled(Exception):
+    pass
+
+
+# Set from any thread (e.g. the GUI) to stop a running action.
+# Actions check it between units of work, so a cancel takes effect at the next clip.
+class CancellationToken:
+    def __init__(self):
+        self.event = threading.Event()
+
+    def cancel(self):
+        self.event.set()
+
+    def is_cancelled(self):
+        return self.event.is_set()
+
+    def raise_if_cancelled(self):
+        if self.event.is_set():
+            raise ActionCancelled()
@@ -0,0 +1,49 @@
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from ...utils import log
+
+
+# Progress of a long-running action, saved to temp_dir after each step so a cancelled or crashed run can be resumed.
+# A checkpoint saved for another key (e.g. another timeline) is ignored.
+class Checkpoint:
+    def __init__(self, path: Path, key: str):
+        self.path = Path(path)
+        self.key = key
+        self.entries: dict[str, Any] = {}
+
+    @classmethod
+    def load(cls, path: Path, key: str):
+        checkpoint = cls(path, key)
+
+        try:
+            data = json.loads(checkpoint.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return checkpoint
+        except (OSError, ValueError) as e:
+            log.warning(f"Failed to read checkpoint '{path}': {e}")
+            return checkpoint
+
+        if isinstance(data, dict) and data.get("key") == key:
+            checkpoint.entries = data.get("entries", {})
+
+        return checkpoint
+
+    def get(self, name: str, default=None):
+        return self.entries.get(name, default)
+
+    def set(self, name: str, value: Any):
+        self.entries[name] = value
+        self.save()
+
+    def save(self):
+        # written aside then renamed, so a crash never leaves a truncated checkpoint
+        temp_path = self.path.with_name(f"{self.path.name}.tmp")
+        temp_path.write_text(json.dumps({"key": self.key, "entries": self.entries}), encoding="utf-8")
+        os.replace(temp_path, self.path)
+
+    def clear(self):
+        self.entries = {}
+        self.path.unlink(missing_ok=True)
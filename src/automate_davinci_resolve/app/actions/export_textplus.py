@@ -5,6 +5,8 @@ from pydantic import BaseModel, Field, root_validator
 import srt
 
 from .action_base import ActionBase
+from .cancellation import CancellationToken
+from .progress import ProgressReporter
 from ..enums import ExtraChoice
 
 from ..inputs.paths import SaveFilePathInput
@@ -125,12 +127,12 @@ class Action(ActionBase):
         self,
         resolve_app: ResolveApp,
         input_data: Inputs,
+        cancellation_token: Optional[CancellationToken] = None,
+        progress_reporter: Optional[ProgressReporter] = None,
     ):
         timeline = resolve_app.get_current_timeline()
 
-        log.info(f"[{self}] Collecting Text+ in current timeline...")
-        log.flush()
-        text_clip_infos = self.get_text_clip_infos(timeline, SubtitleModeMap(input_data))
+        text_clip_infos = self.get_text_clip_infos(timeline, SubtitleModeMap(input_data), cancellation_token, progress_reporter)
         log.info(f"[{self}] Collected {text_clip_infos.get_size()} Text+ in current timeline")
 
         subtitles = self.get_subtitles(text_clip_infos, timeline.get_timecode_settings())
@@ -141,11 +143,28 @@ class Action(ActionBase):
 
         log.info(f"[{self}] Successfully saved subtitles at {input_data.subtitle_file}!")
 
-    def get_text_clip_infos(self, timeline: Timeline, mode_map: SubtitleModeMap):
+    def get_text_clip_infos(
+        self,
+        timeline: Timeline,
+        mode_map: SubtitleModeMap,
+        cancellation_token: Optional[CancellationToken] = None,
+        progress_reporter: Optional[ProgressReporter] = None,
+    ):
         text_clip_infos = TextClipInfoContainer()
+        tracks = list(timeline.iter_tracks("video"))
+
+        if progress_reporter is None:
+            progress_reporter = ProgressReporter(f"[{self}]")
+
+        progress_reporter.start_phase("Collecting Text+", sum(len(track.timeline_items) for track in tracks))
 
-        for track_context in timeline.iter_tracks("video"):
+        for track_context in tracks:
             for item in track_context.timeline_items:
+                if cancellation_token is not None:
+                    cancellation_token.raise_if_cancelled()
+
+                progress_reporter.advance()
+
                 textplus = textplus_utils.find_textplus(item)
 
                 if textplus is not None:
@@ -157,6 +176,8 @@ class Action(ActionBase):
                     )
                     text_clip_infos.add(text_clip_info)
 
+        progress_reporter.finish_phase()
+
         return text_clip_infos
 
     def get_subtitles(self, infos: TextClipInfoContainer, timecode_settings: TimecodeSettings):
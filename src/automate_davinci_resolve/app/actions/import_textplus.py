@@ -6,6 +6,9 @@ from pydantic import BaseModel, Field
 import srt
 
 from .action_base import ActionBase
+from .cancellation import CancellationToken
+from .plan import Plan, find_textplus_calls
+from .progress import ProgressReporter
 from ..inputs.subtitles import SubtitleFileInput
 from ..settings import AppSettings
 from ...davinci import textplus_utils
@@ -17,6 +20,7 @@ from ...utils import log
 
 class Inputs(BaseModel):
     subtitle_file: SubtitleFileInput = Field(title="Subtitle File")
+    dry_run: bool = Field(False, title="Dry Run")
 
 
 class SubtitleInfo(NamedTuple):
@@ -27,6 +31,16 @@ class SubtitleInfo(NamedTuple):
 
 class Action(ActionBase):
     timecode_settings = TimecodeSettings("01:00:00:00", 60.0)
+    # calls made once per import, besides media pool and timeline lookups
+    planned_calls = {
+        "ImportProject": 1,
+        "LoadProject": 2,
+        "DeleteProject": 1,
+        "DuplicateTimeline": 1,
+        "AppendToTimeline": 1,
+        "Export": 1,
+        "ImportTimelineFromFile": 1,
+    }
 
     def __init__(self):
         super().__init__(
@@ -42,8 +56,14 @@ class Action(ActionBase):
         app_settings: AppSettings,
         resolve_app: ResolveApp,
         input_data: Inputs,
+        cancellation_token: Optional[CancellationToken] = None,
+        progress_reporter: Optional[ProgressReporter] = None,
     ):
         with log.prefix(f"[{self}]"):
+            if input_data.dry_run:
+                log.info(self.plan(input_data).format())
+                return
+
             datetime_formatted = datetime.now().strftime("%Y%m%d%H%M%S")
             subtitle_project_path = f"{app_settings.data_dir}/auto_subtitle.drp"
             temp_timeline_path = f"{app_settings.temp_dir}/auto_subtitles_{datetime_formatted}.drt"
@@ -56,7 +76,7 @@ class Action(ActionBase):
                     return
 
                 subtitle_infos = self.prepare_subtitle_infos(input_data.subtitle_file.parsed)
-                timeline = self.create_subtitle_timeline(resolve_app, subtitle_infos)
+                timeline = self.create_subtitle_timeline(resolve_app, subtitle_infos, cancellation_token, progress_reporter)
 
                 if timeline is None:
                     return
@@ -77,6 +97,19 @@ class Action(ActionBase):
 
             os.remove(temp_timeline_path)
 
+    # no temp project is imported, the plan only depends on the subtitles
+    def plan(self, input_data: Inputs):
+        subtitles = input_data.subtitle_file.parsed
+        subtitle_infos = self.prepare_subtitle_infos(subtitles)
+
+        plan = Plan(self.name)
+        plan.add_change("clips to insert", len(subtitle_infos))
+        plan.add_change("overlapping subtitles to skip", len(subtitles) - len(subtitle_infos))
+        plan.add_calls(self.planned_calls)
+        plan.add_calls({**find_textplus_calls, "SetInput": 1}, len(subtitle_infos))
+
+        return plan
+
     def prepare_subtitle_infos(self, subtitles: list[srt.Subtitle]):
         subtitle_infos: list[SubtitleInfo] = []
         skipped_subtitles = []
@@ -109,14 +142,20 @@ class Action(ActionBase):
 
         return subtitle_infos
 
-    def create_subtitle_timeline(self, resolve_app: ResolveApp, subtitle_infos: list[SubtitleInfo]):
+    # cancelling leaves the timeline in the temp project, which is deleted anyway
+    def create_subtitle_timeline(
+        self,
+        resolve_app: ResolveApp,
+        subtitle_infos: list[SubtitleInfo],
+        cancellation_token: Optional[CancellationToken] = None,
+        progress_reporter: Optional[ProgressReporter] = None,
+    ):
         frame_rate_name = str(self.timecode_settings.frame_rate).rstrip("0").rstrip(".")
 
         media_pool = resolve_app.get_media_pool()
         media_pool_textplus = media_pool.find_item(lambda item: item.GetClipProperty("Clip Name") == f"Text+{frame_rate_name}fps")
 
         log.info("Creating subtitle timeline...")
-        log.flush()
 
         timeline_to_copy = resolve_app.find_timeline(f"Timeline{frame_rate_name}fps")
         timeline_name = f"AutoSubtitle_{datetime.now().strftime('%Y%m%d%H%M%S')}"
@@ -127,7 +166,6 @@ class Action(ActionBase):
             return None
 
         log.info("Adding clips...")
-        log.flush()
 
         timeline_items = resolve_app.media_pool.AppendToTimeline(
             [
@@ -147,10 +185,20 @@ class Action(ActionBase):
         if expected_clip_count != clip_count:
             log.warning(f"Unexpected result when inserting clips. Expect {expected_clip_count} clips added, get {clip_count}")
 
-        log.info(f"Setting {clip_count} clips content...")
+        if progress_reporter is None:
+            progress_reporter = ProgressReporter()
+
+        progress_reporter.start_phase("Setting clips content", clip_count)
 
         for subtitle_info, timeline_item in zip(subtitle_infos, timeline_items):
+            if cancellation_token is not None:
+                cancellation_token.raise_if_cancelled()
+
+            progress_reporter.advance()
+
             textplus = textplus_utils.find_textplus(timeline_item)
             textplus.SetInput("StyledText", subtitle_info.text_content)
 
+        progress_reporter.finish_phase()
+
         return timeline
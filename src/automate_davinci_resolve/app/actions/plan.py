@@ -0,0 +1,53 @@
+from collections import Counter
+from typing import Optional
+
+from ...davinci.rpc_stats import LatencyEstimates, RpcMonitor
+
+# scripting calls of common steps, to add to plans
+find_textplus_calls = {"GetFusionCompCount": 1, "GetFusionCompByIndex": 1, "FindToolByID": 1}
+item_id_calls = {"GetUniqueId": 1}
+check_style_calls = {"GetUniqueId": 1, "SaveSettings": 1}
+apply_style_calls = {"LoadSettings": 1}
+preserve_input_calls = {"GetInput": 1}  # per excluded input, when applying without reading the target first
+
+
+# What an action would change, and the scripting calls it would make, computed without writing anything to Resolve.
+class Plan:
+    def __init__(self, name: str):
+        self.name = name
+        self.changes = Counter()  # e.g. "clips to restyle" -> count
+        self.calls = Counter()  # by method
+        self.parallelism = 1  # calls spread over that many connections
+
+    def add_change(self, kind: str, count: int = 1):
+        self.changes[kind] += count
+
+    def add_calls(self, calls: dict[str, int], times: int = 1):
+        for method, count in calls.items():
+            self.calls[method] += count * times
+
+    def get_call_count(self) -> int:
+        return sum(self.calls.values())
+
+    def estimate_seconds(self, latency_estimates: Optional[LatencyEstimates] = None) -> float:
+        if latency_estimates is None:
+            latency_estimates = RpcMonitor.latency_estimates
+
+        return latency_estimates.estimate(self.calls) / self.parallelism
+
+    def format(self, latency_estimates: Optional[LatencyEstimates] = None):
+        changes = ", ".join(f"{count} {kind}" for kind, count in self.changes.items()) or "nothing to change"
+        return f"Plan: {changes}. About {self.get_call_count()} scripting calls, {format_duration(self.estimate_seconds(latency_estimates))}"
+
+
+def format_duration(seconds: float):
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+
+    minutes, seconds = divmod(round(seconds), 60)
+
+    if minutes < 60:
+        return f"{minutes}m {seconds}s"
+
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes}m"
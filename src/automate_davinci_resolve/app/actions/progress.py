@@ -0,0 +1,92 @@
+import threading
+import time
+from typing import Callable, NamedTuple, Optional
+
+from ...utils import log
+
+
+class Progress(NamedTuple):
+    phase: str
+    done: int
+    total: int
+    elapsed: float
+
+    @property
+    def fraction(self) -> float:
+        return min(self.done / self.total, 1.0) if self.total > 0 else 1.0
+
+    # units per second
+    @property
+    def rate(self) -> Optional[float]:
+        return self.done / self.elapsed if self.done > 0 and self.elapsed > 0 else None
+
+    # seconds left, at the average rate of the phase so far
+    @property
+    def eta(self) -> Optional[float]:
+        rate = self.rate
+        return max(self.total - self.done, 0) / rate if rate is not None else None
+
+    def format(self):
+        text = f"{self.phase} {self.done}/{self.total} ({self.fraction * 100:.0f}%)"
+
+        if self.rate is not None:
+            text += f", {self.rate:.1f}/s, ETA {self.eta:.0f}s"
+
+        return text
+
+
+# Actions report units of work (e.g. clips) into it, from any thread.
+# Reporting once per unit is fine: progress is only published (logged and shown by the GUI) every interval seconds,
+# so a report costs a lock and a clock read.
+class ProgressReporter:
+    interval = 1.0
+
+    def __init__(self, name: str = "", on_progress: Optional[Callable[[Progress], None]] = None, clock: Callable[[], float] = time.monotonic):
+        self.name = name
+        self.on_progress = on_progress
+        self.clock = clock
+        self.lock = threading.Lock()
+
+        self.phase = ""
+        self.done = 0
+        self.total = 0
+        self.start_time = clock()
+        self.next_publish_time = self.start_time
+
+    @property
+    def progress(self) -> Progress:
+        return Progress(self.phase, self.done, self.total, self.clock() - self.start_time)
+
+    def start_phase(self, phase: str, total: int):
+        with self.lock:
+            self.phase = phase
+            self.done = 0
+            self.total = total
+            self.start_time = self.clock()
+            self.publish(self.start_time)
+
+    def advance(self, count: int = 1):
+        with self.lock:
+            self.done += count
+            now = self.clock()
+
+            if now >= self.next_publish_time:
+                self.publish(now)
+
+    # publishes the final count of the phase, which rate limiting may have skipped
+    def finish_phase(self):
+        with self.lock:
+            self.publish(self.clock())
+
+    def publish(self, now: float):
+        self.next_publish_time = now + self.interval
+        progress = Progress(self.phase, self.done, self.total, now - self.start_time)
+
+        # actions logging under their own prefix (see log.prefix) already name the progress
+        if self.name and self.name not in log.Log.prefixes:
+            log.info(f"{self.name} {progress.format()}")
+        else:
+            log.info(progress.format())
+
+        if self.on_progress is not None:
+            self.on_progress(progress)
@@ -1,24 +1,51 @@
-from pydantic import BaseModel, Field
+from collections import Counter
+from typing import NamedTuple, Optional
+
+from pydantic import BaseModel, Field, root_validator
 
 from .action_base import ActionBase
+from .cancellation import CancellationToken
+from .checkpoint import Checkpoint
+from .plan import Plan, apply_style_calls, check_style_calls, find_textplus_calls, item_id_calls, preserve_input_calls
+from .progress import ProgressReporter
 from ..inputs.tracks import MultipleVideoTracksInput
 from ..settings import AppSettings
 from ...davinci import textplus_utils
 from ...davinci.enums import ResolveStatus
 from ...davinci.resolve_app import ResolveApp
+from ...davinci.style_library import StyleLibrary
+from ...davinci.textplus_style import ApplyResult, StyleFingerprints, TextplusStyle
+from ...davinci.timeline import Timeline
+from ...davinci.worker_pool import ResolveWorkerPool
 from ...utils import log
 
 
 class Inputs(BaseModel):
     tracks: MultipleVideoTracksInput = Field([], title="Video Tracks")
+    library_style: Optional[str] = Field(None, title="Library Style")
+    save_to_library: Optional[str] = Field(None, title="Save To Library")
+    resume: bool = Field(False, title="Resume")
+    revalidate: bool = Field(False, title="Revalidate")
+    dry_run: bool = Field(False, title="Dry Run")
+
+    @root_validator
+    def check_library(cls, values):
+        # a library style is applied as is, there is no track reference to save
+        if values.get("library_style") and values.get("save_to_library"):
+            raise ValueError("Save To Library can not be used with a Library Style")
+
+        return values
 
 
 class Action(ActionBase):
+    # clips per job, small enough to balance workers and save checkpoints often
+    chunk_size = 100
+
     def __init__(self):
         super().__init__(
             name="sync_textplus_style",
             display_name="Sync Text+ Style",
-            description="Synchronize Text+ style of selected track(s), using the style of 1st Text+ clip in the same track.",
+            description="Synchronize Text+ style of selected track(s), using a library style or the style of 1st Text+ clip in the same track.",
             required_status=ResolveStatus.TimelineOpen,
             input_model=Inputs,
         )
@@ -28,44 +55,241 @@ class Action(ActionBase):
         app_settings: AppSettings,
         resolve_app: ResolveApp,
         input_data: Inputs,
+        cancellation_token: Optional[CancellationToken] = None,
+        progress_reporter: Optional[ProgressReporter] = None,
     ):
         if len(input_data.tracks) == 0:
             log.warning(f"[{self}] No tracks are selected")
             return
 
-        textplus_settings_path = f"{app_settings.temp_dir}/{self.name}.setting"
+        library = StyleLibrary.open(app_settings.style_library_dir)
+        library_style = None
+
+        if input_data.library_style:
+            library_style = library.get(input_data.library_style)
+
+            if library_style is None:
+                log.warning(f"[{self}] Style '{input_data.library_style}' is not in the library")
+                return
+
+        if input_data.dry_run:
+            log.info(f"[{self}] {self.plan(app_settings, resolve_app, input_data).format()}")
+            return
+
+        if cancellation_token is None:
+            cancellation_token = CancellationToken()
+
+        if progress_reporter is None:
+            progress_reporter = ProgressReporter(f"[{self}]")
+
         current_timeline = resolve_app.get_current_timeline()
+        checkpoint_path = app_settings.temp_dir / f"{self.name}.checkpoint.json"
+        checkpoint = Checkpoint.load(checkpoint_path, resolve_app.timeline_id) if input_data.resume else Checkpoint(checkpoint_path, resolve_app.timeline_id)
+        jobs = []
+        track_results = {}
+        # jobs of each track not yet done, in order: the checkpoint of a track only moves past contiguous done jobs
+        track_jobs = {}
+        done_jobs = set()
+        saved_to_library = False
+
+        progress_reporter.start_phase("Finding reference Text+", len(input_data.tracks))
 
         for track in current_timeline.iter_tracks("video"):
             if track.index not in input_data.tracks:
                 continue
 
-            log.info(f"[{self}] Finding Text+ in track {track.index}...")
-            log.flush()
+            if library_style is not None:
+                # no reference clip, the library style is applied from the 1st clip
+                position, reference_style = -1, library_style
+                progress_reporter.advance()
+            else:
+                reference = self.find_reference(track)
+                progress_reporter.advance()
 
-            textplus_list = []
-
-            for item in track.timeline_items:
-                textplus = textplus_utils.find_textplus(item)
-                if textplus is not None:
-                    textplus_list.append(textplus)
+                if reference is None:
+                    log.info(f"[{self}] Found no Text+ in track {track.index}")
+                    continue
 
-            log.info(f"[{self}] Found {len(textplus_list)} Text+. Start sync...")
-            log.flush()
+                position, reference_item_id, reference_textplus = reference
+                # each track has its own reference settings file, as jobs of all tracks run together
+                reference_settings_path = f"{app_settings.temp_dir}/{self.name}.{track.index}.setting"
+                reference_style = TextplusStyle.save(reference_textplus, reference_settings_path, exclude_data_ids=["StyledText"])
 
-            if len(textplus_list) > 0:
-                if not textplus_utils.save_settings(textplus_list[0], textplus_settings_path):
-                    log.warning(f"[{self}] Failed to save reference Text+ settings to '{textplus_settings_path}'. Skip track.")
+                if reference_style is None:
+                    log.warning(f"[{self}] Failed to save reference Text+ settings to '{reference_settings_path}'. Skip track.")
                     continue
 
-            for i, textplus in enumerate(textplus_list[1:]):
-                if not textplus_utils.load_settings(textplus, textplus_settings_path, exclude_data_ids=["StyledText"]):
-                    log.warning(f"[{self}] Failed to load settings for {i}-th Text+ clip")
+                StyleFingerprints.put(reference_item_id, reference_style.fingerprint)
+
+                if input_data.save_to_library and not saved_to_library:
+                    library.add(input_data.save_to_library, reference_style)
+                    saved_to_library = True
+                    log.info(f"[{self}] Saved style of track {track.index} as '{input_data.save_to_library}' in the library")
+
+            track_results[track.index] = Counter()
+            start_position = self.get_resume_position(track, checkpoint, reference_style, position + 1)
 
-                if i > 0 and i % 50 == 0:
-                    log.info(f"[{self}] Track {track.index} sync progress {i}/{len(textplus_list) - 1}...")
-                    log.flush()
+            if start_position > position + 1:
+                log.info(f"[{self}] Resume track {track.index} from clip {start_position}")
 
-            log.info(f"[{self}] Successfully synchronize Text+ style for track {track.index}!")
+            track_jobs[track.index] = [
+                SyncJob(track.index, chunk_start, min(chunk_start + self.chunk_size, len(track.timeline_items)), reference_style, input_data.revalidate)
+                for chunk_start in range(start_position, len(track.timeline_items), self.chunk_size)
+            ]
+            jobs.extend(track_jobs[track.index])
+
+        clip_count = sum(job.stop - job.start for job in jobs)
+
+        log.info(f"[{self}] Start sync of {clip_count} clips with {app_settings.worker_count} worker(s)...")
+        progress_reporter.start_phase("Syncing Text+ style", clip_count)
+
+        worker_pool = ResolveWorkerPool(resolve_app, app_settings.worker_count)
+
+        for job, results in worker_pool.run(
+            lambda timeline, worker_index, job: self.sync_clips(app_settings, timeline, worker_index, job, cancellation_token, progress_reporter), jobs
+        ):
+            track_results[job.track_index].update(results)
+            done_jobs.add((job.track_index, job.start))
+
+            pending_jobs = track_jobs[job.track_index]
+            last_done_job = None
+
+            while len(pending_jobs) > 0 and (job.track_index, pending_jobs[0].start) in done_jobs:
+                last_done_job = pending_jobs.pop(0)
+
+            if last_done_job is not None:
+                track = current_timeline.get_track("video", job.track_index)
+                checkpoint.set(
+                    str(job.track_index),
+                    {"item_id": track.get_item_id(track.timeline_items[last_done_job.stop - 1]), "fingerprint": last_done_job.style.fingerprint},
+                )
+
+        progress_reporter.finish_phase()
+
+        for track_index, results in track_results.items():
+            log.info(
+                f"[{self}] Successfully synchronize Text+ style for track {track_index}! "
+                f"{results[ApplyResult.Applied]} restyled, {results[ApplyResult.Unchanged]} already in style"
+            )
+
+        checkpoint.clear()
 
         log.info(f"[{self}] Successfully synchronize Text+ style for tracks {input_data.tracks}!")
+
+    # only reads the selected tracks. Styles are not saved, known fingerprints tell which clips revalidation would restyle
+    def plan(self, app_settings: AppSettings, resolve_app: ResolveApp, input_data: Inputs):
+        plan = Plan(self.name)
+        plan.parallelism = app_settings.worker_count
+        library_style = StyleLibrary.open(app_settings.style_library_dir).get(input_data.library_style) if input_data.library_style else None
+
+        for track in resolve_app.get_current_timeline().iter_tracks("video"):
+            if track.index not in input_data.tracks:
+                continue
+
+            plan.add_calls({"GetItemListInTrack": 1})
+
+            if library_style is not None:
+                position, reference_fingerprint = -1, library_style.fingerprint
+            else:
+                reference = self.find_reference(track)
+
+                if reference is None:
+                    continue
+
+                position, reference_item_id, _ = reference
+                reference_fingerprint = StyleFingerprints.get(reference_item_id)
+                plan.add_calls(find_textplus_calls, position + 1)
+                plan.add_calls(check_style_calls)
+
+            for item in track.timeline_items[position + 1 :]:
+                plan.add_calls(find_textplus_calls)
+
+                if textplus_utils.find_textplus(item) is None:
+                    continue
+
+                fingerprint = StyleFingerprints.get(track.get_item_id(item))
+
+                if not input_data.revalidate or (fingerprint is not None and reference_fingerprint is not None and fingerprint != reference_fingerprint):
+                    plan.add_change("clips to restyle")
+                    plan.add_calls({**item_id_calls, **preserve_input_calls, **apply_style_calls})
+                elif fingerprint is None or reference_fingerprint is None:
+                    plan.add_change("clips of unknown style")
+                    plan.add_calls({**check_style_calls, **apply_style_calls})
+                else:
+                    plan.add_change("clips already in style")
+                    plan.add_calls(check_style_calls)
+
+        return plan
+
+    # position after the last clip saved in the checkpoint, if the reference style has not changed since
+    def get_resume_position(self, track, checkpoint: Checkpoint, reference_style: TextplusStyle, start_position: int):
+        entry = checkpoint.get(str(track.index))
+
+        if entry is None or entry["fingerprint"] != reference_style.fingerprint:
+            return start_position
+
+        for position, item in enumerate(track.timeline_items):
+            if track.get_item_id(item) == entry["item_id"]:
+                return max(position + 1, start_position)
+
+        return start_position
+
+    # first Text+ clip of the track, with its position
+    def find_reference(self, track):
+        for position, item in enumerate(track.timeline_items):
+            textplus = textplus_utils.find_textplus(item)
+
+            if textplus is not None:
+                return position, track.get_item_id(item), textplus
+
+        return None
+
+    # runs in a worker, on its own connection: handles, style copy and settings files are not shared with other workers
+    def sync_clips(
+        self,
+        app_settings: AppSettings,
+        timeline: Timeline,
+        worker_index: int,
+        job: "SyncJob",
+        cancellation_token: CancellationToken,
+        progress_reporter: ProgressReporter,
+    ):
+        track = timeline.get_track("video", job.track_index)
+        style = job.style.copy() if worker_index > 0 else job.style
+        target_settings_path = f"{app_settings.temp_dir}/{self.name}.target.{worker_index}.setting"
+        patched_settings_path = str(textplus_utils.get_patched_settings_path(target_settings_path))
+        results = Counter()
+
+        for position in range(job.start, min(job.stop, len(track.timeline_items))):
+            cancellation_token.raise_if_cancelled()
+            progress_reporter.advance()
+
+            item = track.timeline_items[position]
+            item_id = track.get_item_id(item)
+            textplus = textplus_utils.find_textplus(item)
+
+            if textplus is None:
+                continue
+
+            # every clip is checked, known fingerprints are only hints: edits made in Fusion are not seen in them.
+            # reading a clip first pays off only when it is likely in style, so it is left to revalidation,
+            # which still loads clips known to differ directly
+            if job.revalidate and StyleFingerprints.get(item_id) in (None, style.fingerprint):
+                result = style.apply_if_changed(textplus, item_id, target_settings_path)
+            else:
+                result = style.apply_to_item(textplus, item_id, patched_settings_path)
+
+            results[result] += 1
+
+            if result == ApplyResult.Failed:
+                log.warning(f"[{self}] Failed to load settings for clip {position} of track {job.track_index}")
+
+        return results
+
+
+class SyncJob(NamedTuple):
+    track_index: int
+    start: int
+    stop: int
+    style: TextplusStyle
+    revalidate: bool = False  # read each clip first, only clips whose style differs are loaded
@@ -9,13 +9,16 @@ from .actions import (
     sync_textplus_style,
 )
 from .actions.action_control import ActionControl
+from .events import EventBus
+from .scheduler import PollScheduler
 from .settings import AppSettings
 from ..davinci.context import TimelineDiff, ResolveContext
 from ..davinci.enums import ResolveStatus
+from ..davinci.getter_cache import GetterCache
 from ..davinci.resolve_app import ResolveApp
+from ..davinci.rpc_stats import RpcMonitor, RpcStats
 from ..utils import log
-
-from ..utils.timer import Timer
+from ..utils.lru_cache import LruCache
 
 
 class App:
@@ -27,6 +30,8 @@ class App:
         print_clip_info.Action,
     ]
 
+    slow_tick_seconds = 0.5
+
     def __init__(self, resolve_app: ResolveApp):
         self.settings = AppSettings()
         self.resolve_app = resolve_app
@@ -38,9 +43,16 @@ class App:
             )
         )
 
-        self.actions = [ActionControl(action_type()) for action_type in self.action_types]
+        # last context of recently opened timelines, keyed by timeline id
+        self.timeline_contexts = LruCache(capacity=self.settings.timeline_cache_size)
+
+        self.event_bus = EventBus()
+        self.actions = [ActionControl(action_type(), self.event_bus) for action_type in self.action_types]
 
-        self.load_resolve_cooldown = Timer()
+        self.scheduler = PollScheduler()
+        self.update_interval = self.scheduler.interval
+
+        self.tick_rpc_stats = RpcStats()
 
     def apply_inputs(self, action_name, input_data: dict):
         action = self.get_action(action_name)
@@ -49,20 +61,51 @@ class App:
             action.apply_inputs(self.context.resolve_context.resolve_status, input_data)
 
     def update(self):
-        resolve_context = self.load_resolve_context(force_load=False)
+        with RpcMonitor.measure() as tick_rpc_stats:
+            old_resolve_context = self.context.resolve_context
+            resolve_context = self.load_resolve_context()
+            self.set_resolve_context(resolve_context)
+
+            for action in self.actions:
+                action.update(
+                    app_settings=self.settings,
+                    resolve_status=self.context.resolve_context.resolve_status,
+                    resolve_app=self.resolve_app,
+                    timeline_context=self.context.resolve_context.timeline_context,
+                    timeline_diff=self.context.resolve_context.timeline_diff,
+                )
+
+        self.tick_rpc_stats = tick_rpc_stats
+        self.schedule_next_update(old_resolve_context, resolve_context)
+
+        if tick_rpc_stats.get_total_time() >= self.slow_tick_seconds:
+            cache_stats = GetterCache.get_stats()
+            log.debug(f"Slow update. Scripting calls: {tick_rpc_stats.format()}. Getter cache: {cache_stats.hits} hits, {cache_stats.misses} misses")
+
+        return self.context
+
+    def set_resolve_context(self, resolve_context: ResolveContext):
+        old_resolve_context = self.context.resolve_context
         self.context = AppContext(resolve_context)
         InputContext.set(InputContext(self.context.resolve_context.timeline_context))
 
-        for action in self.actions:
-            action.update(
-                app_settings=self.settings,
-                resolve_status=self.context.resolve_context.resolve_status,
-                resolve_app=self.resolve_app,
-                timeline_context=self.context.resolve_context.timeline_context,
-                timeline_diff=self.context.resolve_context.timeline_diff,
-            )
+        self.event_bus.publish_resolve_context(old_resolve_context, resolve_context)
 
-        return self.context
+    def schedule_next_update(self, old_resolve_context: ResolveContext, new_resolve_context: ResolveContext):
+        available = new_resolve_context.resolve_status != ResolveStatus.Unavailable
+        changed = (
+            old_resolve_context.resolve_status != new_resolve_context.resolve_status
+            or new_resolve_context.is_timeline_switched(old_resolve_context)
+            or (new_resolve_context.timeline_diff is not None and not new_resolve_context.timeline_diff.is_empty())
+        )
+        refresh_rates = [action.refresh_rate for action in self.actions if action.refresh_rate is not None]
+
+        self.update_interval = self.scheduler.schedule(available=available, changed=changed, refresh_rates=refresh_rates)
+
+        if not available:
+            log.warning(
+                f"Failed to load Resolve App. Please check if Davinci Resolve is started and settings are correct. Will retry after {self.update_interval:.0f}s"
+            )
 
     def start_action(self, name, input_data: dict):
         action = self.get_action(name)
@@ -70,9 +113,10 @@ class App:
         if action is None:
             return
 
-        resolve_context = self.load_resolve_context(force_load=True)
-        self.context = AppContext(resolve_context)
-        InputContext.set(InputContext(self.context.resolve_context.timeline_context))
+        self.scheduler.reset()
+        self.update_interval = self.scheduler.interval
+
+        self.set_resolve_context(self.load_resolve_context())
 
         action.start(
             app_settings=self.settings,
@@ -91,10 +135,7 @@ class App:
     def get_action(self, name):
         return next((action for action in self.actions if action.name == name), None)
 
-    def load_resolve_context(self, force_load: bool):
-        if not force_load and not self.load_resolve_cooldown.expired():
-            return ResolveContext(ResolveStatus.Unavailable, None, None)
-
+    def load_resolve_context(self):
         try:
             if self.context.resolve_context.resolve_status == ResolveStatus.Unavailable:
                 log.info("Loading Resolve App...")
@@ -105,19 +146,34 @@ class App:
             if status == ResolveStatus.Unavailable or status != self.context.resolve_context.resolve_status:
                 log.info(f"Resolve status: {self.context.resolve_context.resolve_status.name} => {status.name}")
 
-            if status == ResolveStatus.Unavailable and not force_load:
-                log.warning("Failed to load Resolve App. Please check if Davinci Resolve is started and settings are correct. Will retry after 10s")
-                self.load_resolve_cooldown.reset(10)
+            changes = self.resolve_app.changes
 
-            if status != ResolveStatus.Unavailable:
-                self.load_resolve_cooldown.reset(0)
+            if changes.project_changed and self.resolve_app.project is not None:
+                log.info(f"Current project: {self.resolve_app.project_name}")
 
             timeline_context = None
             timeline_diff = None
 
             if status == ResolveStatus.TimelineOpen:
-                timeline_context = self.resolve_app.get_current_timeline().capture_context()
-                timeline_diff = TimelineDiff.create(self.context.resolve_context.timeline_context, timeline_context)
+                timeline = self.resolve_app.get_current_timeline()
+                # an imported copy of a project keeps the ids of its timelines, contexts of another project are never diffed
+                if changes.project_changed:
+                    self.timeline_contexts.clear()
+                    old_timeline_context = None
+                # a switched timeline is diffed against its own last context, if it is still cached
+                elif changes.timeline_changed:
+                    old_timeline_context = self.timeline_contexts.get(self.resolve_app.timeline_id)
+                else:
+                    old_timeline_context = self.context.resolve_context.timeline_context
+
+                if old_timeline_context is not None and old_timeline_context.fingerprint == timeline.capture_fingerprint():
+                    timeline_context = old_timeline_context
+                    timeline_diff = TimelineDiff()
+                else:
+                    timeline_context = timeline.capture_context(old_timeline_context)
+                    timeline_diff = TimelineDiff.create(old_timeline_context, timeline_context)
+
+                self.timeline_contexts.put(timeline_context.id, timeline_context)
 
             return ResolveContext(status, timeline_context, timeline_diff)
 
@@ -0,0 +1,134 @@
+from typing import Callable, NamedTuple, Optional, Type
+
+from ..davinci.context import Diff, ResolveContext, TimelineContext, TimelineDiff
+from ..davinci.enums import ResolveStatus
+from ..utils import log
+
+
+class ResolveStatusChanged(NamedTuple):
+    old: ResolveStatus
+    new: ResolveStatus
+
+
+# a different timeline (or no timeline) is opened, track indices of the old timeline are meaningless.
+# if the timeline was opened before, restored is True and the following events are relative to its last context
+class TimelineSwitched(NamedTuple):
+    old_timeline_id: Optional[str]
+    timeline_context: Optional[TimelineContext]
+    restored: bool = False
+
+
+# events may be handled in batches spanning several diffs. Track events of one diff apply together (tracks can swap),
+# the ones of successive diffs one after another, so they carry the generation of their diff
+class TrackMoved(NamedTuple):
+    old_index: int
+    new_index: int
+    generation: int = 0
+
+
+class TrackRemoved(NamedTuple):
+    old_index: int
+    generation: int = 0
+
+
+class TrackRenamed(NamedTuple):
+    track_index: int
+    name: Diff
+
+
+class ItemsAdded(NamedTuple):
+    old_track_index: int
+    track_index: int
+    item_ids: set[str]
+
+
+class ItemsRemoved(NamedTuple):
+    old_track_index: int
+    track_index: Optional[int]
+    item_ids: set[str]
+
+
+# items found on another track. They are also in the ItemsAdded and ItemsRemoved of their tracks
+class ItemsMoved(NamedTuple):
+    old_track_index: int
+    track_index: int
+    item_ids: set[str]
+
+
+# events of one diff, in the order they should be applied
+def create_timeline_events(timeline_diff: Optional[TimelineDiff], timeline_context: Optional[TimelineContext] = None, generation: int = 0):
+    if timeline_diff is None:
+        return [TimelineSwitched(None, timeline_context)]
+
+    events = []
+    events += [TrackMoved(old_index, new_index, generation) for old_index, new_index in sorted(timeline_diff.moved_tracks.items())]
+    events += [TrackRemoved(old_index, generation) for old_index in sorted(timeline_diff.removed_tracks)]
+    events += [TrackRenamed(timeline_diff.get_new_track_index(old_index), name) for old_index, name in sorted(timeline_diff.renamed_tracks.items())]
+    events += [
+        ItemsAdded(old_index, timeline_diff.get_new_track_index(old_index), item_ids)
+        for old_index, item_ids in sorted(timeline_diff.added_items.items())
+        if timeline_diff.get_new_track_index(old_index) is not None
+    ]
+    events += [
+        ItemsRemoved(old_index, timeline_diff.get_new_track_index(old_index), item_ids) for old_index, item_ids in sorted(timeline_diff.removed_items.items())
+    ]
+
+    moved_items: dict[tuple[int, int], set[str]] = {}
+
+    for item_id, track_diff in timeline_diff.moved_items.items():
+        moved_items.setdefault((track_diff.old, track_diff.new), set()).add(item_id)
+
+    events += [ItemsMoved(old_index, new_index, item_ids) for (old_index, new_index), item_ids in sorted(moved_items.items())]
+
+    return events
+
+
+class EventBus:
+    def __init__(self):
+        self.subscribers: dict[Type, list[Callable]] = {}
+        self.generation = 0  # of the last published diff
+
+    def subscribe(self, event_type: Type, handler: Callable):
+        self.subscribers.setdefault(event_type, []).append(handler)
+
+    def unsubscribe(self, event_type: Type, handler: Callable):
+        handlers = self.subscribers.get(event_type, [])
+
+        if handler in handlers:
+            handlers.remove(handler)
+
+    def has_subscribers(self, event_type: Type):
+        return len(self.subscribers.get(event_type, [])) > 0
+
+    def publish(self, event):
+        for handler in self.subscribers.get(type(event), []):
+            try:
+                handler(event)
+            except Exception as e:
+                log.exception(e)
+                log.error(f"Error when handling {type(event).__name__} event.")
+
+    def publish_resolve_context(self, old_resolve_context: ResolveContext, new_resolve_context: ResolveContext):
+        if len(self.subscribers) == 0:
+            return
+
+        if old_resolve_context.resolve_status != new_resolve_context.resolve_status:
+            self.publish(ResolveStatusChanged(old=old_resolve_context.resolve_status, new=new_resolve_context.resolve_status))
+
+        if new_resolve_context.is_timeline_switched(old_resolve_context):
+            self.publish(
+                TimelineSwitched(
+                    old_timeline_id=old_resolve_context.timeline_id,
+                    timeline_context=new_resolve_context.timeline_context,
+                    restored=new_resolve_context.timeline_diff is not None,
+                )
+            )
+
+        # empty diff on most updates, nothing to build
+        if new_resolve_context.timeline_diff is None or new_resolve_context.timeline_diff.is_empty():
+            return
+
+        self.generation += 1
+
+        for event in create_timeline_events(new_resolve_context.timeline_diff, generation=self.generation):
+            self.publish(event)
@@ -1,7 +1,9 @@
 from typing import Optional
 
 from ..context import InputContext
+from ..events import TimelineSwitched, TrackMoved, TrackRemoved, create_timeline_events
 from ...davinci.context import TimelineDiff
+from ...utils.lru_cache import LruCache
 
 
 class VideoTrackValidator:
@@ -47,23 +49,59 @@ class MultipleVideoTracksInput(list[int]):
         else:
             raise ValueError(reason)
 
-    # TODO keep data for different timeline
+    event_types = (TimelineSwitched, TrackMoved, TrackRemoved)
+    timeline_selections_size = 8
+
     def update(self, timeline_diff: Optional[TimelineDiff]):
-        if timeline_diff is None:
-            self.clear()
-            return
+        self.on_events(create_timeline_events(timeline_diff))
+
+    # events are applied in order, track events of the same diff at once
+    def on_events(self, events: list):
+        diff_events = []
+
+        for event in events:
+            if len(diff_events) > 0 and (isinstance(event, TimelineSwitched) or event.generation != diff_events[0].generation):
+                self.apply_track_events(diff_events)
+                diff_events = []
+
+            if isinstance(event, TimelineSwitched):
+                self.switch_timeline(event)
+            else:
+                diff_events.append(event)
+
+        if len(diff_events) > 0:
+            self.apply_track_events(diff_events)
+
+    def apply_track_events(self, events: list):
+        moved_tracks = {event.old_index: event.new_index for event in events if isinstance(event, TrackMoved)}
+        removed_tracks = {event.old_index for event in events if isinstance(event, TrackRemoved)}
 
         old_indices = self.copy()
         self.clear()
 
         for old_index in old_indices:
-            new_index = timeline_diff.get_new_track_index(old_index)
-
-            if new_index is not None:
-                self.append(new_index)
+            if old_index not in removed_tracks:
+                self.append(moved_tracks.get(old_index, old_index))
 
         self.sort()
 
+    # keep selection of the old timeline, and bring back the one of the new timeline
+    def switch_timeline(self, event: TimelineSwitched):
+        if not hasattr(self, "timeline_selections"):
+            self.timeline_selections = LruCache(capacity=self.timeline_selections_size)
+
+        if event.old_timeline_id is not None:
+            self.timeline_selections.put(event.old_timeline_id, self.copy())
+
+        timeline_id = event.timeline_context.id if event.timeline_context is not None else None
+        selection = self.timeline_selections.pop(timeline_id, [])
+
+        self.clear()
+
+        # without the last context of the new timeline, its old selection can not be mapped to current tracks
+        if event.restored:
+            self.extend(selection)
+
 
 # class SingleVideoTrackInput:
 
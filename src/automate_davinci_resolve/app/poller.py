@@ -0,0 +1,128 @@
+import queue
+import threading
+import time
+from functools import partial
+from typing import Optional
+
+from .app import App
+from .context import AppContext
+from ..utils import log
+
+
+# Runs App.update() and actions on a dedicated thread, so scripting round-trips never block the GUI.
+# GUI talks to it with the same interface as App, and consumes AppContext snapshots from poll_contexts().
+class AppPoller:
+    # interval overrides the adaptive interval chosen by App after each update
+    def __init__(self, app: App, interval: Optional[float] = None):
+        self.app = app
+        self.interval = interval
+
+        self.commands = queue.Queue()
+        self.contexts = queue.Queue()
+        self.pending_inputs_lock = threading.Lock()
+        self.pending_inputs: Optional[tuple[str, dict]] = None
+
+        self.stop_event = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def actions(self):
+        return self.app.actions
+
+    @property
+    def context(self):
+        return self.app.context
+
+    def get_action(self, name):
+        return self.app.get_action(name)
+
+    def apply_inputs(self, action_name, input_data: dict):
+        # only the latest inputs matter, so they replace each other instead of queueing up
+        with self.pending_inputs_lock:
+            self.pending_inputs = (action_name, input_data)
+
+    def start_action(self, name, input_data: dict):
+        self.commands.put(partial(self._start_action, name, input_data))
+
+    def stop_action(self, name):
+        # a running action holds the poller thread, so it is cancelled right away from the caller's thread
+        action = self.app.get_action(name)
+
+        if action is not None:
+            action.cancel()
+
+        self.commands.put(partial(self.app.stop_action, name))
+
+    def start(self):
+        if self.thread is not None:
+            return
+
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, name="ResolvePoller", daemon=True)
+        self.thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        if self.thread is None:
+            return
+
+        self.stop_event.set()
+        self.commands.put(None)  # wake up the thread
+        self.thread.join(timeout)
+        self.thread = None
+
+    def poll_contexts(self) -> list[AppContext]:
+        app_contexts = []
+
+        while True:
+            try:
+                app_contexts.append(self.contexts.get_nowait())
+            except queue.Empty:
+                return app_contexts
+
+    def run(self):
+        next_update_time = time.monotonic()
+
+        while not self.stop_event.is_set():
+            try:
+                command = self.commands.get(timeout=max(next_update_time - time.monotonic(), 0))
+            except queue.Empty:
+                command = None
+
+            if self.stop_event.is_set():
+                break
+
+            try:
+                if command is not None:
+                    command()
+                    # starting an action resets the adaptive interval, so the next update may be due sooner
+                    next_update_time = min(next_update_time, time.monotonic() + self.get_update_interval())
+
+                if time.monotonic() >= next_update_time:
+                    self.update()
+                    next_update_time = time.monotonic() + self.get_update_interval()
+            except Exception as e:
+                log.exception(e)
+                log.error("Error in Resolve poller.")
+
+    def get_update_interval(self):
+        return self.interval if self.interval is not None else self.app.update_interval
+
+    def update(self):
+        self._apply_pending_inputs()
+        self.contexts.put(self.app.update())
+
+    def _apply_pending_inputs(self):
+        with self.pending_inputs_lock:
+            pending_inputs = self.pending_inputs
+            self.pending_inputs = None
+
+        if pending_inputs is not None:
+            self.app.apply_inputs(*pending_inputs)
+
+    def _start_action(self, name, input_data: dict):
+        app_context = self.app.context
+        self.app.start_action(name, input_data)
+
+        # starting reloads context, GUI needs it to follow the chain of diffs
+        if self.app.context is not app_context:
+            self.contexts.put(self.app.context)
@@ -0,0 +1,45 @@
+from typing import NamedTuple, Optional
+
+
+class RefreshRate(NamedTuple):
+    min_interval: float
+    max_interval: float
+
+
+# Decides how long to wait before the next update.
+# Polls at min_interval right after a change, then backs off exponentially up to max_interval while nothing changes.
+class PollScheduler:
+    idle_refresh_rate = RefreshRate(min_interval=0.5, max_interval=5.0)
+    unavailable_refresh_rate = RefreshRate(min_interval=1.0, max_interval=30.0)
+    backoff_factor = 2.0
+
+    def __init__(self):
+        self.refresh_rate = self.idle_refresh_rate
+        self.interval = self.refresh_rate.min_interval
+
+    @classmethod
+    def combine(cls, refresh_rates: list[RefreshRate]):
+        # the most demanding action wins on both ends
+        if len(refresh_rates) == 0:
+            return cls.idle_refresh_rate
+
+        min_interval = min(refresh_rate.min_interval for refresh_rate in refresh_rates)
+        max_interval = min(refresh_rate.max_interval for refresh_rate in refresh_rates)
+
+        return RefreshRate(min_interval=min_interval, max_interval=max(max_interval, min_interval))
+
+    def reset(self, refresh_rate: Optional[RefreshRate] = None):
+        if refresh_rate is not None:
+            self.refresh_rate = refresh_rate
+
+        self.interval = self.refresh_rate.min_interval
+
+    def schedule(self, available: bool, changed: bool, refresh_rates: list[RefreshRate]):
+        refresh_rate = self.combine(refresh_rates) if available else self.unavailable_refresh_rate
+
+        if changed or refresh_rate != self.refresh_rate:
+            self.reset(refresh_rate)
+        else:
+            self.interval = min(self.interval * self.backoff_factor, refresh_rate.max_interval)
+
+        return self.interval
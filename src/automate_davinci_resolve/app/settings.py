@@ -6,7 +6,13 @@ from pydantic import BaseSettings
 class AppSettings(BaseSettings):
     data_dir: Path  # use DirectoryPath?
     temp_dir: Path
+    timeline_cache_size: int = 8  # timelines whose last context is kept for switching back
+    worker_count: int = 1  # scripting connections used by bulk actions, 1 runs them serially
 
     def __init__(self, *args, **kw):
         super().__init__(*args, **kw)
         self.temp_dir.mkdir(exist_ok=True)
+
+    @property
+    def style_library_dir(self):
+        return self.data_dir / "styles"
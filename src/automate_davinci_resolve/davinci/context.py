@@ -13,10 +13,24 @@ class TrackContext(NamedTuple):
     items: dict[str, TimelineItemContext]
 
 
+class TrackFingerprint(NamedTuple):
+    name: str
+    item_count: int
+    first_item_id: Optional[str]
+    last_item_id: Optional[str]
+
+
+class TimelineFingerprint(NamedTuple):
+    id: str
+    name: str
+    video_tracks: tuple[TrackFingerprint, ...]
+
+
 class TimelineContext(NamedTuple):
     id: str
     name: str
     video_tracks: dict[int, TrackContext]
+    fingerprint: Optional[TimelineFingerprint] = None
 
 
 class ResolveContext(NamedTuple):
@@ -24,6 +38,14 @@ class ResolveContext(NamedTuple):
     timeline_context: Optional[TimelineContext]
     timeline_diff: Optional["TimelineDiff"]
 
+    @property
+    def timeline_id(self):
+        return self.timeline_context.id if self.timeline_context is not None else None
+
+    # a timeline without diff was not diffed against the old one, e.g. the same timeline id in another project
+    def is_timeline_switched(self, old_resolve_context: "ResolveContext"):
+        return self.timeline_id != old_resolve_context.timeline_id or (self.timeline_context is not None and self.timeline_diff is None)
+
 
 class Diff(NamedTuple):
     old: Any
@@ -31,13 +53,36 @@ class Diff(NamedTuple):
 
 
 class TimelineDiff:
+    # track indices are the ones in old timeline context, except added_tracks
+    __slots__ = ("name", "moved_tracks", "added_tracks", "removed_tracks", "renamed_tracks", "added_items", "removed_items", "moved_items")
+
     def __init__(self):
-        self.diff = {}
+        self.name: Optional[Diff] = None
+        self.moved_tracks: dict[int, int] = {}
+        self.added_tracks: set[int] = set()
+        self.removed_tracks: set[int] = set()
+        self.renamed_tracks: dict[int, Diff] = {}
+        self.added_items: dict[int, set[str]] = {}
+        self.removed_items: dict[int, set[str]] = {}
+        # items found on another track, keyed by item id: old track index -> new track index.
+        # they are also in added_items (or an added track) and removed_items (or a removed track)
+        self.moved_items: dict[str, Diff] = {}
+
+    def is_empty(self):
+        return (
+            self.name is None
+            and len(self.moved_tracks) == 0
+            and len(self.added_tracks) == 0
+            and len(self.removed_tracks) == 0
+            and len(self.renamed_tracks) == 0
+            and len(self.added_items) == 0
+            and len(self.removed_items) == 0
+            and len(self.moved_items) == 0
+        )
 
     @classmethod
     def create(cls, old_timeline_context: Optional[TimelineContext], new_timeline_context: TimelineContext):
         diff = TimelineDiff()
-        diff_dict = diff.diff
 
         if old_timeline_context is None:
             return None
@@ -46,105 +91,182 @@ class TimelineDiff:
             return None
 
         if old_timeline_context.name != new_timeline_context.name:
-            diff_dict.setdefault("changed", {})
-            diff_dict["changed"]["name"] = Diff(old=old_timeline_context.name, new=new_timeline_context.name)
+            diff.name = Diff(old=old_timeline_context.name, new=new_timeline_context.name)
 
         old_to_new_tracks = cls.map_old_to_new_tracks(old_timeline_context, new_timeline_context)
 
         for old_index, new_index in old_to_new_tracks.items():
             if new_index is None:
-                diff_dict.setdefault("removed", {}).setdefault("video_tracks", {}).setdefault("root", [])
-                diff_dict["removed"]["video_tracks"]["root"].append(old_index)
+                diff.removed_tracks.add(old_index)
                 continue
 
             if old_index != new_index:
-                diff_dict.setdefault("changed", {}).setdefault("video_tracks", {}).setdefault(old_index, {})
-                diff_dict["changed"]["video_tracks"][old_index]["index"] = Diff(old=old_index, new=new_index)
+                diff.moved_tracks[old_index] = new_index
 
             old_track_context = old_timeline_context.video_tracks[old_index]
             new_track_context = new_timeline_context.video_tracks[new_index]
 
             if old_track_context.name != new_track_context.name:
-                diff_dict.setdefault("changed", {}).setdefault("video_tracks", {}).setdefault(old_index, {})
-                diff_dict["changed"]["video_tracks"][old_index]["name"] = Diff(old=old_track_context.name, new=new_track_context.name)
+                diff.renamed_tracks[old_index] = Diff(old=old_track_context.name, new=new_track_context.name)
+
+            if old_track_context.items is new_track_context.items:
+                continue
 
-            old_item_ids = set(old_track_context.items.keys())
-            new_item_ids = set(new_track_context.items.keys())
+            added_item_ids = new_track_context.items.keys() - old_track_context.items.keys()
+            removed_item_ids = old_track_context.items.keys() - new_track_context.items.keys()
 
-            for item_id in new_item_ids - old_item_ids:
-                diff_dict.setdefault("added", {}).setdefault("video_tracks", {}).setdefault(old_index, {}).setdefault("items", {}).setdefault("root", set())
-                diff_dict["added"]["video_tracks"][old_index]["items"]["root"].add(item_id)
+            if len(added_item_ids) > 0:
+                diff.added_items[old_index] = added_item_ids
 
-            for item_id in old_item_ids - new_item_ids:
-                diff_dict.setdefault("removed", {}).setdefault("video_tracks", {}).setdefault(old_index, {}).setdefault("items", {}).setdefault("root", set())
-                diff_dict["removed"]["video_tracks"][old_index]["items"]["root"].add(item_id)
+            if len(removed_item_ids) > 0:
+                diff.removed_items[old_index] = removed_item_ids
 
-        # should track indices be sorted list?
-        for new_index in sorted(set(new_timeline_context.video_tracks.keys()) - set(old_to_new_tracks.values())):
-            diff_dict.setdefault("added", {}).setdefault("video_tracks", {}).setdefault("root", [])
-            diff_dict["added"]["video_tracks"]["root"].append(new_index)
+        diff.added_tracks = new_timeline_context.video_tracks.keys() - set(old_to_new_tracks.values())
+        diff.find_moved_items(old_timeline_context, new_timeline_context, old_to_new_tracks)
 
         return diff
 
+    # only ids already diffed are looked up, moves need no scripting call
+    def find_moved_items(self, old_timeline_context: TimelineContext, new_timeline_context: TimelineContext, old_to_new_tracks: dict[int, Optional[int]]):
+        removed_item_tracks = {item_id: old_index for old_index, item_ids in self.removed_items.items() for item_id in item_ids}
+
+        for old_index in self.removed_tracks:
+            removed_item_tracks.update((item_id, old_index) for item_id in old_timeline_context.video_tracks[old_index].items)
+
+        if len(removed_item_tracks) == 0:
+            return
+
+        added_item_tracks = {item_id: old_to_new_tracks[old_index] for old_index, item_ids in self.added_items.items() for item_id in item_ids}
+
+        for new_index in self.added_tracks:
+            added_item_tracks.update((item_id, new_index) for item_id in new_timeline_context.video_tracks[new_index].items)
+
+        for item_id, new_index in added_item_tracks.items():
+            old_index = removed_item_tracks.get(item_id)
+
+            if old_index is not None:
+                self.moved_items[item_id] = Diff(old=old_index, new=new_index)
+
+    def get_new_track_index(self, old_track_index):
+        if old_track_index in self.removed_tracks:
+            return None
+
+        return self.moved_tracks.get(old_track_index, old_track_index)
+
+    def get_added_items(self, old_track_index) -> set[str]:
+        return self.added_items.get(old_track_index, set())
+
+    def get_removed_items(self, old_track_index) -> set[str]:
+        return self.removed_items.get(old_track_index, set())
+
+    # nested dict view of the diff, kept for callers and tests written against the old format, moved items are not part of it:
+    # {"added"/"removed": {"video_tracks": {"root": [track indices], index: {"items": {"root": {item ids}}}}},
+    #  "changed": {"name": Diff, "video_tracks": {index: {"index": Diff, "name": Diff}}}}
+    @property
+    def diff(self) -> dict:
+        diff_dict = {}
+
+        if self.name is not None:
+            diff_dict.setdefault("changed", {})["name"] = self.name
+
+        for old_index, new_index in self.moved_tracks.items():
+            diff_dict.setdefault("changed", {}).setdefault("video_tracks", {}).setdefault(old_index, {})["index"] = Diff(old=old_index, new=new_index)
+
+        for old_index, name_diff in self.renamed_tracks.items():
+            diff_dict.setdefault("changed", {}).setdefault("video_tracks", {}).setdefault(old_index, {})["name"] = name_diff
+
+        for key, track_indices, track_items in [
+            ("added", self.added_tracks, self.added_items),
+            ("removed", self.removed_tracks, self.removed_items),
+        ]:
+            if len(track_indices) > 0:
+                diff_dict.setdefault(key, {}).setdefault("video_tracks", {})["root"] = sorted(track_indices)
+
+            for old_index, item_ids in track_items.items():
+                diff_dict.setdefault(key, {}).setdefault("video_tracks", {})[old_index] = {"items": {"root": set(item_ids)}}
+
+        return diff_dict
+
+    @diff.setter
+    def diff(self, diff_dict: dict):
+        self.__init__()
+
+        self.name = diff_dict.get("changed", {}).get("name")
+
+        for old_index, track_diff in diff_dict.get("changed", {}).get("video_tracks", {}).items():
+            if "index" in track_diff:
+                self.moved_tracks[old_index] = track_diff["index"].new
+
+            if "name" in track_diff:
+                self.renamed_tracks[old_index] = track_diff["name"]
+
+        for key, track_indices, track_items in [
+            ("added", self.added_tracks, self.added_items),
+            ("removed", self.removed_tracks, self.removed_items),
+        ]:
+            for old_index, track_diff in diff_dict.get(key, {}).get("video_tracks", {}).items():
+                if old_index == "root":
+                    track_indices.update(track_diff)
+                else:
+                    track_items[old_index] = set(track_diff.get("items", {}).get("root", set()))
+
     @classmethod
     def map_old_to_new_tracks(cls, old_timeline_context: TimelineContext, new_timeline_context: TimelineContext):
-        old_track_items = {track_context.index: set(track_context.items.keys()) for track_context in old_timeline_context.video_tracks.values()}
-        new_track_items = {track_context.index: set(track_context.items.keys()) for track_context in new_timeline_context.video_tracks.values()}
-
         old_to_new_tracks = {}
-        moved_tracks = {}
 
-        # check unmoved tracks
-        for old_track_index, old_item_ids in old_track_items.copy().items():  # copy to avoid changed size during iteration
-            new_item_ids = new_track_items.get(old_track_index)
-
-            if new_item_ids is None:
+        # tracks reused from previous capture share the same items dict
+        reused_tracks = {id(track_context.items): track_context.index for track_context in new_timeline_context.video_tracks.values()}
+
+        for old_track_context in old_timeline_context.video_tracks.values():
+            new_track_index = reused_tracks.pop(id(old_track_context.items), None)
+
+            if new_track_index is not None:
+                old_to_new_tracks[old_track_context.index] = new_track_index
+
+        old_tracks = [track_context for track_context in old_timeline_context.video_tracks.values() if track_context.index not in old_to_new_tracks]
+        new_track_indices = set(reused_tracks.values())
+
+        # inverted index of the new snapshot, then each old track votes for new tracks holding its items
+        item_to_new_track = {
+            item_id: track_context.index
+            for track_context in new_timeline_context.video_tracks.values()
+            if track_context.index in new_track_indices
+            for item_id in track_context.items
+        }
+        votes: dict[tuple[int, int], int] = {}
+
+        for old_track_context in old_tracks:
+            for item_id in old_track_context.items:
+                new_track_index = item_to_new_track.get(item_id)
+
+                if new_track_index is not None:
+                    key = (old_track_context.index, new_track_index)
+                    votes[key] = votes.get(key, 0) + 1
+
+        # unmoved tracks sharing any item win first, then most shared items, then nearest track
+        for old_track_index, new_track_index in sorted(
+            votes,
+            key=lambda key: (key[0] != key[1], -votes[key], abs(key[0] - key[1]), key),
+        ):
+            if old_track_index in old_to_new_tracks or new_track_index not in new_track_indices:
                 continue
 
-            same_items = old_item_ids & new_item_ids
+            old_to_new_tracks[old_track_index] = new_track_index
+            new_track_indices.remove(new_track_index)
 
-            if len(same_items) > 0:
-                old_to_new_tracks[old_track_index] = old_track_index
-                old_track_items.pop(old_track_index)
-                new_track_items.pop(old_track_index)
-
-        # check moved tracks
-        for old_track_index, old_item_ids in old_track_items.copy().items():
-            for new_track_index, new_item_ids in new_track_items.copy().items():
-                same_items = old_item_ids & new_item_ids
-
-                if len(same_items) > 0:
-                    old_to_new_tracks[old_track_index] = new_track_index
-                    moved_tracks[old_track_index] = new_track_index
-                    old_track_items.pop(old_track_index)
-                    new_track_items.pop(new_track_index)
-                    break
-
-        # check unmoved empty tracks
-        for old_track_index, old_item_ids in old_track_items.copy().items():
-            new_item_ids = new_track_items.get(old_track_index)
-
-            if new_item_ids is None:
+        # unmoved empty tracks
+        for old_track_context in old_tracks:
+            old_track_index = old_track_context.index
+
+            if old_track_index in old_to_new_tracks or old_track_index not in new_track_indices:
                 continue
 
-            if len(old_item_ids) == 0 or len(new_item_ids) == 0:
+            if len(old_track_context.items) == 0 or len(new_timeline_context.video_tracks[old_track_index].items) == 0:
                 old_to_new_tracks[old_track_index] = old_track_index
-                old_track_items.pop(old_track_index)
-                new_track_items.pop(old_track_index)
+                new_track_indices.remove(old_track_index)
 
         # lost tracks
-        # TODO improve detection of empty tracks?
-        old_to_new_tracks.update({i: None for i in old_track_items.keys()})
+        for old_track_context in old_tracks:
+            old_to_new_tracks.setdefault(old_track_context.index, None)
 
         return {i: old_to_new_tracks[i] for i in sorted(old_to_new_tracks)}
-
-    def get_new_track_index(self, old_track_index):
-        if old_track_index in self.diff.get("removed", {}).get("video_tracks", {}).get("root", []):
-            return None
-
-        index_diff = self.diff.get("changed", {}).get("video_tracks", {}).get(old_track_index, {}).get("index")
-
-        if index_diff is None:
-            return old_track_index
-        else:
-            return index_diff.new
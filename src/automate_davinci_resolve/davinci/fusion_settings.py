@@ -0,0 +1,375 @@
+import math
+import re
+from pathlib import Path
+from typing import Any, Optional, Union
+
+
+# A Lua table constructor as written in Fusion .setting files, e.g. `Input { Value = 1, }` or `ordered() { ... }`.
+# Keyed entries keep their order; positional entries are kept apart so they are written back positionally.
+class FusionTable:
+    __slots__ = ("type_name", "fields", "array")
+
+    def __init__(self, type_name: Optional[str] = None, fields: Optional[dict] = None, array: Optional[list] = None):
+        self.type_name = type_name
+        self.fields = fields if fields is not None else {}
+        self.array = array if array is not None else []
+
+    def __eq__(self, other):
+        return isinstance(other, FusionTable) and (self.type_name, self.fields, self.array) == (other.type_name, other.fields, other.array)
+
+    def __repr__(self):
+        return f"FusionTable({self.type_name!r}, {self.fields!r}, {self.array!r})"
+
+    def get(self, key, default=None):
+        return self.fields.get(key, default)
+
+    def copy(self):
+        return FusionTable(
+            self.type_name,
+            {key: value.copy() if isinstance(value, FusionTable) else value for key, value in self.fields.items()},
+            [value.copy() if isinstance(value, FusionTable) else value for value in self.array],
+        )
+
+
+class FusionSettingsError(ValueError):
+    pass
+
+
+_token_pattern = re.compile(
+    r"""
+    (?P<space>(?:\s+|--\[(?P<comment_level>=*)\[.*?\](?P=comment_level)\]|--[^\n]*)+)
+    |(?P<number>0[xX][0-9a-fA-F]+|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+    |(?P<name>[A-Za-z_][A-Za-z0-9_]*(?:\(\))?)
+    |(?P<string>"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')
+    |\[(?P<long_level>=*)\[(?P<long_string>.*?)\](?P=long_level)\]
+    |(?P<symbol>[{}\[\]=,;\-])
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+_escapes = {"n": "\n", "t": "\t", "r": "\r", "a": "\a", "b": "\b", "f": "\f", "v": "\v", "\\": "\\", '"': '"', "'": "'", "\n": "\n"}
+_escape_pattern = re.compile(r"\\(\d{1,3}|.)", re.DOTALL)
+_identifier_pattern = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_lua_keywords = {
+    "and",
+    "break",
+    "do",
+    "else",
+    "elseif",
+    "end",
+    "false",
+    "for",
+    "function",
+    "if",
+    "in",
+    "local",
+    "nil",
+    "not",
+    "or",
+    "repeat",
+    "return",
+    "then",
+    "true",
+    "until",
+    "while",
+}
+
+
+def _tokenize(text: str):
+    tokens = []
+    pos = 0
+
+    while pos < len(text):
+        match = _token_pattern.match(text, pos)
+
+        if match is None:
+            raise FusionSettingsError(f"Unexpected character {text[pos]!r} at {pos}")
+
+        kind = match.lastgroup
+
+        if kind == "number":
+            raw = match.group("number")
+            tokens.append(("value", int(raw, 16) if raw[:2] in ("0x", "0X") else (float(raw) if any(c in raw for c in ".eE") else int(raw)), pos))
+        elif kind == "name":
+            tokens.append(("name", match.group("name"), pos))
+        elif kind == "string":
+            tokens.append(("value", _unescape(match.group("string")[1:-1]), pos))
+        elif kind in ("long_level", "long_string"):
+            tokens.append(("value", match.group("long_string").removeprefix("\n"), pos))
+        elif kind == "symbol":
+            tokens.append((match.group("symbol"), None, pos))
+
+        pos = match.end()
+
+    tokens.append(("end", None, pos))
+    return tokens
+
+
+def _unescape(raw: str):
+    if "\\" not in raw:
+        return raw
+
+    def replace(match):
+        escape = match.group(1)
+        return chr(int(escape)) if escape.isdigit() else _escapes.get(escape, escape)
+
+    return _escape_pattern.sub(replace, raw)
+
+
+class _Parser:
+    def __init__(self, text: str):
+        self.tokens = _tokenize(text)
+        self.index = 0
+
+    def peek(self, offset: int = 0):
+        return self.tokens[min(self.index + offset, len(self.tokens) - 1)]
+
+    def next(self):
+        token = self.tokens[self.index]
+        self.index += 1
+        return token
+
+    def expect(self, kind: str):
+        token = self.next()
+
+        if token[0] != kind:
+            raise FusionSettingsError(f"Expected {kind!r} but got {token[0]!r} at {token[2]}")
+
+        return token
+
+    def parse(self):
+        value = self.parse_value()
+        self.expect("end")
+        return value
+
+    def parse_value(self):
+        kind, value, pos = self.next()
+
+        if kind == "value":
+            return value
+        elif kind == "-":
+            number = self.expect("value")[1]
+
+            if not isinstance(number, (int, float)):
+                raise FusionSettingsError(f"Expected number after '-' at {pos}")
+
+            return -number
+        elif kind == "{":
+            return self.parse_table(None)
+        elif kind == "name":
+            if value == "true":
+                return True
+            elif value == "false":
+                return False
+            elif value == "nil":
+                return None
+
+            # typed table, e.g. Input { ... }
+            self.expect("{")
+            return self.parse_table(value)
+
+        raise FusionSettingsError(f"Unexpected {kind!r} at {pos}")
+
+    def parse_table(self, type_name: Optional[str]):
+        table = FusionTable(type_name)
+
+        while self.peek()[0] != "}":
+            kind, value, pos = self.peek()
+
+            if kind == "[":
+                self.next()
+                key = self.parse_value()
+                self.expect("]")
+                self.expect("=")
+                table.fields[key] = self.parse_value()
+            elif kind == "name" and self.peek(1)[0] == "=":
+                self.index += 2
+                table.fields[value] = self.parse_value()
+            else:
+                table.array.append(self.parse_value())
+
+            if self.peek()[0] in (",", ";"):
+                self.next()
+            elif self.peek()[0] != "}":
+                raise FusionSettingsError(f"Expected ',' or '}}' at {self.peek()[2]}")
+
+        self.expect("}")
+        return table
+
+
+def parse_settings(text: str) -> FusionTable:
+    settings = _Parser(text).parse()
+
+    if not isinstance(settings, FusionTable):
+        raise FusionSettingsError("Settings is not a table")
+
+    return settings
+
+
+def format_settings(settings: FusionTable) -> str:
+    lines = []
+    _format_value(settings, lines, 0)
+    return "".join(lines) + "\n"
+
+
+def format_value(value) -> str:
+    lines = []
+    _format_value(to_fusion_value(value), lines, 0)
+    return "".join(lines)
+
+
+def _format_value(value, lines: list, depth: int):
+    if isinstance(value, FusionTable):
+        _format_table(value, lines, depth)
+    else:
+        lines.append(_format_scalar(value))
+
+
+def _is_inline(value):
+    if not isinstance(value, FusionTable):
+        return True
+
+    # lists of scalars (points, colors) and single-entry tables like `Input { Value = 1, }` stay on one line
+    if len(value.fields) == 0:
+        return not any(isinstance(item, FusionTable) for item in value.array)
+
+    return len(value.fields) == 1 and len(value.array) == 0 and all(_is_inline(item) for item in value.fields.values())
+
+
+def _format_table(table: FusionTable, lines: list, depth: int):
+    prefix = f"{table.type_name} " if table.type_name is not None else ""
+
+    if _is_inline(table):
+        if len(table.fields) > 0:
+            key, value = next(iter(table.fields.items()))
+            lines.append(f"{prefix}{{ {_format_key(key)} = ")
+            _format_value(value, lines, depth)
+            lines.append(", }")
+        elif len(table.array) > 0:
+            lines.append(f"{prefix}{{ {', '.join(_format_scalar(value) for value in table.array)} }}")
+        else:
+            lines.append(f"{prefix}{{ }}")
+        return
+
+    indent = "\t" * (depth + 1)
+    lines.append(f"{prefix}{{\n")
+
+    for key, value in table.fields.items():
+        lines.append(f"{indent}{_format_key(key)} = ")
+        _format_value(value, lines, depth + 1)
+        lines.append(",\n")
+
+    for value in table.array:
+        lines.append(indent)
+        _format_value(value, lines, depth + 1)
+        lines.append(",\n")
+
+    lines.append("\t" * depth + "}")
+
+
+def _format_key(key):
+    if isinstance(key, str) and _identifier_pattern.fullmatch(key) and key not in _lua_keywords:
+        return key
+
+    return f"[{_format_scalar(key)}]"
+
+
+def _format_scalar(value):
+    if value is None:
+        return "nil"
+    elif value is True:
+        return "true"
+    elif value is False:
+        return "false"
+    elif isinstance(value, int):
+        return str(value)
+    elif isinstance(value, float):
+        if math.isinf(value):
+            return "1e999" if value > 0 else "-1e999"
+
+        return repr(value) if not value.is_integer() or abs(value) >= 1e16 else str(int(value))
+    elif isinstance(value, str):
+        return _quote(value)
+
+    raise FusionSettingsError(f"Value of type {type(value).__name__} can not be written to settings")
+
+
+def _quote(value: str):
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n").replace("\r", "\\r").replace("\t", "\\t")
+    escaped = "".join(c if ord(c) >= 32 else f"\\{ord(c):03d}" for c in escaped)
+    return f'"{escaped}"'
+
+
+def read_settings(path: Union[str, Path]) -> Optional[FusionTable]:
+    path = Path(path)
+
+    if not path.exists():
+        return None
+
+    return parse_settings(path.read_text(encoding="utf-8"))
+
+
+def write_settings(path: Union[str, Path], settings: FusionTable):
+    Path(path).write_text(format_settings(settings), encoding="utf-8")
+
+
+# settings saved from a single tool hold it in Tools, e.g. { Tools = ordered() { Template = TextPlus { Inputs = {...} } } }
+def get_tool(settings: FusionTable, tool_name: Optional[str] = None) -> Optional[FusionTable]:
+    tools = settings.get("Tools")
+
+    if not isinstance(tools, FusionTable):
+        return None
+
+    if tool_name is not None:
+        return tools.get(tool_name)
+
+    return next((tool for tool in tools.fields.values() if isinstance(tool, FusionTable)), None)
+
+
+def get_inputs(tool: FusionTable) -> FusionTable:
+    inputs = tool.get("Inputs")
+
+    if not isinstance(inputs, FusionTable):
+        inputs = tool.fields["Inputs"] = FusionTable()
+
+    return inputs
+
+
+def get_input_value(tool: FusionTable, input_id: str, default=None):
+    input = get_inputs(tool).get(input_id)
+
+    if not isinstance(input, FusionTable):
+        return default
+
+    return input.get("Value", default)
+
+
+def set_input_value(tool: FusionTable, input_id: str, value):
+    inputs = get_inputs(tool)
+
+    if value is None:
+        inputs.fields.pop(input_id, None)
+    else:
+        inputs.fields[input_id] = FusionTable("Input", {"Value": to_fusion_value(value)})
+
+
+# Converts values given by the scripting API (dicts keyed 1..n for Lua arrays, gradient objects) to settings values.
+def to_fusion_value(value) -> Any:
+    if isinstance(value, (FusionTable, str, bool, int, float)) or value is None:
+        return value
+
+    if hasattr(value, "ID") and value.ID == "Gradient":
+        return FusionTable("Gradient", {"Colors": to_fusion_value(value.Value)})
+
+    if isinstance(value, (list, tuple)):
+        return FusionTable(array=[to_fusion_value(v) for v in value])
+
+    if isinstance(value, dict):
+        keys = list(value.keys())
+
+        if keys == list(range(1, len(keys) + 1)):
+            return FusionTable(array=[to_fusion_value(v) for v in value.values()])
+
+        return FusionTable(fields={key: to_fusion_value(v) for key, v in value.items()})
+
+    raise FusionSettingsError(f"Value of type {type(value).__name__} can not be written to settings")
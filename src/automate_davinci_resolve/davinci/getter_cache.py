@@ -0,0 +1,68 @@
+import threading
+from typing import Any, Callable, NamedTuple
+
+from ..utils.lru_cache import LruCache
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+
+
+# Caches results for one generation: pure getters (GetUniqueId, GetName, GetStart, ...) and values taken
+# as a snapshot of that generation (item list of a track, current timeline, Text+ tool of an item).
+# A new generation starts on every ResolveApp.update() and around each action start(), so values never outlive them.
+# Entries are bounded, so a long action does not keep every handle it visited alive.
+# Worker threads share the cache, entries and counters are only touched under the lock.
+class GetterCache:
+    capacity = 50000
+    generation = 0
+    entries = LruCache(capacity=capacity)
+    hits = 0
+    misses = 0
+    lock = threading.Lock()
+
+    @classmethod
+    def new_generation(cls):
+        with cls.lock:
+            cls.generation += 1
+            cls.entries = LruCache(capacity=cls.capacity)
+            cls.hits = 0
+            cls.misses = 0
+
+    @classmethod
+    def memoize(cls, obj, name: str, args: tuple, factory: Callable[[], Any]):
+        # the object is kept alive with the entry so its id cannot be reused while the entry exists
+        key = (id(obj), name, args)
+
+        with cls.lock:
+            entry = cls.entries.get(key)
+
+            if entry is not None:
+                cls.hits += 1
+                return entry[1]
+
+            cls.misses += 1
+            entries = cls.entries
+
+        # the call itself is made outside the lock, a concurrent miss on the same key keeps the first value
+        value = factory()
+
+        with cls.lock:
+            entry = entries.get(key)
+
+            if entry is not None:
+                return entry[1]
+
+            entries.put(key, (obj, value))
+
+        return value
+
+    @classmethod
+    def get(cls, obj, method_name: str, *args):
+        return cls.memoize(obj, method_name, args, lambda: getattr(obj, method_name)(*args))
+
+    @classmethod
+    def get_stats(cls):
+        with cls.lock:
+            return CacheStats(hits=cls.hits, misses=cls.misses)
@@ -1,52 +1,144 @@
 from contextlib import contextmanager
+from typing import NamedTuple
 
 import DaVinciResolveScript
 
 from .enums import ResolveStatus
+from .getter_cache import GetterCache
 from .media_pool import MediaPool
+from .rpc_stats import RpcProxy
 from .timeline import Timeline
 from ..utils import log
 
 
+class ResolveChanges(NamedTuple):
+    project_changed: bool
+    timeline_changed: bool
+
+
 class ResolveApp:
     resolve = None
+    instrument_rpc = True
 
     def __init__(self):
         # resolve object
         self.project_manager = None
         self.project = None
         self.media_storage = None
-        self.media_pool = None
         self.timeline = None
 
+        # identity of cached handles, compared on every update to detect switches
+        self.project_name = None
+        self.timeline_id = None
+        self.changes = ResolveChanges(project_changed=False, timeline_changed=False)
+
     def load_script_app(self):
         return DaVinciResolveScript.scriptapp("Resolve")
 
-    def update(self):
-        if self.resolve is None or self.resolve.GetProductName is None or self.resolve.GetProductName() is None:
-            self.resolve = self.load_script_app()
+    def is_alive(self):
+        return self.resolve is not None and self.resolve.GetProductName is not None and self.resolve.GetProductName() is not None
 
-            if self.resolve is None:
-                return ResolveStatus.Unavailable
+    def load_resolve(self):
+        self.resolve = self.load_script_app()
+        self.project_manager = None
+        self.media_storage = None
+        self.project = None
+        self.project_name = None
+
+        if self.resolve is None:
+            return False
+
+        if self.instrument_rpc:
+            self.resolve = RpcProxy(self.resolve)
 
         self.media_storage = self.resolve.GetMediaStorage()
         self.project_manager = self.resolve.GetProjectManager()
-        self.project = self.project_manager.GetCurrentProject()  # FIXME can get current project when project not opened
-        self.media_pool = None
 
-        if self.project is None:
+        return True
+
+    def update(self):
+        # handles are kept between updates, only current project and timeline are probed
+        GetterCache.new_generation()
+
+        project = None
+
+        if self.project_manager is not None:
+            try:
+                project = self.project_manager.GetCurrentProject()
+            except Exception as e:
+                log.debug(f"Lost connection to Resolve App: {e}")
+                self.resolve = None
+
+        if project is None and not self.is_alive():
+            if not self.load_resolve():
+                self.set_project(None, None)
+                self.set_timeline(None, None)
+                return ResolveStatus.Unavailable
+
+            project = self.project_manager.GetCurrentProject()  # FIXME can get current project when project not opened
+
+        if project is None:
+            project_changed = self.set_project(None, None)
+            timeline_changed = self.set_timeline(None, None)
+            self.changes = ResolveChanges(project_changed=project_changed, timeline_changed=timeline_changed)
             return ResolveStatus.ProjectManagerOpen
 
-        self.media_pool = self.project.GetMediaPool()
-        self.timeline = self.project.GetCurrentTimeline()
+        # a poll costs 4 calls: current project, its name, current timeline and its id
+        # the name is read every time, an imported copy of a project keeps the ids of its timelines
+        project_changed = self.set_project(project, project.GetName())
+        timeline = project.GetCurrentTimeline()
+        timeline_id = GetterCache.get(timeline, "GetUniqueId") if timeline is not None else None
+        timeline_changed = self.set_timeline(timeline, timeline_id)
+        self.changes = ResolveChanges(project_changed=project_changed, timeline_changed=timeline_changed)
 
         if self.timeline is None:
             return ResolveStatus.ProjectOpen
         else:
             return ResolveStatus.TimelineOpen
 
+    def set_project(self, project, project_name):
+        # like the timeline, the fresh handle is kept, a project reopened under the same name has a new one
+        changed = project_name != self.project_name or (project is None) != (self.project is None)
+
+        self.project = project
+        self.project_name = project_name
+
+        return changed
+
+    @property
+    def media_pool(self):
+        return GetterCache.get(self.project, "GetMediaPool") if self.project is not None else None
+
+    def set_timeline(self, timeline, timeline_id):
+        # the fresh handle is always kept, so getters cached on it this generation are shared
+        changed = timeline_id != self.timeline_id or (timeline is None) != (self.timeline is None)
+
+        self.timeline = timeline
+        self.timeline_id = timeline_id
+
+        return changed
+
     def get_current_timeline(self):
-        return Timeline(self.project.GetCurrentTimeline())
+        return GetterCache.memoize(self, "get_current_timeline", (), lambda: Timeline(self.timeline))
+
+    # opens a new scripting connection to the current timeline, for a worker thread that can not share ours
+    def open_timeline(self):
+        resolve = self.load_script_app()
+
+        if resolve is None:
+            return None
+
+        if self.instrument_rpc:
+            resolve = RpcProxy(resolve)
+
+        project = resolve.GetProjectManager().GetCurrentProject()
+        timeline = project.GetCurrentTimeline() if project is not None else None
+
+        # the editor may have switched timeline since the last update
+        if timeline is None or timeline.GetUniqueId() != self.timeline_id:
+            return None
+
+        return Timeline(timeline)
 
     def get_media_pool(self):
         return MediaPool(self.media_pool)
@@ -82,17 +174,19 @@ class ResolveApp:
 
         self.update()
 
-        yield project
-
-        log.info(f"Loading back previous project '{current_project_name}'...")
-        log.flush()
+        # the temp project is removed even when the caller fails or is cancelled
+        try:
+            yield project
+        finally:
+            log.info(f"Loading back previous project '{current_project_name}'...")
+            log.flush()
 
-        if self.project_manager.LoadProject(current_project_name) is None:
-            log.error(f"Failed to load project '{current_project_name}'")
+            if self.project_manager.LoadProject(current_project_name) is None:
+                log.error(f"Failed to load project '{current_project_name}'")
 
-        if not self.project_manager.DeleteProject(project_name):
-            log.error(f"Failed to delete temp project '{project_name}'")
+            if not self.project_manager.DeleteProject(project_name):
+                log.error(f"Failed to delete temp project '{project_name}'")
 
-        log.info(f"Removed temporary project '{project_name}'")
+            log.info(f"Removed temporary project '{project_name}'")
 
-        self.update()
+            self.update()
@@ -0,0 +1,220 @@
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import NamedTuple
+
+
+class MethodStats(NamedTuple):
+    method: str
+    count: int
+    total: float
+    p50: float
+    p99: float
+
+
+class RpcStats:
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = {}
+
+    def record(self, method: str, seconds: float):
+        self.latencies.setdefault(method, []).append(seconds)
+
+    def merge(self, other: "RpcStats"):
+        for method, latencies in other.latencies.items():
+            self.latencies.setdefault(method, []).extend(latencies)
+
+    def reset(self):
+        self.latencies.clear()
+
+    def get_count(self, method: str = None) -> int:
+        if method is not None:
+            return len(self.latencies.get(method, []))
+
+        return sum(len(latencies) for latencies in self.latencies.values())
+
+    def get_total_time(self) -> float:
+        return sum(sum(latencies) for latencies in self.latencies.values())
+
+    def get_method_stats(self, method: str):
+        latencies = self.latencies.get(method)
+
+        if not latencies:
+            return None
+
+        sorted_latencies = sorted(latencies)
+
+        return MethodStats(
+            method=method,
+            count=len(sorted_latencies),
+            total=sum(sorted_latencies),
+            p50=self.percentile(sorted_latencies, 50),
+            p99=self.percentile(sorted_latencies, 99),
+        )
+
+    def summary(self) -> list[MethodStats]:
+        method_stats = [self.get_method_stats(method) for method in self.latencies]
+        return sorted(method_stats, key=lambda stats: stats.total, reverse=True)
+
+    def format(self, limit: int = 5):
+        method_stats = self.summary()
+        text = f"{self.get_count()} calls in {self.get_total_time() * 1000:.1f}ms"
+
+        if len(method_stats) > 0:
+            text += ": " + ", ".join(
+                f"{stats.method} x{stats.count} (p50={stats.p50 * 1000:.2f}ms, p99={stats.p99 * 1000:.2f}ms)" for stats in method_stats[:limit]
+            )
+
+        return text
+
+    @staticmethod
+    def percentile(sorted_values: list[float], percent: float):
+        # nearest-rank method
+        rank = max(math.ceil(percent / 100 * len(sorted_values)), 1)
+        return sorted_values[rank - 1]
+
+
+# Mean latency of each method over the session, to estimate the cost of calls before making them.
+# Methods not called yet fall back to typical figures measured against Resolve 18 on a local machine.
+# Recorded from worker threads too, so totals are only touched under the lock.
+class LatencyEstimates:
+    typical_latencies = {
+        "GetItemListInTrack": 0.004,
+        "GetFusionCompCount": 0.002,
+        "GetFusionCompByIndex": 0.002,
+        "FindToolByID": 0.002,
+        "SaveSettings": 0.02,
+        "LoadSettings": 0.03,
+        "AppendToTimeline": 0.05,
+        "DuplicateTimeline": 0.2,
+        "ImportProject": 1.0,
+        "LoadProject": 1.0,
+    }
+    default_latency = 0.001
+
+    def __init__(self):
+        self.totals: dict[str, float] = {}
+        self.counts: dict[str, int] = {}
+        self.lock = threading.Lock()
+
+    def record(self, method: str, seconds: float):
+        with self.lock:
+            self.totals[method] = self.totals.get(method, 0.0) + seconds
+            self.counts[method] = self.counts.get(method, 0) + 1
+
+    def get(self, method: str) -> float:
+        with self.lock:
+            count = self.counts.get(method, 0)
+
+            if count == 0:
+                return self.typical_latencies.get(method, self.default_latency)
+
+            return self.totals[method] / count
+
+    # seconds taken by the given number of calls per method
+    def estimate(self, calls: dict[str, int]) -> float:
+        return sum(self.get(method) * count for method, count in calls.items())
+
+    def reset(self):
+        with self.lock:
+            self.totals.clear()
+            self.counts.clear()
+
+
+# Calls made from worker threads are recorded into the same stats, active stats are only touched under the lock.
+class RpcMonitor:
+    active_stats: list[RpcStats] = []
+    latency_estimates = LatencyEstimates()
+    lock = threading.Lock()
+
+    @classmethod
+    def record(cls, method: str, seconds: float):
+        cls.latency_estimates.record(method, seconds)
+
+        with cls.lock:
+            for stats in cls.active_stats:
+                stats.record(method, seconds)
+
+    @classmethod
+    @contextmanager
+    def measure(cls, stats: RpcStats = None):
+        if stats is None:
+            stats = RpcStats()
+
+        with cls.lock:
+            cls.active_stats.append(stats)
+
+        try:
+            yield stats
+        finally:
+            with cls.lock:
+                cls.active_stats.remove(stats)
+
+
+class RpcProxy:
+    _plain_types = (str, bytes, int, float, bool, type(None))
+
+    def __init__(self, target):
+        object.__setattr__(self, "_target", target)
+
+    @classmethod
+    def wrap(cls, value):
+        if isinstance(value, (cls, cls._plain_types)):
+            return value
+
+        if isinstance(value, list):
+            return [cls.wrap(v) for v in value]
+
+        if isinstance(value, tuple):
+            return tuple(cls.wrap(v) for v in value)
+
+        if isinstance(value, dict):
+            return {k: cls.wrap(v) for k, v in value.items()}
+
+        return cls(value)
+
+    @classmethod
+    def unwrap(cls, value):
+        if isinstance(value, cls):
+            return object.__getattribute__(value, "_target")
+
+        if isinstance(value, list):
+            return [cls.unwrap(v) for v in value]
+
+        if isinstance(value, tuple):
+            return tuple(cls.unwrap(v) for v in value)
+
+        if isinstance(value, dict):
+            return {k: cls.unwrap(v) for k, v in value.items()}
+
+        return value
+
+    def __getattr__(self, name):
+        attr = getattr(object.__getattribute__(self, "_target"), name)
+
+        if not callable(attr):
+            return self.wrap(attr)
+
+        def call(*args, **kw):
+            start_time = time.perf_counter()
+
+            try:
+                result = attr(*self.unwrap(args), **self.unwrap(kw))
+            finally:
+                RpcMonitor.record(name, time.perf_counter() - start_time)
+
+            return self.wrap(result)
+
+        return call
+
+    def __setattr__(self, name, value):
+        setattr(object.__getattribute__(self, "_target"), name, self.unwrap(value))
+
+    def __eq__(self, other):
+        return object.__getattribute__(self, "_target") == self.unwrap(other)
+
+    def __hash__(self):
+        return hash(object.__getattribute__(self, "_target"))
+
+    def __repr__(self):
+        return f"RpcProxy({object.__getattribute__(self, '_target')!r})"
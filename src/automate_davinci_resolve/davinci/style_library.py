@@ -0,0 +1,144 @@
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+from . import fusion_settings
+from .textplus_style import TextplusStyle
+from ..utils import log
+from ..utils.lru_cache import LruCache
+
+
+# Named Text+ styles saved under a directory, e.g. AppSettings.data_dir / "styles".
+# Settings are stored by style fingerprint, so a style saved under several names is stored once,
+# and names.json maps names to fingerprints. Parsed styles are kept in memory by fingerprint.
+class StyleLibrary:
+    cache_size = 16
+    # one library per directory, so parsed styles are shared by all actions and runs
+    libraries: dict[Path, "StyleLibrary"] = {}
+    libraries_lock = threading.Lock()
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.styles = LruCache(capacity=self.cache_size)
+        self.lock = threading.Lock()
+        self._names = None
+        self._names_version = None
+
+    @classmethod
+    def open(cls, root: Path):
+        root = Path(root)
+
+        with cls.libraries_lock:
+            if root not in cls.libraries:
+                cls.libraries[root] = cls(root)
+
+            return cls.libraries[root]
+
+    @property
+    def names_path(self):
+        return self.root / "names.json"
+
+    def get_settings_path(self, fingerprint: str):
+        return self.root / "objects" / f"{fingerprint}.setting"
+
+    def names(self) -> list[str]:
+        with self.lock:
+            return sorted(self._load_names().keys())
+
+    def get_fingerprint(self, name: str) -> Optional[str]:
+        with self.lock:
+            return self._load_names().get(name)
+
+    # only styles saved to a settings file can be added, captured inputs alone cannot be loaded back
+    def add(self, name: str, style: TextplusStyle) -> Optional[str]:
+        if style.settings is None:
+            return None
+
+        fingerprint = style.fingerprint
+        settings_path = self.get_settings_path(fingerprint)
+
+        with self.lock:
+            if not settings_path.exists():
+                settings = style.settings.copy()
+                tool = fusion_settings.get_tool(settings)
+
+                # excluded inputs are taken from each target, the reference's own text is not part of the style
+                for id in style.exclude_data_ids:
+                    fusion_settings.set_input_value(tool, id, None)
+
+                settings_path.parent.mkdir(parents=True, exist_ok=True)
+                fusion_settings.write_settings(settings_path, settings)
+
+            self._load_names()[name] = fingerprint
+            self._save_names()
+
+        return fingerprint
+
+    def get(self, name: str) -> Optional[TextplusStyle]:
+        with self.lock:
+            fingerprint = self._load_names().get(name)
+
+            if fingerprint is None:
+                return None
+
+            style = self.styles.get(fingerprint)
+
+            if style is not None:
+                return style
+
+            settings_path = self.get_settings_path(fingerprint)
+
+            try:
+                settings = fusion_settings.read_settings(settings_path)
+            except fusion_settings.FusionSettingsError as e:
+                log.warning(f"Failed to parse style '{name}' from '{settings_path}': {e}")
+                return None
+
+            if settings is None:
+                log.warning(f"Style '{name}' is missing its settings file '{settings_path}'")
+                return None
+
+            style = TextplusStyle.from_settings(settings, str(settings_path))
+            self.styles.put(fingerprint, style)
+
+            return style
+
+    # settings files are kept, other names may point to the same style
+    def remove(self, name: str):
+        with self.lock:
+            if self._load_names().pop(name, None) is not None:
+                self._save_names()
+
+    # names.json may be written by another run of the app, it is read again whenever the file changed
+    def _load_names(self) -> dict[str, str]:
+        version = self._get_names_version()
+
+        if self._names is None or version != self._names_version:
+            try:
+                self._names = json.loads(self.names_path.read_text(encoding="utf-8"))
+            except FileNotFoundError:
+                self._names = {}
+            except (OSError, ValueError) as e:
+                log.warning(f"Failed to read style names from '{self.names_path}': {e}")
+                self._names = {}
+
+            self._names_version = version
+
+        return self._names
+
+    def _save_names(self):
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.names_path.with_name(f"{self.names_path.name}.tmp")
+        tmp_path.write_text(json.dumps(self._names, indent=2, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_path, self.names_path)
+        self._names_version = self._get_names_version()
+
+    def _get_names_version(self):
+        try:
+            stat = self.names_path.stat()
+        except OSError:
+            return None
+
+        return stat.st_mtime_ns, stat.st_size
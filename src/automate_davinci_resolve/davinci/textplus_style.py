@@ -0,0 +1,185 @@
+import hashlib
+import threading
+from enum import Enum
+from typing import Iterable, Optional
+
+from . import fusion_settings, textplus_utils
+from .textplus_utils import InputData
+from ..utils import log
+from ..utils.lru_cache import LruCache
+
+
+class ApplyResult(Enum):
+    Applied = 0
+    Unchanged = 1
+    Failed = 2
+
+
+# Style of a Text+ tool, saved once from a reference tool to a settings file and applied to others.
+# Excluded inputs (e.g. StyledText) are never overwritten on the targets.
+# Inputs are not transferred one by one through GetInputList: a target may set inputs the reference leaves at default,
+# so every input of every target would have to be read, one call each, where one LoadSettings loads them all.
+class TextplusStyle:
+    # follow the clip duration, not part of the style
+    ignored_fingerprint_ids = ("GlobalIn", "GlobalOut")
+
+    def __init__(
+        self,
+        inputs: dict[str, InputData],
+        exclude_data_ids: Iterable[str] = ("StyledText",),
+        settings: Optional[fusion_settings.FusionTable] = None,
+        settings_path: Optional[str] = None,
+    ):
+        self.inputs = inputs
+        self.exclude_data_ids = list(exclude_data_ids)
+        # parsed settings of the reference, applied with one LoadSettings per target
+        self.settings = settings
+        self.settings_path = settings_path
+        self._fingerprint = None
+
+    def __eq__(self, other):
+        return isinstance(other, TextplusStyle) and self.inputs == other.inputs
+
+    def __repr__(self):
+        return f"TextplusStyle({list(self.inputs.keys())})"
+
+    # settings are patched in place on apply, so each thread applying the style needs its own copy
+    def copy(self):
+        style = TextplusStyle(self.inputs, self.exclude_data_ids, self.settings.copy() if self.settings is not None else None, self.settings_path)
+        style._fingerprint = self._fingerprint
+        return style
+
+    # stable hash of style inputs, equal styles give equal fingerprints
+    @property
+    def fingerprint(self) -> str:
+        if self._fingerprint is None:
+            lines = []
+
+            for id in sorted(self.inputs.keys()):
+                if id in self.ignored_fingerprint_ids:
+                    continue
+
+                input_data = self.inputs[id]
+                lines.append(f"{id}={fusion_settings.format_value(input_data.value)}")
+
+            self._fingerprint = hashlib.sha1("\n".join(lines).encode("utf-8")).hexdigest()
+
+        return self._fingerprint
+
+    # values of excluded inputs, only known for styles saved to a settings file
+    def get_excluded_values(self) -> Optional[dict]:
+        tool = fusion_settings.get_tool(self.settings) if self.settings is not None else None
+
+        if tool is None:
+            return None
+
+        return {id: fusion_settings.get_input_value(tool, id) for id in self.exclude_data_ids}
+
+    # one SaveSettings call, inputs are parsed from the settings file
+    @classmethod
+    def save(cls, textplus, settings_path: str, exclude_data_ids: Iterable[str] = ("StyledText",)):
+        if not textplus_utils.save_settings(textplus, settings_path):
+            return None
+
+        try:
+            settings = fusion_settings.read_settings(settings_path)
+        except fusion_settings.FusionSettingsError as e:
+            log.warning(f"Failed to parse settings file '{settings_path}': {e}")
+            settings = None
+
+        return cls.from_settings(settings, settings_path, exclude_data_ids)
+
+    # settings saved from a Text+ tool, without a tool the style falls back to loading the file as is
+    @classmethod
+    def from_settings(cls, settings: Optional[fusion_settings.FusionTable], settings_path: str, exclude_data_ids: Iterable[str] = ("StyledText",)):
+        inputs = {}
+        tool = fusion_settings.get_tool(settings) if settings is not None else None
+
+        if tool is not None:
+            for id, input in fusion_settings.get_inputs(tool).fields.items():
+                if id in exclude_data_ids or not isinstance(input, fusion_settings.FusionTable) or "Value" not in input.fields:
+                    continue
+
+                value = input.get("Value")
+                data_type = value.type_name if isinstance(value, fusion_settings.FusionTable) else None
+                inputs[id] = InputData(data_type=data_type, value=value, expression=input.get("Expression"), fusion_object=None)
+
+        return cls(inputs, exclude_data_ids, settings if tool is not None else None, settings_path)
+
+    def apply(self, textplus, preserved_values: Optional[dict] = None, patched_settings_path: Optional[str] = None):
+        if self.settings is not None:
+            return textplus_utils.load_patched_settings(
+                textplus, self.settings, self.settings_path, self.exclude_data_ids, preserved_values, patched_settings_path
+            )
+
+        return textplus_utils.load_settings(textplus, self.settings_path, exclude_data_ids=self.exclude_data_ids)
+
+    # item last known in this style, no call needed. Only a hint, edits made in Fusion since are not seen
+    def is_known_applied(self, item_id: Optional[str]):
+        return item_id is not None and StyleFingerprints.get(item_id) == self.fingerprint
+
+    # loads the reference without reading the target, excluded inputs are preserved with one GetInput each
+    def apply_to_item(self, textplus, item_id: Optional[str], patched_settings_path: Optional[str] = None):
+        if not self.apply(textplus, patched_settings_path=patched_settings_path):
+            if item_id is not None:
+                StyleFingerprints.invalidate(item_id)
+
+            return ApplyResult.Failed
+
+        if item_id is not None:
+            StyleFingerprints.put(item_id, self.fingerprint)
+
+        return ApplyResult.Applied
+
+    # reads the style of the target first (one SaveSettings), and loads the reference only if it differs.
+    # the target's own settings give the excluded inputs to preserve, so no GetInput is needed.
+    # patched settings are written next to the target settings, so callers using their own target path never share files.
+    # cheaper than apply_to_item only when the target is likely in style already
+    def apply_if_changed(self, textplus, item_id: Optional[str], target_settings_path: str):
+        target_style = TextplusStyle.save(textplus, target_settings_path, self.exclude_data_ids)
+        patched_settings_path = str(textplus_utils.get_patched_settings_path(target_settings_path))
+
+        if target_style is None:
+            return ApplyResult.Applied if self.apply(textplus, patched_settings_path=patched_settings_path) else ApplyResult.Failed
+
+        if item_id is not None:
+            StyleFingerprints.put(item_id, target_style.fingerprint)
+
+        if target_style.fingerprint == self.fingerprint:
+            return ApplyResult.Unchanged
+
+        if not self.apply(textplus, target_style.get_excluded_values(), patched_settings_path):
+            return ApplyResult.Failed
+
+        if item_id is not None:
+            StyleFingerprints.put(item_id, self.fingerprint)
+
+        return ApplyResult.Applied
+
+
+# Last known style fingerprint of timeline items, by item id.
+# Only a hint: edits made in Fusion are not seen until the item is read again.
+# Updated from worker threads, so entries are only touched under the lock.
+class StyleFingerprints:
+    entries = LruCache(capacity=100000)
+    lock = threading.Lock()
+
+    @classmethod
+    def get(cls, item_id: str) -> Optional[str]:
+        with cls.lock:
+            return cls.entries.get(item_id)
+
+    @classmethod
+    def put(cls, item_id: str, fingerprint: str):
+        with cls.lock:
+            cls.entries.put(item_id, fingerprint)
+
+    @classmethod
+    def invalidate(cls, item_id: str):
+        with cls.lock:
+            cls.entries.pop(item_id)
+
+    @classmethod
+    def clear(cls):
+        with cls.lock:
+            cls.entries.clear()
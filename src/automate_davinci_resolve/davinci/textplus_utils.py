@@ -1,5 +1,10 @@
+from pathlib import Path
 from typing import Any, NamedTuple, Optional
 
+from . import fusion_settings
+from .getter_cache import GetterCache
+from ..utils import log
+
 
 class InputData(NamedTuple):
     data_type: str
@@ -9,7 +14,11 @@ class InputData(NamedTuple):
 
 
 def find_textplus(timeline_item):
-    if timeline_item.GetFusionCompCount() == 0:
+    return GetterCache.memoize(timeline_item, "find_textplus", (), lambda: _find_textplus(timeline_item))
+
+
+def _find_textplus(timeline_item):
+    if GetterCache.get(timeline_item, "GetFusionCompCount") == 0:
         return None
 
     comp = timeline_item.GetFusionCompByIndex(1)
@@ -23,8 +32,52 @@ def save_settings(textplus, settings_path: str):
 
 
 def load_settings(textplus, settings_path: str, exclude_data_ids=[]):
-    # TODO: try modify settings file instead of looping InputList
+    if len(exclude_data_ids) == 0:
+        return textplus.LoadSettings(settings_path)
+
+    try:
+        settings = fusion_settings.read_settings(settings_path)
+    except fusion_settings.FusionSettingsError as e:
+        log.warning(f"Failed to parse settings file '{settings_path}': {e}")
+        settings = None
+
+    if settings is None or fusion_settings.get_tool(settings) is None:
+        return _load_settings_preserving_inputs(textplus, settings_path, exclude_data_ids)
+
+    return load_patched_settings(textplus, settings, settings_path, exclude_data_ids)
+
+
+# Copies excluded inputs from the target into parsed settings, then loads all in one call.
+# Settings are patched in place, which is fine as excluded inputs are overwritten on every load.
+# Values of excluded inputs can be given when already known, to save the GetInput calls.
+def load_patched_settings(
+    textplus,
+    settings: fusion_settings.FusionTable,
+    settings_path: str,
+    exclude_data_ids=[],
+    preserved_values: Optional[dict] = None,
+    patched_settings_path: Optional[str] = None,
+):
+    tool = fusion_settings.get_tool(settings)
+
+    for id in exclude_data_ids:
+        value = preserved_values[id] if preserved_values is not None and id in preserved_values else textplus.GetInput(id)
+        fusion_settings.set_input_value(tool, id, value)
+
+    if patched_settings_path is None:
+        patched_settings_path = get_patched_settings_path(settings_path)
+
+    fusion_settings.write_settings(patched_settings_path, settings)
+
+    return textplus.LoadSettings(str(patched_settings_path))
+
+
+def get_patched_settings_path(settings_path: str):
+    path = Path(settings_path)
+    return path.with_name(f"{path.stem}.patched{path.suffix}")
+
 
+def _load_settings_preserving_inputs(textplus, settings_path: str, exclude_data_ids=[]):
     preserved_data = {}
 
     for id in exclude_data_ids:
@@ -1,6 +1,9 @@
+from typing import Optional
+
+from .getter_cache import GetterCache
 from .timecode import Timecode, TimecodeSettings
 from .track import Track
-from .context import TimelineContext
+from .context import TimelineContext, TimelineFingerprint
 
 
 class Timeline:
@@ -8,7 +11,7 @@ class Timeline:
         self.timeline = timeline
 
     def __repr__(self):
-        return f"Timeline({self.timeline.GetName()})"
+        return f"Timeline({GetterCache.get(self.timeline, 'GetName')})"
 
     def get_current_item_at_track(self, track_type: str, track_index: int):
         timecode_settings = self.get_timecode_settings()
@@ -21,21 +24,28 @@ class Timeline:
 
         return None
 
+    def get_track_count(self, track_type: str):
+        return GetterCache.get(self.timeline, "GetTrackCount", track_type)
+
     def has_track(self, track_type: str, track_index: int):
-        track_count = self.timeline.GetTrackCount(track_type)
+        track_count = self.get_track_count(track_type)
         return 1 <= track_index and track_index <= track_count
 
     def get_track(self, track_type: str, track_index: int):
         if not self.has_track(track_type, track_index):
             return None
 
-        track_name = self.timeline.GetTrackName(track_type, track_index)
+        # share the same item handles within a generation, so their cached getters can be reused
+        return GetterCache.memoize(self.timeline, "get_track", (track_type, track_index), lambda: self._create_track(track_type, track_index))
+
+    def _create_track(self, track_type: str, track_index: int):
+        track_name = GetterCache.get(self.timeline, "GetTrackName", track_type, track_index)
         items = self.timeline.GetItemListInTrack(track_type, track_index)
 
         return Track(track_name, track_type, track_index, list(items))
 
     def iter_tracks(self, track_type):
-        track_count = self.timeline.GetTrackCount(track_type)
+        track_count = self.get_track_count(track_type)
 
         for i in range(1, track_count + 1):
             yield self.get_track(track_type, i)
@@ -43,9 +53,48 @@ class Timeline:
     def get_timecode_settings(self):
         return TimecodeSettings(self.timeline.GetStartTimecode(), float(self.timeline.GetSetting("timelineFrameRate")))
 
-    def capture_context(self):
+    # taken on every update. Per track: its name, its item list and the ids of its first and last item.
+    # Resolve has no call giving the item count of a track, so every item handle is still sent by GetItemListInTrack,
+    # only no property of the items is read
+    def capture_fingerprint(self):
+        return TimelineFingerprint(
+            id=GetterCache.get(self.timeline, "GetUniqueId"),
+            name=GetterCache.get(self.timeline, "GetName"),
+            video_tracks=tuple(track.capture_fingerprint() for track in self.iter_tracks("video")),
+        )
+
+    def capture_context(self, previous_context: Optional[TimelineContext] = None):
+        fingerprint = self.capture_fingerprint()
+        video_tracks = {}
+
+        previous_tracks = {}
+        moved_previous_tracks = {}
+
+        if previous_context is not None and previous_context.fingerprint is not None and previous_context.id == fingerprint.id:
+            previous_tracks = {
+                index: (track_fingerprint, previous_context.video_tracks[index])
+                for index, track_fingerprint in enumerate(previous_context.fingerprint.video_tracks, start=1)
+            }
+            moved_previous_tracks = {
+                track_fingerprint: track_context for track_fingerprint, track_context in previous_tracks.values() if track_fingerprint.item_count > 0
+            }
+
+        for track, track_fingerprint in zip(self.iter_tracks("video"), fingerprint.video_tracks):
+            previous_track_fingerprint, previous_track_context = previous_tracks.get(track.index, (None, None))
+
+            if previous_track_fingerprint != track_fingerprint:
+                previous_track_context = moved_previous_tracks.get(track_fingerprint)
+
+            if previous_track_context is None:
+                video_tracks[track.index] = track.capture_context()
+            elif previous_track_context.index == track.index:
+                video_tracks[track.index] = previous_track_context
+            else:
+                video_tracks[track.index] = previous_track_context._replace(index=track.index)
+
         return TimelineContext(
-            id=self.timeline.GetUniqueId(),
-            name=self.timeline.GetName(),
-            video_tracks={track.index: track.capture_context() for track in self.iter_tracks("video")},
+            id=fingerprint.id,
+            name=fingerprint.name,
+            video_tracks=video_tracks,
+            fingerprint=fingerprint,
         )
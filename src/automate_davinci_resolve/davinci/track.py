@@ -1,4 +1,5 @@
-from .context import TrackContext, TimelineItemContext
+from .context import TrackContext, TrackFingerprint, TimelineItemContext
+from .getter_cache import GetterCache
 
 
 class Track:
@@ -7,13 +8,35 @@ class Track:
         self.type = track_type
         self.index = track_index
         self.timeline_items = timeline_items
+        self.items_by_id = None
 
     def __repr__(self):
         return f"Track({self.type}, {self.index}, {self.name})"
 
+    def get_item_id(self, item) -> str:
+        return GetterCache.get(item, "GetUniqueId")
+
+    # built once per track (so once per generation), capture_context builds it as it reads all item ids anyway
+    def get_items_by_id(self) -> dict:
+        if self.items_by_id is None:
+            self.items_by_id = {self.get_item_id(item): item for item in self.timeline_items}
+
+        return self.items_by_id
+
+    def get_item(self, item_id: str):
+        return self.get_items_by_id().get(item_id)
+
+    def capture_fingerprint(self):
+        return TrackFingerprint(
+            name=self.name,
+            item_count=len(self.timeline_items),
+            first_item_id=self.get_item_id(self.timeline_items[0]) if len(self.timeline_items) > 0 else None,
+            last_item_id=self.get_item_id(self.timeline_items[-1]) if len(self.timeline_items) > 0 else None,
+        )
+
     def capture_context(self):
         return TrackContext(
             index=self.index,
             name=self.name,
-            items={item.GetUniqueId(): TimelineItemContext(id=item.GetUniqueId()) for item in self.timeline_items},
+            items={item_id: TimelineItemContext(id=item_id) for item_id in self.get_items_by_id().keys()},
         )
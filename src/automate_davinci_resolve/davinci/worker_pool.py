@@ -0,0 +1,64 @@
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Iterator
+
+from .resolve_app import ResolveApp
+from .timeline import Timeline
+from ..utils import log
+
+
+# Runs jobs against the current timeline over a bounded pool of threads.
+# Calls of one scripting connection are served one at a time, so each worker opens its own connection.
+# With one worker, jobs run in order on the main connection.
+class ResolveWorkerPool:
+    def __init__(self, resolve_app: ResolveApp, worker_count: int = 1):
+        self.resolve_app = resolve_app
+        self.worker_count = max(worker_count, 1)
+        self.workers = threading.local()
+        self.worker_indexes = itertools.count(1)
+
+    # func(timeline, worker_index, job) is called once per job, results are yielded as jobs complete.
+    # Worker index 0 is the main connection, other indexes are stable per worker thread.
+    def run(self, func: Callable[[Timeline, int, Any], Any], jobs: list) -> Iterator[tuple[Any, Any]]:
+        if self.worker_count == 1 or len(jobs) <= 1:
+            yield from self.run_serial(func, jobs)
+            return
+
+        fallback_jobs = []
+
+        with ThreadPoolExecutor(max_workers=min(self.worker_count, len(jobs))) as executor:
+            futures = {executor.submit(self.run_job, func, job): job for job in jobs}
+
+            try:
+                for future in as_completed(futures):
+                    connected, result = future.result()
+
+                    if connected:
+                        yield futures[future], result
+                    else:
+                        fallback_jobs.append(futures[future])
+            except BaseException:
+                # a failed job or a closed consumer drops queued jobs, leaving the pool only waits for running ones
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+        if len(fallback_jobs) > 0:
+            log.warning(f"Failed to connect workers to Resolve, running {len(fallback_jobs)} jobs serially")
+            yield from self.run_serial(func, fallback_jobs)
+
+    def run_serial(self, func: Callable[[Timeline, int, Any], Any], jobs: list):
+        timeline = self.resolve_app.get_current_timeline()
+
+        for job in jobs:
+            yield job, func(timeline, 0, job)
+
+    def run_job(self, func: Callable[[Timeline, int, Any], Any], job):
+        if not hasattr(self.workers, "timeline"):
+            self.workers.index = next(self.worker_indexes)
+            self.workers.timeline = self.resolve_app.open_timeline()
+
+        if self.workers.timeline is None:
+            return False, None
+
+        return True, func(self.workers.timeline, self.workers.index, job)
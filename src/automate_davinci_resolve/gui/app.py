@@ -4,20 +4,24 @@ from .widgets.action_switcher_frame import ActionSwitcherFrame
 from .widgets.named_frame import NamedFrame
 from .log_handler import TextboxLogHandler
 from ..app.app import App
+from ..app.poller import AppPoller
 
 
 class GuiApp:
+    refresh_interval_ms = 100
+
     def __init__(self, app: App):
         super().__init__()
 
         self.app = app
+        self.poller = AppPoller(app)
 
         self.root = CTk()
         self.root.protocol("WM_DELETE_WINDOW", self.destroy)
         self.root.title("Davinci Resolve Automation")
         self.root.geometry(f"{1100}x{580}")
 
-        self.action_switcher_frame = ActionSwitcherFrame(app, self.root)
+        self.action_switcher_frame = ActionSwitcherFrame(self.poller, self.root)
         self.action_switcher_frame.pack(fill="both", expand=True)
 
         self.log_frame = NamedFrame("Log", self.root)
@@ -30,24 +34,30 @@ class GuiApp:
 
     def mainloop(self):
         # self.root.update()
+        self.poller.start()
         self.periodic_update()
         self.root.mainloop()
 
     def periodic_update(self):
         self.update()
-        self.root.after(500, self.periodic_update)
+        self.root.after(self.refresh_interval_ms, self.periodic_update)
 
     def update(self):
-        self.app.apply_inputs(self.action_switcher_frame.activated_action, self.action_switcher_frame.activated_action_frame.get_input_data())
-
-        app_context = self.app.update()
+        self.poller.apply_inputs(self.action_switcher_frame.activated_action, self.action_switcher_frame.activated_action_frame.get_input_data())
 
-        if app_context is not None:
+        # every snapshot is applied in order, because each diff is relative to the previous snapshot
+        for app_context in self.poller.poll_contexts():
             self.action_switcher_frame.update(app_context)
 
+        # no context is polled while an action runs, progress is read directly
+        self.action_switcher_frame.update_progress()
+
+        self.log_handler.drain()
+
     def get_log_handler(self):
         return self.log_handler
 
     def destroy(self):
+        self.poller.stop(timeout=1)
         self.log_handler.on_destroy()
         self.root.destroy()
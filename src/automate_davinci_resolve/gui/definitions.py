@@ -1,7 +1,9 @@
 from typing import Any, NamedTuple, Optional, Union
 
+from .input_widgets.bool_widgets import BoolWidget
 from .input_widgets.enum_widgets import SingleEnumValueWidget
 from .input_widgets.file_widgets import LoadFileWidget, SaveFileWidget
+from .input_widgets.text_widgets import TextWidget
 from .input_widgets.track_widgets import MultipleVideoTracksWidget
 from ..app.actions import (
     auto_textplus_style,
@@ -33,6 +35,17 @@ class Definitions:
                 "ignored_tracks": InputDefinition(
                     widget_type=MultipleVideoTracksWidget,
                 ),
+                "library_style": InputDefinition(
+                    widget_type=TextWidget,
+                    args={"placeholder_text": "style name"},
+                ),
+                "dry_run": InputDefinition(
+                    widget_type=BoolWidget,
+                    args={
+                        "text": "Only plan, change nothing",
+                        "selected": types.get_pydantic_field_default(auto_textplus_style.Inputs, "dry_run"),
+                    },
+                ),
             },
         ),
         sync_textplus_style.Action: ActionDefinition(
@@ -41,6 +54,35 @@ class Definitions:
                 "tracks": InputDefinition(
                     widget_type=MultipleVideoTracksWidget,
                 ),
+                "library_style": InputDefinition(
+                    widget_type=TextWidget,
+                    args={"placeholder_text": "style name"},
+                ),
+                "save_to_library": InputDefinition(
+                    widget_type=TextWidget,
+                    args={"placeholder_text": "style name"},
+                ),
+                "resume": InputDefinition(
+                    widget_type=BoolWidget,
+                    args={
+                        "text": "Continue from last stopped sync",
+                        "selected": types.get_pydantic_field_default(sync_textplus_style.Inputs, "resume"),
+                    },
+                ),
+                "revalidate": InputDefinition(
+                    widget_type=BoolWidget,
+                    args={
+                        "text": "Read clips first, only restyle those that differ",
+                        "selected": types.get_pydantic_field_default(sync_textplus_style.Inputs, "revalidate"),
+                    },
+                ),
+                "dry_run": InputDefinition(
+                    widget_type=BoolWidget,
+                    args={
+                        "text": "Only plan, change nothing",
+                        "selected": types.get_pydantic_field_default(sync_textplus_style.Inputs, "dry_run"),
+                    },
+                ),
             },
         ),
         import_textplus.Action: ActionDefinition(
@@ -50,6 +92,13 @@ class Definitions:
                     widget_type=LoadFileWidget,
                     args={"file_types": [(".srt", ".srt")]},
                 ),
+                "dry_run": InputDefinition(
+                    widget_type=BoolWidget,
+                    args={
+                        "text": "Only plan, change nothing",
+                        "selected": types.get_pydantic_field_default(import_textplus.Inputs, "dry_run"),
+                    },
+                ),
             },
         ),
         export_textplus.Action: ActionDefinition(
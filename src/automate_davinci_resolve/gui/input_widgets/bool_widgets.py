@@ -0,0 +1,11 @@
+from .checkbox_collection import CheckboxCollection, CheckboxOption
+
+
+class BoolWidget(CheckboxCollection):
+    def __init__(self, name, text, selected=False, *args, **kw):
+        super().__init__(name, *args, **kw)
+
+        self.reset([CheckboxOption(name=text, value=True, selected=selected)])
+
+    def get_data(self):
+        return len(super().get_data()) > 0
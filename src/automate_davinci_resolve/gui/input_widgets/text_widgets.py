@@ -0,0 +1,18 @@
+from customtkinter import CTkEntry
+
+from ..widgets.named_frame import NamedFrame
+
+
+class TextWidget(NamedFrame):
+    def __init__(self, name, placeholder_text="", *args, **kw):
+        super().__init__(name, *args, **kw)
+
+        self.entry = CTkEntry(
+            master=self.content_frame,
+            placeholder_text=placeholder_text,
+        )
+        self.entry.pack(side="left")
+
+    # empty text gives None, for optional inputs
+    def get_data(self):
+        return self.entry.get() or None
@@ -3,14 +3,34 @@ from typing import Optional
 from .checkbox_collection import CheckboxCollection, CheckboxOption
 
 from ...davinci.context import TimelineContext, TimelineDiff
+from ...utils.lru_cache import LruCache
 
 
 class MultipleVideoTracksWidget(CheckboxCollection):
+    timeline_selections_size = 8
+
+    def __init__(self, name, *args, **kw):
+        self.timeline_id = None
+        # selected tracks of other timelines, restored when switching back
+        self.timeline_selections = LruCache(capacity=self.timeline_selections_size)
+
+        super().__init__(name, *args, **kw)
+
     def update(
         self,
         timeline_context: Optional[TimelineContext],
         timeline_diff: Optional[TimelineDiff],
     ):
+        selected_tracks = [option.value for option in self.options if option.selected]
+        timeline_id = timeline_context.id if timeline_context is not None else None
+
+        if timeline_id != self.timeline_id:
+            if self.timeline_id is not None:
+                self.timeline_selections.put(self.timeline_id, selected_tracks)
+
+            selected_tracks = self.timeline_selections.pop(timeline_id, [])
+            self.timeline_id = timeline_id
+
         if timeline_context is None:
             self.reset([])
             return
@@ -25,11 +45,10 @@ class MultipleVideoTracksWidget(CheckboxCollection):
         }
 
         if timeline_diff is not None:
-            for prev_option in self.options:
-                if prev_option.selected:
-                    new_index = timeline_diff.get_new_track_index(prev_option.value)
+            for prev_track in selected_tracks:
+                new_index = timeline_diff.get_new_track_index(prev_track)
 
-                    if new_index is not None:
-                        options[new_index].selected = True
+                if new_index is not None:
+                    options[new_index].selected = True
 
         self.reset(options=list(options.values()))
@@ -1,4 +1,6 @@
 import logging
+import queue
+import threading
 
 
 class TextboxLogHandler(logging.Handler):
@@ -6,6 +8,7 @@ class TextboxLogHandler(logging.Handler):
         super().__init__()
 
         self.textbox = textbox
+        self.records = queue.SimpleQueue()
 
         self.textbox.tag_config(logging.getLevelName(logging.DEBUG), foreground="gray")
         self.textbox.tag_config(logging.getLevelName(logging.INFO))
@@ -13,22 +16,31 @@ class TextboxLogHandler(logging.Handler):
         self.textbox.tag_config(logging.getLevelName(logging.ERROR), foreground="red")
         self.textbox.tag_config(logging.getLevelName(logging.CRITICAL), foreground="purple")
 
+    # may be called from any thread, while tk widgets can only be touched in main thread
     def emit(self, record):
         if self.textbox is None:
             return
 
-        msg = self.format(record) + "\n"
+        self.records.put((self.format(record) + "\n", record.levelname))
+
+    def drain(self):
+        if self.textbox is None or self.records.empty():
+            return
 
         self.textbox.configure(state="normal")
-        self.textbox.insert("end", msg, tags=record.levelname)
+
+        while not self.records.empty():
+            msg, levelname = self.records.get()
+            self.textbox.insert("end", msg, tags=levelname)
+
         self.textbox.configure(state="disabled")
         self.textbox.see("end")
 
     def flush(self):
-        if self.textbox is None:
+        if threading.current_thread() is not threading.main_thread():
             return
 
-        self.textbox.update()
+        self.drain()
 
     def on_destroy(self):
         self.textbox = None
@@ -1,4 +1,4 @@
-from customtkinter import CTkButton, CTkFrame, CTkTextbox, ThemeManager
+from customtkinter import CTkButton, CTkFrame, CTkLabel, CTkProgressBar, CTkTextbox, ThemeManager
 
 from .named_frame import NamedFrame
 from ..definitions import Definitions
@@ -41,12 +41,22 @@ class ActionFrame(CTkFrame):
 
             self.input_widgets[field_name] = input_widget
 
-        self.action_button = CTkButton(self)
-        self.action_button.pack(side="bottom", anchor="e")
+        self.control_frame = CTkFrame(self)
+        self.control_frame.pack(side="bottom", fill="x")
+
+        self.action_button = CTkButton(self.control_frame)
+        self.action_button.pack(side="right")
         self.action_button.configure(command=self.get_action_button_command())
         self.is_start_button = None
         self.set_button(start=True)
 
+        self.progress_bar = CTkProgressBar(self.control_frame)
+        self.progress_bar.pack(side="left", padx=10)
+        self.progress_bar.set(0)
+        self.progress_label = CTkLabel(self.control_frame, text="")
+        self.progress_label.pack(side="left", fill="x", expand=True)
+        self.progress = None
+
     def get_action_button_command(self):
         def command():
             if self.is_start_button:
@@ -70,6 +80,19 @@ class ActionFrame(CTkFrame):
                     timeline_diff=app_context.resolve_context.timeline_diff,
                 )
 
+    # progress is published by the action from the poller thread, only the last one is shown.
+    # contexts are not posted while start() runs, so the button follows the action status here, on every tick
+    def update_progress(self):
+        self.set_button(start=(not self.action.is_starting))
+        progress = self.action.progress
+
+        if progress is self.progress:
+            return
+
+        self.progress = progress
+        self.progress_bar.set(progress.fraction if progress is not None else 0)
+        self.progress_label.configure(text=progress.format() if progress is not None else "")
+
     def set_button(self, start: bool):
         if start == self.is_start_button:
             return
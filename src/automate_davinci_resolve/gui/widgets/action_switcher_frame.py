@@ -73,6 +73,10 @@ class ActionSwitcherFrame(CTkFrame):
         for action_ui in self.action_ui.values():
             action_ui.frame.update(app_context)
 
+    def update_progress(self):
+        for action_ui in self.action_ui.values():
+            action_ui.frame.update_progress()
+
     def get_switch_command(self, action_name):
         def command():
             self.action_ui[action_name].frame.tkraise()
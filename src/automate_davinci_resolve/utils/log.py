@@ -62,8 +62,11 @@ class Log:
     @contextmanager
     def prefix(cls, text):
         cls.prefixes.append(text)
-        yield
-        cls.prefixes.pop()
+
+        try:
+            yield
+        finally:
+            cls.prefixes.pop()
 
 
 debug = Log.debug
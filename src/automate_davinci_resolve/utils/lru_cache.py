@@ -0,0 +1,34 @@
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class LruCache:
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.entries: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key: Hashable):
+        return key in self.entries
+
+    def get(self, key: Hashable, default: Optional[Any] = None):
+        if key not in self.entries:
+            return default
+
+        self.entries.move_to_end(key)
+        return self.entries[key]
+
+    def put(self, key: Hashable, value: Any):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Optional[Any] = None):
+        return self.entries.pop(key, default)
+
+    def clear(self):
+        self.entries.clear()
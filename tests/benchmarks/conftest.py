@@ -0,0 +1,116 @@
+import copy
+import json
+import platform
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from automate_davinci_resolve.davinci.getter_cache import GetterCache
+from automate_davinci_resolve.davinci.textplus_style import StyleFingerprints
+from .timeline_generator import TimelineShape, generate_timeline
+
+
+class BenchmarkRunner:
+    def __init__(self, resolve_app, rounds: int, results: list[dict]):
+        self.resolve_app = resolve_app
+        self.rounds = rounds
+        self.results = results
+
+    def __call__(self, name: str, func):
+        timings = []
+        calls = []
+        calls_by_method = None
+        result = None
+        timeline_data = self.resolve_app.get_mocked_current_timeline()
+        initial_timeline_data = copy.deepcopy(timeline_data)
+
+        for round in range(self.rounds):
+            # actions edit the mocked timeline and remember applied styles, every round starts from the same state
+            if round > 0:
+                timeline_data.clear()
+                timeline_data.update(copy.deepcopy(initial_timeline_data))
+
+            StyleFingerprints.clear()
+            GetterCache.new_generation()
+            self.resolve_app.reset_call_counts()
+
+            start_time = time.perf_counter()
+            result = func()
+            timings.append(time.perf_counter() - start_time)
+
+            calls.append(sum(self.resolve_app.call_counts.values()))
+
+            if calls_by_method is None:
+                calls_by_method = dict(self.resolve_app.call_counts.most_common())
+
+        self.results.append(
+            {
+                "name": name,
+                "rounds": self.rounds,
+                "min": min(timings),
+                "mean": sum(timings) / len(timings),
+                "max": max(timings),
+                "calls": calls[0],
+                "calls_per_round": calls,
+                "calls_by_method": calls_by_method,
+            }
+        )
+
+        return result
+
+
+@pytest.fixture(scope="session")
+def benchmark_shape(pytestconfig):
+    return TimelineShape(track_count=pytestconfig.getoption("--benchmark-tracks"), clip_count=pytestconfig.getoption("--benchmark-clips"))
+
+
+@pytest.fixture(scope="session")
+def benchmark_timeline_data(benchmark_shape):
+    return generate_timeline(benchmark_shape)
+
+
+@pytest.fixture(scope="session")
+def benchmark_results(pytestconfig, benchmark_shape):
+    results = []
+
+    yield results
+
+    json_path = pytestconfig.getoption("--benchmark-json")
+
+    if json_path is None:
+        return
+
+    Path(json_path).parent.mkdir(parents=True, exist_ok=True)
+    Path(json_path).write_text(
+        json.dumps(
+            {
+                "created_at": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "shape": benchmark_shape._asdict(),
+                "latency": pytestconfig.getoption("--benchmark-latency"),
+                "results": results,
+            },
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+
+
+@pytest.fixture
+def benchmark_resolve_app(pytestconfig, resolve_app, benchmark_timeline_data):
+    resolve_app.mock_current_timeline(copy.deepcopy(benchmark_timeline_data))
+
+    if pytestconfig.getoption("--benchmark-latency") == "realistic":
+        from ..utils.resolve_mock import MockLatency  # resolve_mock needs the dummy scripting module from pytest_configure
+
+        resolve_app.set_latency(MockLatency.realistic())
+
+    return resolve_app
+
+
+@pytest.fixture
+def benchmark(pytestconfig, benchmark_resolve_app, benchmark_results):
+    return BenchmarkRunner(benchmark_resolve_app, pytestconfig.getoption("--benchmark-rounds"), benchmark_results)
@@ -0,0 +1,75 @@
+from datetime import timedelta
+
+import pytest
+import srt
+
+from automate_davinci_resolve.app.actions import export_textplus, import_textplus, sync_textplus_style
+from automate_davinci_resolve.app.actions.export_textplus import SubtitleModeMap
+from automate_davinci_resolve.app.inputs.tracks import MultipleVideoTracksInput
+from automate_davinci_resolve.davinci.context import TimelineDiff
+
+pytestmark = pytest.mark.benchmark
+
+
+class TestTimelineBenchmarks:
+    def test_capture_context(self, benchmark, benchmark_resolve_app):
+        timeline_context = benchmark("capture_context", lambda: benchmark_resolve_app.get_current_timeline().capture_context())
+
+        benchmark("capture_context_unchanged", lambda: benchmark_resolve_app.get_current_timeline().capture_context(timeline_context))
+
+    def test_timeline_diff(self, benchmark, benchmark_resolve_app, benchmark_shape):
+        old_timeline_context = benchmark_resolve_app.get_current_timeline().capture_context()
+
+        # a typical editing session between two updates
+        benchmark_resolve_app.add_mocked_items(1, [{"id": f"new-{i}", "start": 0, "end": 30} for i in range(100)])
+        benchmark_resolve_app.remove_mocked_items(2, {f"2-{i}" for i in range(100)})
+        benchmark_resolve_app.swap_mocked_tracks(3, 4)
+        benchmark_resolve_app.update()
+
+        new_timeline_context = benchmark("capture_context_changed", lambda: benchmark_resolve_app.get_current_timeline().capture_context(old_timeline_context))
+        timeline_diff = benchmark("timeline_diff", lambda: TimelineDiff.create(old_timeline_context, new_timeline_context))
+
+        assert timeline_diff.get_new_track_index(3) == 4
+
+
+class TestActionBenchmarks:
+    def test_export_textplus(self, benchmark, benchmark_resolve_app):
+        action = export_textplus.Action()
+        timeline = benchmark_resolve_app.get_current_timeline()
+        mode_map = SubtitleModeMap(export_textplus.Inputs.construct())
+
+        text_clip_infos = benchmark("export_textplus.get_text_clip_infos", lambda: action.get_text_clip_infos(timeline, mode_map))
+        subtitles = benchmark("export_textplus.get_subtitles", lambda: action.get_subtitles(text_clip_infos, timeline.get_timecode_settings()))
+
+        assert len(subtitles) > 0
+
+    def test_import_textplus(self, benchmark, benchmark_shape):
+        action = import_textplus.Action()
+        subtitles = [
+            srt.Subtitle(index=i, start=timedelta(seconds=i * 2), end=timedelta(seconds=i * 2 + 1.5), content=f"Line {i}")
+            for i in range(benchmark_shape.clip_count)
+        ]
+
+        subtitle_infos = benchmark("import_textplus.prepare_subtitle_infos", lambda: action.prepare_subtitle_infos(subtitles))
+
+        assert len(subtitle_infos) == benchmark_shape.clip_count
+
+    def test_sync_textplus_style(self, benchmark, benchmark_resolve_app, app_settings):
+        action = sync_textplus_style.Action()
+        input_data = sync_textplus_style.Inputs.construct(tracks=MultipleVideoTracksInput([1, 2]))
+
+        benchmark(
+            "sync_textplus_style",
+            lambda: action.start(app_settings=app_settings, resolve_app=benchmark_resolve_app, input_data=input_data),
+        )
+
+    @pytest.mark.parametrize("worker_count", [1, 4])
+    def test_sync_textplus_style_workers(self, benchmark, benchmark_resolve_app, app_settings, worker_count):
+        action = sync_textplus_style.Action()
+        input_data = sync_textplus_style.Inputs.construct(tracks=MultipleVideoTracksInput([1, 2]))
+        app_settings.worker_count = worker_count
+
+        benchmark(
+            f"sync_textplus_style_workers_{worker_count}",
+            lambda: action.start(app_settings=app_settings, resolve_app=benchmark_resolve_app, input_data=input_data),
+        )
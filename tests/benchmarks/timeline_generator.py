@@ -0,0 +1,74 @@
+import random
+from typing import NamedTuple
+
+from automate_davinci_resolve.davinci.enums import ClipColor
+
+
+class TimelineShape(NamedTuple):
+    track_count: int = 50
+    clip_count: int = 20000  # spread over all tracks
+    clip_colors: tuple[str, ...] = ("", ClipColor.Beige.value, ClipColor.Brown.value, ClipColor.Orange.value)
+    overlap_ratio: float = 0.1
+    textplus_ratio: float = 0.95
+    frame_rate: float = 60.0
+    seed: int = 0
+
+
+# Builds mocked timeline data (see ResolveTimelineMock) of a given shape.
+# Clips are laid out back to back on each track, some overlapping the previous clip.
+def generate_timeline(shape: TimelineShape, timeline_id: str = "benchmark"):
+    rng = random.Random(shape.seed)
+    start_frame = int(3600 * shape.frame_rate)
+    tracks = {}
+
+    for track_index in range(1, shape.track_count + 1):
+        clip_count = shape.clip_count // shape.track_count + (1 if track_index <= shape.clip_count % shape.track_count else 0)
+        tracks[track_index] = {"name": f"Subtitles {track_index}", "items": generate_items(rng, shape, track_index, clip_count, start_frame)}
+
+    return {
+        "id": timeline_id,
+        "name": f"Benchmark {shape.track_count}x{shape.clip_count}",
+        "setting": {"timelineFrameRate": shape.frame_rate},
+        "start_timecode": "01:00:00:00",
+        "tracks": {"video": tracks},
+    }
+
+
+def generate_items(rng: random.Random, shape: TimelineShape, track_index: int, clip_count: int, start_frame: int):
+    items = []
+    frame = start_frame
+
+    for clip_index in range(clip_count):
+        frames = rng.randint(30, 300)
+
+        if clip_index > 0 and rng.random() < shape.overlap_ratio:
+            frame -= rng.randint(1, 30)
+
+        item = {
+            "id": f"{track_index}-{clip_index}",
+            "name": "Text+",
+            "start": frame,
+            "end": frame + frames,
+            "clip_color": rng.choice(shape.clip_colors),
+            "fusion_comps": {},
+        }
+
+        if rng.random() < shape.textplus_ratio:
+            item["fusion_comps"][1] = {"TextPlus": generate_textplus(rng, f"Line {track_index}-{clip_index}")}
+
+        items.append(item)
+        frame += frames + rng.randint(0, 60)
+
+    return items
+
+
+def generate_textplus(rng: random.Random, text: str):
+    return {
+        "StyledText": text,
+        "Font": rng.choice(["Open Sans", "Noto Sans", "Arial"]),
+        "Size": rng.choice([0.06, 0.08, 0.1]),
+        "Red1": rng.random(),
+        "Green1": rng.random(),
+        "Blue1": rng.random(),
+        "CenterY": 0.1,
+    }
@@ -1,11 +1,36 @@
 import sys
 
+import pytest
+
 
 class DummyModule:
     pass
 
 
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmark")
+    group.addoption("--benchmark", action="store_true", help="run benchmarks under tests/benchmarks")
+    group.addoption("--benchmark-json", default=None, help="write benchmark results to this JSON file")
+    group.addoption("--benchmark-tracks", type=int, default=50, help="video tracks of the synthetic timeline")
+    group.addoption("--benchmark-clips", type=int, default=20000, help="clips of the synthetic timeline, spread over all tracks")
+    group.addoption("--benchmark-rounds", type=int, default=3, help="rounds to run each benchmark")
+    group.addoption("--benchmark-latency", choices=["none", "realistic"], default="none", help="simulated scripting call latency")
+
+
 def pytest_configure(config):
     sys.modules["DaVinciResolveScript"] = DummyModule
 
+    config.addinivalue_line("markers", "benchmark: performance benchmark, only run with --benchmark")
+    config.addinivalue_line("markers", "rpc_budget(per_item=None, per_track=None, total=None): max scripting calls for the rpc_budget fixture")
     config.pluginmanager.import_plugin("tests.plugin")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--benchmark"):
+        return
+
+    skip_benchmark = pytest.mark.skip(reason="need --benchmark option to run")
+
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
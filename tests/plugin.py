@@ -1,9 +1,12 @@
 import pytest
 
 from .utils.resolve_mock import ResolveAppMock
+from .utils.rpc_budget import RpcBudget
 from .utils.settings import TestSettings
 from automate_davinci_resolve.app.app import App
 from automate_davinci_resolve.app.context import InputContext
+from automate_davinci_resolve.davinci.style_library import StyleLibrary
+from automate_davinci_resolve.davinci.textplus_style import StyleFingerprints
 from automate_davinci_resolve.gui.app import GuiApp
 
 
@@ -13,8 +16,22 @@ def resolve_app():
 
 
 @pytest.fixture
-def app(resolve_app):
-    return App(resolve_app)
+def rpc_budget(request, resolve_app):
+    marker = request.node.get_closest_marker("rpc_budget")
+
+    if marker is None:
+        raise pytest.UsageError("rpc_budget fixture needs @pytest.mark.rpc_budget(per_item=..., per_track=..., total=...)")
+
+    return RpcBudget(resolve_app, **marker.kwargs)
+
+
+@pytest.fixture
+def app(resolve_app, tmp_path):
+    app = App(resolve_app)
+    # actions write settings files to temp_dir, each test gets its own
+    app.settings.temp_dir = tmp_path
+
+    return app
 
 
 @pytest.fixture
@@ -36,3 +53,5 @@ def test_settings():
 def clean():
     yield
     InputContext.set(None)
+    StyleFingerprints.clear()
+    StyleLibrary.libraries.clear()
@@ -2,8 +2,10 @@ from pydantic import BaseModel
 
 from automate_davinci_resolve.app.actions.action_base import ActionBase
 from automate_davinci_resolve.app.actions.action_control import ActionControl
+from automate_davinci_resolve.app.events import EventBus, ItemsAdded, TrackRemoved
 from automate_davinci_resolve.davinci.enums import ResolveStatus
 from automate_davinci_resolve.davinci.context import TimelineContext
+from automate_davinci_resolve.utils import log
 
 
 class MyInput(BaseModel):
@@ -35,6 +37,34 @@ class MyBackgroundAction(MyAction):
         self.last_input_data = input_data
 
 
+class MyCancelledAction(MyAction):
+    def start(self, input_data, cancellation_token):
+        self.start_count += 1
+
+        with log.prefix("[test]"):
+            # as if the GUI stopped the action while it runs
+            cancellation_token.cancel()
+            cancellation_token.raise_if_cancelled()
+
+
+class MyProgressAction(MyAction):
+    def start(self, input_data, progress_reporter):
+        progress_reporter.start_phase("Counting", 3)
+        progress_reporter.advance(3)
+        progress_reporter.finish_phase()
+
+
+class MyEventAction(MyAction):
+    def __init__(self):
+        super().__init__()
+        self.event_types = (ItemsAdded,)
+        self.last_events = None
+
+    def update(self, events, input_data):
+        self.update_count += 1
+        self.last_events = events
+
+
 class TestActionControl:
     dummy_timeline_context = TimelineContext(id="", name="", video_tracks={})
 
@@ -81,6 +111,33 @@ class TestActionControl:
         assert action_control.action.start_count == 1
         assert background_action_control.action.start_count == 1
 
+    def test_cancel(self, app_settings, resolve_app):
+        action_control = ActionControl(MyCancelledAction())
+        common_args = (app_settings, ResolveStatus.TimelineOpen, resolve_app, self.dummy_timeline_context, {})
+
+        action_control.start(*common_args)
+
+        assert action_control.action.start_count == 1
+        assert action_control.error_count == 0
+        assert not action_control.is_starting
+        assert log.Log.prefixes == []
+
+        # each start gets a fresh token
+        action_control.start(*common_args)
+
+        assert action_control.action.start_count == 2
+
+    def test_progress(self, app_settings, resolve_app):
+        action_control = ActionControl(MyProgressAction())
+
+        assert action_control.progress is None
+
+        action_control.start(app_settings, ResolveStatus.TimelineOpen, resolve_app, self.dummy_timeline_context, {})
+
+        assert action_control.progress.phase == "Counting"
+        assert action_control.progress.done == 3
+        assert action_control.progress.fraction == 1.0
+
     def test_validate_input(self, app_settings, resolve_app):
         action_control = ActionControl(MyAction())
         common_args = (app_settings, ResolveStatus.TimelineOpen, resolve_app, self.dummy_timeline_context)
@@ -120,3 +177,21 @@ class TestActionControl:
         background_action_control.update(*common_update_args)
         assert background_action_control.input_data == MyInput(text="abc")
         assert background_action_control.action.update_count == 2
+
+    def test_update_event_action(self, app_settings, resolve_app):
+        event_bus = EventBus()
+        action_control = ActionControl(MyEventAction(), event_bus)
+        common_update_args = (app_settings, ResolveStatus.TimelineOpen, resolve_app, self.dummy_timeline_context, None)
+
+        action_control.update(*common_update_args)
+        assert action_control.action.update_count == 0
+        assert action_control.status_control.is_started()
+
+        event_bus.publish(TrackRemoved(old_index=1))
+        event_bus.publish(ItemsAdded(old_track_index=2, track_index=1, item_ids={"A"}))
+        action_control.update(*common_update_args)
+        assert action_control.action.update_count == 1
+        assert action_control.action.last_events == [ItemsAdded(old_track_index=2, track_index=1, item_ids={"A"})]
+
+        action_control.update(*common_update_args)
+        assert action_control.action.update_count == 1
@@ -2,6 +2,7 @@ import pytest
 
 from automate_davinci_resolve.app.actions import auto_textplus_style
 from automate_davinci_resolve.app.context import InputContext
+from automate_davinci_resolve.app.events import create_timeline_events
 from automate_davinci_resolve.davinci.context import TimelineDiff, Diff
 
 
@@ -45,18 +46,20 @@ class TestAutoTextplusStyle:
             }
         )
 
-    def test_basic(self, app_settings, resolve_app):
+    @pytest.mark.rpc_budget(per_item=6, per_track=3)
+    def test_basic(self, app_settings, resolve_app, rpc_budget):
         action = auto_textplus_style.Action()
         timeline_diff = TimelineDiff()
         timeline_diff.diff = {"added": {"video_tracks": {1: {"items": {"root": {"C"}}}}}}
         input_data = auto_textplus_style.Inputs()
 
-        action.update(
-            app_settings=app_settings,
-            resolve_app=resolve_app,
-            timeline_diff=timeline_diff,
-            input_data=input_data,
-        )
+        with rpc_budget.measure(items=2, tracks=1):  # reference clip + new clip
+            action.update(
+                app_settings=app_settings,
+                resolve_app=resolve_app,
+                events=create_timeline_events(timeline_diff),
+                input_data=input_data,
+            )
 
         assert resolve_app.get_mocked_current_timeline()["tracks"]["video"] == {
             1: {
@@ -99,7 +102,7 @@ class TestAutoTextplusStyle:
         action.update(
             app_settings=app_settings,
             resolve_app=resolve_app,
-            timeline_diff=timeline_diff,
+            events=create_timeline_events(timeline_diff),
             input_data=input_data,
         )
 
@@ -152,7 +155,7 @@ class TestAutoTextplusStyle:
         action.update(
             app_settings=app_settings,
             resolve_app=resolve_app,
-            timeline_diff=timeline_diff,
+            events=create_timeline_events(timeline_diff),
             input_data=input_data,
         )
 
@@ -186,3 +189,76 @@ class TestAutoTextplusStyle:
                 ]
             },
         }
+
+    def test_cached_reference(self, app, resolve_app):
+        app.update()
+
+        resolve_app.add_mocked_items(1, [{"id": "F", "fusion_comps": {1: {"TextPlus": {"StyledText": "Item F", "Size": 60}}}}])
+        app.update()
+
+        resolve_app.add_mocked_items(1, [{"id": "G", "fusion_comps": {1: {"TextPlus": {"StyledText": "Item G", "Size": 70}}}}])
+        resolve_app.reset_call_counts()
+        app.update()
+
+        # leading clips are not visited again, the reference is saved once to see edits, the new clip is only loaded
+        assert resolve_app.call_counts["GetFusionCompByIndex"] == 2
+        assert resolve_app.call_counts["SaveSettings"] == 1
+        assert resolve_app.call_counts["LoadSettings"] == 1
+        assert [item["fusion_comps"][1]["TextPlus"]["Size"] for item in resolve_app.get_mocked_current_timeline()["tracks"]["video"][1]["items"]] == [
+            10,
+            20,
+            30,
+            10,
+            10,
+        ]
+
+        # a new 1st Text+ clip becomes the reference
+        resolve_app.get_mocked_track(1)["items"].insert(0, {"id": "H", "fusion_comps": {1: {"TextPlus": {"StyledText": "Item H", "Size": 80}}}})
+        resolve_app.add_mocked_items(1, [{"id": "I", "fusion_comps": {1: {"TextPlus": {"StyledText": "Item I", "Size": 90}}}}])
+        app.update()
+
+        assert resolve_app.update_mocked_item("I")["fusion_comps"][1]["TextPlus"] == {"StyledText": "Item I", "Size": 80}
+
+    @pytest.mark.rpc_budget(per_item=6.5, total=80)  # capture reads each new id once
+    def test_steady_state(self, app, resolve_app, rpc_budget):
+        app.update()
+        resolve_app.add_mocked_items(1, [{"id": "F", "fusion_comps": {1: {"TextPlus": {"StyledText": "Item F", "Size": 60}}}}])
+        app.update()
+
+        resolve_app.add_mocked_items(1, [{"id": f"G{i}", "fusion_comps": {1: {"TextPlus": {"StyledText": f"Item G{i}", "Size": 70}}}} for i in range(10)])
+
+        # per new clip: find its Text+, read its text and load the style. The reference costs a few calls per update
+        with rpc_budget.measure(items=10 + 1):
+            app.update()
+
+        assert resolve_app.call_counts["SaveSettings"] == 1
+        assert resolve_app.call_counts["LoadSettings"] == 10
+        assert [item["fusion_comps"][1]["TextPlus"]["Size"] for item in resolve_app.get_mocked_track(1)["items"][3:]] == [10] * 11
+
+    def test_reference_edited(self, app, resolve_app):
+        app.update()
+        resolve_app.add_mocked_items(1, [{"id": "F", "fusion_comps": {1: {"TextPlus": {"StyledText": "Item F", "Size": 60}}}}])
+        app.update()
+
+        # edited in Fusion, the timeline diff does not show it
+        resolve_app.get_mocked_track(1)["items"][0]["fusion_comps"][1]["TextPlus"]["Size"] = 15
+        resolve_app.add_mocked_items(1, [{"id": "G", "fusion_comps": {1: {"TextPlus": {"StyledText": "Item G", "Size": 70}}}}])
+        app.update()
+
+        assert resolve_app.update_mocked_item("G")["fusion_comps"][1]["TextPlus"] == {"StyledText": "Item G", "Size": 15}
+
+    def test_dry_run(self, app_settings, resolve_app):
+        action = auto_textplus_style.Action()
+        timeline_diff = TimelineDiff()
+        timeline_diff.diff = {"added": {"video_tracks": {1: {"items": {"root": {"B", "C"}}}}}}
+
+        with resolve_app.measure_rpc_calls() as stats:
+            action.update(
+                app_settings=app_settings,
+                resolve_app=resolve_app,
+                events=create_timeline_events(timeline_diff),
+                input_data=auto_textplus_style.Inputs(dry_run=True),
+            )
+
+        assert stats.get_count("LoadSettings") == 0
+        assert [item["fusion_comps"][1]["TextPlus"]["Size"] for item in resolve_app.get_mocked_track(1)["items"]] == [10, 20, 30]
@@ -1,5 +1,6 @@
 from datetime import timedelta
 
+import pytest
 import srt
 
 from automate_davinci_resolve.app.actions import export_textplus
@@ -7,7 +8,8 @@ from automate_davinci_resolve.app.actions.export_textplus import SubtitleModeMap
 
 
 class TestExportTextplus:
-    def test_create_subtitles_from_timeline(self, resolve_app, test_settings):
+    @pytest.mark.rpc_budget(per_item=7, per_track=4)  # GetFusionCompCount is read before the comp
+    def test_create_subtitles_from_timeline(self, resolve_app, test_settings, rpc_budget):
         resolve_app.mock_current_timeline(
             {
                 "setting": {"timelineFrameRate": 60.0},
@@ -69,8 +71,9 @@ class TestExportTextplus:
         action = export_textplus.Action()
         timeline = resolve_app.get_current_timeline()
 
-        subtitle_infos = action.get_text_clip_infos(timeline, SubtitleModeMap(inputs))
-        subtitles = action.get_subtitles(subtitle_infos, timeline.get_timecode_settings())
+        with rpc_budget.measure(items=7, tracks=3):
+            subtitle_infos = action.get_text_clip_infos(timeline, SubtitleModeMap(inputs))
+            subtitles = action.get_subtitles(subtitle_infos, timeline.get_timecode_settings())
 
         expected_subtitles = [
             srt.Subtitle(index=None, start=timedelta(0), end=timedelta(seconds=3, microseconds=233333), content="normal"),
@@ -1,8 +1,10 @@
 import inspect
+from datetime import timedelta
 
 import srt
 
 from automate_davinci_resolve.app.actions import import_textplus
+from automate_davinci_resolve.app.inputs.subtitles import SubtitleFileInput
 from automate_davinci_resolve.app.actions.import_textplus import SubtitleInfo
 
 
@@ -74,3 +76,21 @@ class TestImportTextplus:
                 SubtitleInfo(text_content="所有陆地生命归根结底都依赖於淡水", record_frame=219474, frames=331),
             ]
         )
+
+    def test_plan(self, resolve_app):
+        resolve_app.mock_current_project({"setting": {"timelineFrameRate": 60.0}})
+        action = import_textplus.Action()
+        subtitle_file = SubtitleFileInput("subtitles.srt")
+        subtitle_file.parsed = [
+            srt.Subtitle(index=1, start=timedelta(seconds=1), end=timedelta(seconds=3), content="A"),
+            srt.Subtitle(index=2, start=timedelta(seconds=2), end=timedelta(seconds=4), content="Overlapping"),
+            srt.Subtitle(index=3, start=timedelta(seconds=5), end=timedelta(seconds=6), content="B"),
+        ]
+        resolve_app.reset_call_counts()
+
+        plan = action.plan(import_textplus.Inputs.construct(subtitle_file=subtitle_file, dry_run=True))
+
+        assert dict(plan.changes) == {"clips to insert": 2, "overlapping subtitles to skip": 1}
+        assert plan.calls["SetInput"] == 2
+        assert plan.calls["ImportProject"] == 1
+        assert sum(resolve_app.call_counts.values()) == 0  # nothing is imported to plan
@@ -0,0 +1,247 @@
+import pytest
+from pydantic import ValidationError
+
+from automate_davinci_resolve.app.actions import sync_textplus_style
+from automate_davinci_resolve.app.actions.cancellation import ActionCancelled, CancellationToken
+from automate_davinci_resolve.app.inputs.tracks import MultipleVideoTracksInput
+from automate_davinci_resolve.davinci.style_library import StyleLibrary
+from automate_davinci_resolve.davinci.textplus_style import StyleFingerprints
+
+
+class TestSyncTextplusStyle:
+    def test_skip_matching_clips(self, app_settings, resolve_app):
+        resolve_app.mock_current_timeline(
+            {
+                "tracks": {
+                    "video": {
+                        1: {
+                            "items": [
+                                {"id": f"{i}", "fusion_comps": {1: {"TextPlus": {"StyledText": f"Item {i}", "Size": 20 if i in (3, 7) else 10}}}}
+                                for i in range(10)
+                            ]
+                        },
+                    }
+                }
+            }
+        )
+        input_data = sync_textplus_style.Inputs.construct(tracks=MultipleVideoTracksInput([1]), revalidate=True)
+
+        with resolve_app.measure_rpc_calls() as stats:
+            sync_textplus_style.Action().start(app_settings=app_settings, resolve_app=resolve_app, input_data=input_data)
+
+        assert stats.get_count("SaveSettings") == 10  # reference and every clip read first
+        assert stats.get_count("LoadSettings") == 2  # only drifted clips are restyled
+        assert stats.get_count("GetInput") == 0
+        assert [item["fusion_comps"][1]["TextPlus"] for item in resolve_app.get_mocked_current_timeline()["tracks"]["video"][1]["items"]] == [
+            {"StyledText": f"Item {i}", "Size": 10} for i in range(10)
+        ]
+
+    @pytest.mark.rpc_budget(per_item=6, per_track=2)
+    def test_resync_drifted(self, app_settings, resolve_app, rpc_budget):
+        resolve_app.mock_current_timeline(
+            {
+                "tracks": {
+                    "video": {1: {"items": [{"id": f"{i}", "fusion_comps": {1: {"TextPlus": {"StyledText": f"Item {i}", "Size": i}}}} for i in range(10)]}}
+                }
+            }
+        )
+        action = sync_textplus_style.Action()
+        input_data = sync_textplus_style.Inputs.construct(tracks=MultipleVideoTracksInput([1]))
+        action.start(app_settings=app_settings, resolve_app=resolve_app, input_data=input_data)
+
+        # edited in Fusion after the sync, while still known in style
+        resolve_app.get_mocked_track(1)["items"][5]["fusion_comps"][1]["TextPlus"]["Size"] = 30
+
+        # clips are loaded without being read first, known fingerprints do not skip them
+        with rpc_budget.measure(items=10, tracks=1):
+            action.start(app_settings=app_settings, resolve_app=resolve_app, input_data=input_data)
+
+        assert resolve_app.call_counts["SaveSettings"] == 1
+        assert resolve_app.call_counts["GetInput"] == 9
+        assert resolve_app.call_counts["LoadSettings"] == 9
+        assert resolve_app.get_mocked_track(1)["items"][5]["fusion_comps"][1]["TextPlus"]["Size"] == 0
+
+        resolve_app.get_mocked_track(1)["items"][7]["fusion_comps"][1]["TextPlus"]["Size"] = 30
+        resolve_app.reset_call_counts()
+        action.start(
+            app_settings=app_settings,
+            resolve_app=resolve_app,
+            input_data=sync_textplus_style.Inputs.construct(tracks=MultipleVideoTracksInput([1]), revalidate=True),
+        )
+
+        # revalidation reads every clip, and only loads the drifted one
+        assert resolve_app.call_counts["SaveSettings"] == 10
+        assert resolve_app.call_counts["LoadSettings"] == 1
+        assert resolve_app.get_mocked_track(1)["items"][7]["fusion_comps"][1]["TextPlus"]["Size"] == 0
+
+    def test_workers(self, app_settings, resolve_app):
+        resolve_app.mock_current_timeline(
+            {
+                "tracks": {
+                    "video": {
+                        track_index: {
+                            "items": [
+                                {"id": f"{track_index}-{i}", "fusion_comps": {1: {"TextPlus": {"StyledText": f"Item {i}", "Size": track_index * 10 + i}}}}
+                                for i in range(20)
+                            ]
+                        }
+                        for track_index in (1, 2)
+                    }
+                }
+            }
+        )
+        input_data = sync_textplus_style.Inputs.construct(tracks=MultipleVideoTracksInput([1, 2]))
+        app_settings.worker_count = 3
+        action = sync_textplus_style.Action()
+        action.chunk_size = 4
+
+        with resolve_app.measure_rpc_calls() as stats:
+            action.start(app_settings=app_settings, resolve_app=resolve_app, input_data=input_data)
+
+        # each worker opens its own connection once
+        assert 1 <= stats.get_count("GetProjectManager") <= 3
+        assert stats.get_count("LoadSettings") == 38
+        assert stats.get_count("GetInput") == 38
+
+        for track_index in (1, 2):
+            assert [item["fusion_comps"][1]["TextPlus"] for item in resolve_app.get_mocked_track(track_index)["items"]] == [
+                {"StyledText": f"Item {i}", "Size": track_index * 10} for i in range(20)
+            ]
+
+    def test_cancel_and_resume(self, app_settings, resolve_app):
+        resolve_app.mock_current_timeline(
+            {
+                "tracks": {
+                    "video": {
+                        1: {"items": [{"id": f"{i}", "fusion_comps": {1: {"TextPlus": {"StyledText": f"Item {i}", "Size": i}}}} for i in range(10)]},
+                    }
+                }
+            }
+        )
+        action = sync_textplus_style.Action()
+        action.chunk_size = 3
+        cancellation_token = CancellationToken()
+        sync_clips = action.sync_clips
+        job_starts = []
+
+        def cancel_after_2_jobs(app_settings, timeline, worker_index, job, *args):
+            if len(job_starts) == 2:
+                cancellation_token.cancel()
+
+            job_starts.append(job.start)
+            return sync_clips(app_settings, timeline, worker_index, job, *args)
+
+        action.sync_clips = cancel_after_2_jobs
+        input_data = sync_textplus_style.Inputs.construct(tracks=MultipleVideoTracksInput([1]), resume=False)
+
+        with pytest.raises(ActionCancelled):
+            action.start(app_settings=app_settings, resolve_app=resolve_app, input_data=input_data, cancellation_token=cancellation_token)
+
+        assert [item["fusion_comps"][1]["TextPlus"]["Size"] for item in resolve_app.get_mocked_track(1)["items"]] == [0] * 7 + [7, 8, 9]
+
+        job_starts.clear()
+        action.start(
+            app_settings=app_settings,
+            resolve_app=resolve_app,
+            input_data=sync_textplus_style.Inputs.construct(tracks=MultipleVideoTracksInput([1]), resume=True),
+        )
+
+        # clips done before cancelling are not visited again
+        assert job_starts == [7]
+        assert [item["fusion_comps"][1]["TextPlus"]["Size"] for item in resolve_app.get_mocked_track(1)["items"]] == [0] * 10
+        assert not (app_settings.temp_dir / f"{action.name}.checkpoint.json").exists()
+
+    def test_dry_run(self, app_settings, resolve_app):
+        resolve_app.mock_current_timeline(
+            {
+                "tracks": {
+                    "video": {
+                        1: {
+                            "items": [
+                                {"id": f"{i}", "fusion_comps": {1: {"TextPlus": {"StyledText": f"Item {i}", "Size": 20 if i in (3, 7) else 10}}}}
+                                for i in range(10)
+                            ]
+                        },
+                    }
+                }
+            }
+        )
+        action = sync_textplus_style.Action()
+        input_data = sync_textplus_style.Inputs.construct(tracks=MultipleVideoTracksInput([1]), dry_run=True)
+
+        with resolve_app.measure_rpc_calls() as stats:
+            action.start(app_settings=app_settings, resolve_app=resolve_app, input_data=input_data)
+
+        assert stats.get_count("SaveSettings") == 0
+        assert stats.get_count("LoadSettings") == 0
+
+        # styles are known after a sync, so the plan tells drifted clips apart
+        action.start(app_settings=app_settings, resolve_app=resolve_app, input_data=sync_textplus_style.Inputs.construct(tracks=MultipleVideoTracksInput([1])))
+        resolve_app.get_mocked_track(1)["items"][5]["fusion_comps"][1]["TextPlus"]["Size"] = 30
+        StyleFingerprints.invalidate("5")
+
+        plan = action.plan(app_settings, resolve_app, input_data)
+
+        # every clip is loaded, known fingerprints are not trusted
+        assert dict(plan.changes) == {"clips to restyle": 9}
+        assert plan.calls["SaveSettings"] == 1
+        assert plan.calls["LoadSettings"] == 9
+        assert plan.estimate_seconds() > 0
+
+        plan = action.plan(app_settings, resolve_app, sync_textplus_style.Inputs.construct(tracks=MultipleVideoTracksInput([1]), revalidate=True, dry_run=True))
+
+        assert dict(plan.changes) == {"clips already in style": 8, "clips of unknown style": 1}
+        assert plan.calls["SaveSettings"] == 10  # reference and every clip read first
+        assert plan.calls["LoadSettings"] == 1
+
+    def test_library_style(self, app_settings, resolve_app, tmp_path):
+        app_settings.data_dir = tmp_path
+        resolve_app.mock_current_timeline(
+            {
+                "tracks": {
+                    "video": {1: {"items": [{"id": f"{i}", "fusion_comps": {1: {"TextPlus": {"StyledText": f"Item {i}", "Size": 30 + i}}}} for i in range(3)]}}
+                }
+            }
+        )
+        action = sync_textplus_style.Action()
+        action.start(
+            app_settings=app_settings,
+            resolve_app=resolve_app,
+            input_data=sync_textplus_style.Inputs.construct(tracks=MultipleVideoTracksInput([1]), save_to_library="house"),
+        )
+
+        assert StyleLibrary.open(tmp_path / "styles").names() == ["house"]
+
+        for item_id in ("A", "B"):
+            resolve_app.mock_current_timeline(
+                {
+                    "tracks": {
+                        "video": {
+                            track_index: {
+                                "items": [
+                                    {"id": f"{item_id}{track_index}-{i}", "fusion_comps": {1: {"TextPlus": {"StyledText": f"Item {i}", "Size": i}}}}
+                                    for i in range(5)
+                                ]
+                            }
+                            for track_index in (1, 2)
+                        }
+                    }
+                }
+            )
+
+            with resolve_app.measure_rpc_calls() as stats:
+                action.start(
+                    app_settings=app_settings,
+                    resolve_app=resolve_app,
+                    input_data=sync_textplus_style.Inputs.construct(tracks=MultipleVideoTracksInput([1, 2]), library_style="house"),
+                )
+
+            # all clips take the library style, the 1st clip is not a reference
+            assert stats.get_count("LoadSettings") == 10
+            for track_index in (1, 2):
+                assert [item["fusion_comps"][1]["TextPlus"] for item in resolve_app.get_mocked_track(track_index)["items"]] == [
+                    {"StyledText": f"Item {i}", "Size": 30} for i in range(5)
+                ]
+
+        with pytest.raises(ValidationError):
+            sync_textplus_style.Inputs(tracks=MultipleVideoTracksInput([1]), library_style="house", save_to_library="other")
@@ -1,5 +1,5 @@
 from automate_davinci_resolve.davinci.enums import ResolveStatus
-from automate_davinci_resolve.davinci.context import TrackContext, TimelineItemContext
+from automate_davinci_resolve.davinci.context import Diff, TrackContext, TimelineItemContext
 from automate_davinci_resolve.app.context import InputContext
 
 
@@ -41,3 +41,123 @@ class TestApp:
 
         assert app.context.resolve_context.timeline_context.video_tracks == {1: TrackContext(index=1, name=None, items={"A": TimelineItemContext(id="A")})}
         assert InputContext.get().timeline_context.video_tracks == {1: TrackContext(index=1, name=None, items={"A": TimelineItemContext(id="A")})}
+
+    def test_tick_rpc_stats(self, resolve_app, app):
+        resolve_app.mock_current_timeline({"tracks": {"video": {1: {"items": [{"id": "A"}]}}}})
+
+        app.update()
+
+        assert app.tick_rpc_stats.get_count("GetItemListInTrack") == 1
+        assert app.get_action("auto_textplus_style").rpc_stats.get_count() == 0
+
+    def test_adaptive_update_interval(self, resolve_app, app):
+        resolve_app.mock_current_timeline({"tracks": {"video": {1: {"items": [{"id": "A"}]}}}})
+        refresh_rate = app.get_action("auto_textplus_style").action.refresh_rate
+
+        intervals = [app.update() and app.update_interval for _ in range(6)]
+
+        assert intervals[0] == refresh_rate.min_interval
+        assert intervals == sorted(intervals)
+        assert intervals[-1] == refresh_rate.max_interval
+
+        resolve_app.get_mocked_current_timeline()["tracks"]["video"][1]["items"].append({"id": "B"})
+        app.update()
+
+        assert app.update_interval == refresh_rate.min_interval
+
+    def test_unchanged_timeline(self, resolve_app, app):
+        resolve_app.mock_current_timeline({"id": "T", "tracks": {"video": {1: {"items": [{"id": "A"}]}}}})
+
+        app.update()
+        timeline_context = app.context.resolve_context.timeline_context
+
+        app.update()
+
+        assert app.context.resolve_context.timeline_context is timeline_context
+        assert app.context.resolve_context.timeline_diff.diff == {}
+        assert app.tick_rpc_stats.get_count("GetUniqueId") == 2  # timeline id + first/last item id for fingerprint
+        assert app.tick_rpc_stats.get_count("GetItemListInTrack") == 1  # items are still listed, once per track
+
+        resolve_app.get_mocked_current_timeline()["tracks"]["video"][1]["items"].append({"id": "B"})
+        app.update()
+
+        assert app.context.resolve_context.timeline_context is not timeline_context
+        assert app.context.resolve_context.timeline_diff.diff == {"added": {"video_tracks": {1: {"items": {"root": {"B"}}}}}}
+
+    def test_incremental_capture(self, resolve_app, app):
+        resolve_app.mock_current_timeline(
+            {
+                "id": "T",
+                "tracks": {
+                    "video": {
+                        1: {"items": [{"id": "A1"}, {"id": "A2"}, {"id": "A3"}]},
+                        2: {"items": [{"id": "B1"}, {"id": "B2"}, {"id": "B3"}]},
+                    }
+                },
+            }
+        )
+
+        app.update()
+        old_track_contexts = app.context.resolve_context.timeline_context.video_tracks
+
+        resolve_app.get_mocked_current_timeline()["tracks"]["video"][2]["items"].append({"id": "B4"})
+        app.update()
+        new_track_contexts = app.context.resolve_context.timeline_context.video_tracks
+
+        assert new_track_contexts[1] is old_track_contexts[1]
+        assert list(new_track_contexts[2].items.keys()) == ["B1", "B2", "B3", "B4"]
+        assert app.context.resolve_context.timeline_diff.diff == {"added": {"video_tracks": {2: {"items": {"root": {"B4"}}}}}}
+        assert app.tick_rpc_stats.get_count("GetUniqueId") == 1 + 2 + 2 + 2  # timeline, first/last items, B2, B3
+
+        video_tracks = resolve_app.get_mocked_current_timeline()["tracks"]["video"]
+        video_tracks[1], video_tracks[2] = video_tracks[2], video_tracks[1]
+        app.update()
+
+        assert app.context.resolve_context.timeline_context.video_tracks[2].items is old_track_contexts[1].items
+        assert app.context.resolve_context.timeline_context.video_tracks[1].items is new_track_contexts[2].items
+        assert app.context.resolve_context.timeline_diff.diff == {
+            "changed": {"video_tracks": {1: {"index": Diff(1, 2)}, 2: {"index": Diff(2, 1)}}},
+        }
+
+    def test_switch_timeline(self, resolve_app, app):
+        resolve_app.mock_current_timeline({"id": "T1", "tracks": {"video": {1: {"items": [{"id": "A"}]}, 2: {"items": [{"id": "B"}]}}}})
+        project_data = resolve_app.mock_data["project_manager"]["current_project"]
+        timeline1 = project_data["current_timeline"]
+        timeline2 = {**timeline1, "id": "T2", "tracks": {"video": {1: {"items": [{"id": "C"}]}}}}
+        action = app.get_action("auto_textplus_style")
+
+        app.update()
+        app.apply_inputs("auto_textplus_style", {"ignored_tracks": [2]})
+
+        project_data["current_timeline"] = timeline2
+        app.update()
+
+        assert app.context.resolve_context.timeline_diff is None
+        assert action.input_data.ignored_tracks == []
+
+        # tracks are swapped while the timeline is not opened
+        video_tracks = timeline1["tracks"]["video"]
+        video_tracks[1], video_tracks[2] = video_tracks[2], video_tracks[1]
+        project_data["current_timeline"] = timeline1
+        app.update()
+
+        assert app.context.resolve_context.timeline_diff.moved_tracks == {1: 2, 2: 1}
+        assert action.input_data.ignored_tracks == [1]
+
+    def test_switch_project(self, resolve_app, app):
+        resolve_app.mock_current_timeline({"id": "T1", "tracks": {"video": {1: {"items": [{"id": "A"}]}, 2: {"items": [{"id": "B"}]}}}})
+        project_data = resolve_app.mock_data["project_manager"]["current_project"]
+        action = app.get_action("auto_textplus_style")
+
+        app.update()
+        app.apply_inputs("auto_textplus_style", {"ignored_tracks": [2]})
+        app.update()
+
+        # an imported copy of the project keeps the timeline id, with other tracks
+        timeline = {**project_data["current_timeline"], "tracks": {"video": {1: {"items": [{"id": "C"}]}, 2: {"items": [{"id": "A"}]}}}}
+        resolve_app.mock_data["project_manager"]["current_project"] = {**project_data, "name": "Copy", "current_timeline": timeline}
+        app.update()
+
+        # not diffed against the other project, so no moved track nor added item, and the selection is reset
+        assert app.context.resolve_context.timeline_diff is None
+        assert action.input_data.ignored_tracks == []
@@ -0,0 +1,79 @@
+from automate_davinci_resolve.app.events import (
+    EventBus,
+    ItemsAdded,
+    ItemsMoved,
+    ItemsRemoved,
+    TimelineSwitched,
+    TrackMoved,
+    TrackRemoved,
+    create_timeline_events,
+)
+from automate_davinci_resolve.davinci.context import Diff, ResolveContext, TimelineContext, TimelineDiff, TimelineItemContext, TrackContext
+from automate_davinci_resolve.davinci.enums import ResolveStatus
+
+
+class TestEvents:
+    def test_create_timeline_events(self):
+        timeline_diff = TimelineDiff()
+        timeline_diff.diff = {
+            "added": {"video_tracks": {"root": [3], 2: {"items": {"root": {"B"}}}}},
+            "changed": {"video_tracks": {2: {"index": Diff(2, 1)}}},
+            "removed": {"video_tracks": {"root": [1], 2: {"items": {"root": {"C"}}}}},
+        }
+
+        assert create_timeline_events(timeline_diff) == [
+            TrackMoved(old_index=2, new_index=1),
+            TrackRemoved(old_index=1),
+            ItemsAdded(old_track_index=2, track_index=1, item_ids={"B"}),
+            ItemsRemoved(old_track_index=2, track_index=1, item_ids={"C"}),
+        ]
+        assert create_timeline_events(None) == [TimelineSwitched(None, None)]
+
+    def test_items_moved(self):
+        old = TimelineContext(
+            id="x",
+            name="x",
+            video_tracks={
+                1: TrackContext(index=1, name="", items={"A": TimelineItemContext(id="A"), "B": TimelineItemContext(id="B")}),
+                2: TrackContext(index=2, name="", items={"C": TimelineItemContext(id="C")}),
+            },
+        )
+        new = TimelineContext(
+            id="x",
+            name="x",
+            video_tracks={
+                1: TrackContext(index=1, name="", items={"A": TimelineItemContext(id="A")}),
+                2: TrackContext(index=2, name="", items={"B": TimelineItemContext(id="B"), "C": TimelineItemContext(id="C")}),
+            },
+        )
+
+        assert create_timeline_events(TimelineDiff.create(old, new)) == [
+            ItemsAdded(old_track_index=2, track_index=2, item_ids={"B"}),
+            ItemsRemoved(old_track_index=1, track_index=1, item_ids={"B"}),
+            ItemsMoved(old_track_index=1, track_index=2, item_ids={"B"}),
+        ]
+
+    def test_publish(self):
+        event_bus = EventBus()
+        received = []
+
+        def failing_handler(event):
+            raise RuntimeError()
+
+        event_bus.subscribe(TrackMoved, failing_handler)
+        event_bus.subscribe(TrackMoved, received.append)
+
+        timeline_context = TimelineContext(id="x", name="x", video_tracks={})
+        old_resolve_context = ResolveContext(resolve_status=ResolveStatus.TimelineOpen, timeline_context=timeline_context, timeline_diff=None)
+        timeline_diff = TimelineDiff()
+        timeline_diff.diff = {"changed": {"video_tracks": {1: {"index": Diff(1, 2)}}}}
+        new_resolve_context = ResolveContext(resolve_status=ResolveStatus.TimelineOpen, timeline_context=timeline_context, timeline_diff=timeline_diff)
+        event_bus.publish_resolve_context(old_resolve_context, new_resolve_context)
+
+        assert received == [TrackMoved(old_index=1, new_index=2, generation=1)]
+
+        event_bus.unsubscribe(TrackMoved, received.append)
+        event_bus.publish(TrackMoved(old_index=2, new_index=3))
+
+        assert received == [TrackMoved(old_index=1, new_index=2, generation=1)]
+        assert not event_bus.has_subscribers(ItemsAdded)
@@ -0,0 +1,52 @@
+import pytest
+
+from automate_davinci_resolve.davinci import fusion_settings
+from automate_davinci_resolve.davinci.fusion_settings import FusionSettingsError, FusionTable
+
+
+class TestFusionSettings:
+    def test_parse_file(self, test_settings):
+        settings = fusion_settings.read_settings(test_settings.resource_dir / "textplus.setting")
+        tool = fusion_settings.get_tool(settings)
+
+        assert settings.get("ActiveTool") == "Template"
+        assert tool.type_name == "TextPlus"
+        assert fusion_settings.get_input_value(tool, "StyledText") == 'Line "one"\nLine two'
+        assert fusion_settings.get_input_value(tool, "Size") == 0.08
+        assert fusion_settings.get_input_value(tool, "Level3") == -1
+        assert fusion_settings.get_input_value(tool, "Center") == FusionTable(array=[0.5, 0.1])
+        assert fusion_settings.get_input_value(tool, "Gamut.SLogVersion") == FusionTable("FuID", array=["SLog2"])
+        assert fusion_settings.get_input_value(tool, "ShadingGradient1") == FusionTable(
+            "Gradient", {"Colors": FusionTable(fields={0: FusionTable(array=[0, 0, 0, 1]), 1: FusionTable(array=[1, 1, 1, 1])})}
+        )
+        assert fusion_settings.get_input_value(tool, "Opacity") is None  # linked to another tool, no value
+
+    def test_round_trip(self, test_settings):
+        settings = fusion_settings.read_settings(test_settings.resource_dir / "textplus.setting")
+
+        assert fusion_settings.parse_settings(fusion_settings.format_settings(settings)) == settings
+
+    def test_patch_input(self, test_settings, tmp_path):
+        settings = fusion_settings.read_settings(test_settings.resource_dir / "textplus.setting")
+        path = tmp_path / "test_patch_input.setting"
+
+        fusion_settings.set_input_value(fusion_settings.get_tool(settings), "StyledText", "Tab\tand back\\slash")
+        fusion_settings.write_settings(path, settings)
+
+        assert fusion_settings.get_input_value(fusion_settings.get_tool(fusion_settings.read_settings(path)), "StyledText") == "Tab\tand back\\slash"
+
+    def test_lua_syntax(self):
+        settings = fusion_settings.parse_settings("""
+            --[[ block
+            comment ]]
+            { A = 'single', ["B C"] = [[long
+string]], [2] = 0x10, 1.5e3; true, nil, -- trailing comment
+            }
+            """)
+
+        assert settings == FusionTable(fields={"A": "single", "B C": "long\nstring", 2: 16}, array=[1500.0, True, None])
+
+    @pytest.mark.parametrize("text", ["{ A = }", "{ A = 1", "Input", "{ A = 1 } }", "1", "{ A = @ }"])
+    def test_invalid_syntax(self, text):
+        with pytest.raises(FusionSettingsError):
+            fusion_settings.parse_settings(text)
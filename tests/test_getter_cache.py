@@ -0,0 +1,109 @@
+import threading
+
+from automate_davinci_resolve.app.actions import auto_textplus_style
+from automate_davinci_resolve.app.events import create_timeline_events
+from automate_davinci_resolve.davinci.context import TimelineDiff
+from automate_davinci_resolve.davinci.getter_cache import GetterCache
+
+
+class Item:
+    def __init__(self):
+        self.call_count = 0
+
+    def GetUniqueId(self):
+        self.call_count += 1
+        return "A"
+
+
+class TestGetterCache:
+    def test_generation(self):
+        item = Item()
+        GetterCache.new_generation()
+
+        assert GetterCache.get(item, "GetUniqueId") == "A"
+        assert GetterCache.get(item, "GetUniqueId") == "A"
+        assert item.call_count == 1
+        assert GetterCache.get_stats() == (1, 1)
+
+        GetterCache.new_generation()
+
+        assert GetterCache.get(item, "GetUniqueId") == "A"
+        assert item.call_count == 2
+        assert GetterCache.get_stats() == (0, 1)
+
+    def test_concurrent_threads(self):
+        items = [Item() for _ in range(100)]
+        GetterCache.new_generation()
+
+        def read_all():
+            for item in items:
+                assert GetterCache.get(item, "GetUniqueId") == "A"
+
+        threads = [threading.Thread(target=read_all) for _ in range(8)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        # every lookup is counted, and a getter is only called again by threads racing on its first miss
+        assert sum(GetterCache.get_stats()) == 800
+        assert GetterCache.get_stats().misses == sum(item.call_count for item in items)
+        assert all(1 <= item.call_count <= 8 for item in items)
+
+    def test_bounded_entries(self):
+        GetterCache.new_generation()
+        items = [Item() for _ in range(GetterCache.capacity + 10)]
+
+        for item in items:
+            GetterCache.get(item, "GetUniqueId")
+
+        # oldest handles are released during a long action
+        assert len(GetterCache.entries) == GetterCache.capacity
+        GetterCache.get(items[0], "GetUniqueId")
+        assert items[0].call_count == 2
+
+    def test_capture_then_update_action(self, app_settings, resolve_app):
+        resolve_app.mock_current_timeline(
+            {
+                "tracks": {
+                    "video": {
+                        1: {
+                            "items": [
+                                {"id": "A", "fusion_comps": {1: {"TextPlus": {"StyledText": "Item A", "Size": 10}}}},
+                                {"id": "B", "fusion_comps": {1: {"TextPlus": {"StyledText": "Item B", "Size": 20}}}},
+                            ]
+                        },
+                    }
+                }
+            }
+        )
+        timeline_diff = TimelineDiff()
+        timeline_diff.diff = {"added": {"video_tracks": {1: {"items": {"root": {"B"}}}}}}
+
+        with resolve_app.measure_rpc_calls() as stats:
+            resolve_app.get_current_timeline().capture_context()
+            auto_textplus_style.Action().update(
+                app_settings=app_settings,
+                resolve_app=resolve_app,
+                events=create_timeline_events(timeline_diff),
+                input_data=auto_textplus_style.Inputs(),
+            )
+
+        assert stats.get_count("GetItemListInTrack") == 1
+        assert stats.get_count("GetUniqueId") == 2  # items only, timeline id is probed by update()
+        assert stats.get_count("GetTrackCount") == 1
+
+    def test_item_index_shared_with_capture(self, resolve_app):
+        resolve_app.mock_current_timeline({"tracks": {"video": {1: {"items": [{"id": "A"}, {"id": "B"}, {"id": "C"}]}}}})
+
+        with resolve_app.measure_rpc_calls() as stats:
+            resolve_app.get_current_timeline().capture_context()
+            track = resolve_app.get_current_timeline().get_track("video", 1)
+
+            assert track.get_item("C").GetUniqueId() == "C"
+            assert track.get_item("D") is None
+
+        # ids read by capture_context are reused, only the id probe above is a new call
+        assert stats.get_count("GetUniqueId") == 4
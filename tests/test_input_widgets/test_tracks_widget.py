@@ -183,3 +183,39 @@ class TestMultipleVideoTracksWidget:
             CheckboxOption(value=2, name="[2] ", selected=False),
         ]
         assert tracks_widget.get_data() == []
+
+    def test_timeline_switched_back(self):
+        tracks_widget = MultipleVideoTracksWidget("name", master=None)
+        timeline1_context = TimelineContext(
+            id="timeline1",
+            name="",
+            video_tracks={
+                1: TrackContext(index=1, name="", items={"A": TimelineItemContext(id="A")}),
+                2: TrackContext(index=2, name="", items={"B": TimelineItemContext(id="B")}),
+            },
+        )
+        timeline2_context = TimelineContext(
+            id="timeline2",
+            name="",
+            video_tracks={
+                1: TrackContext(index=1, name="", items={"C": TimelineItemContext(id="C")}),
+            },
+        )
+        new_timeline1_context = TimelineContext(
+            id="timeline1",
+            name="",
+            video_tracks={
+                1: TrackContext(index=1, name="", items={"B": TimelineItemContext(id="B")}),
+                2: TrackContext(index=2, name="", items={"A": TimelineItemContext(id="A")}),
+            },
+        )
+
+        tracks_widget.update(timeline_context=timeline1_context, timeline_diff=None)
+        tracks_widget.toggle(1)
+        tracks_widget.update(timeline_context=timeline2_context, timeline_diff=None)
+
+        assert tracks_widget.get_data() == []
+
+        tracks_widget.update(timeline_context=new_timeline1_context, timeline_diff=TimelineDiff.create(timeline1_context, new_timeline1_context))
+
+        assert tracks_widget.get_data() == [2]
@@ -2,7 +2,9 @@ from pydantic import BaseModel, ValidationError
 
 from automate_davinci_resolve.app.inputs.tracks import MultipleVideoTracksInput
 from automate_davinci_resolve.app.context import InputContext
-from automate_davinci_resolve.davinci.context import TimelineContext, TimelineDiff, TrackContext, Diff
+from automate_davinci_resolve.app.events import EventBus, TimelineSwitched, TrackMoved
+from automate_davinci_resolve.davinci.context import ResolveContext, TimelineContext, TimelineDiff, TrackContext, Diff
+from automate_davinci_resolve.davinci.enums import ResolveStatus
 
 
 class Input(BaseModel):
@@ -64,3 +66,47 @@ class TestTracksInput:
         tracks_input.update(diff)
 
         assert tracks_input == [2]
+
+    def test_moves_of_successive_diffs(self):
+        tracks_input = MultipleVideoTracksInput([1])
+        event_bus = EventBus()
+        pending_events = []
+        event_bus.subscribe(TrackMoved, pending_events.append)
+        timeline_context = TimelineContext(id="x", name="x", video_tracks={})
+        resolve_context = ResolveContext(resolve_status=ResolveStatus.TimelineOpen, timeline_context=timeline_context, timeline_diff=None)
+
+        # track 1 moves to 2, then to 3 on the next update, both handled in one batch
+        for old_index, new_index in [(1, 2), (2, 3)]:
+            timeline_diff = TimelineDiff()
+            timeline_diff.diff = {"changed": {"video_tracks": {old_index: {"index": Diff(old_index, new_index)}}}}
+            new_resolve_context = ResolveContext(resolve_status=ResolveStatus.TimelineOpen, timeline_context=timeline_context, timeline_diff=timeline_diff)
+            event_bus.publish_resolve_context(resolve_context, new_resolve_context)
+            resolve_context = new_resolve_context
+
+        tracks_input.on_events(pending_events)
+
+        assert tracks_input == [3]
+
+    def test_timeline_switched(self):
+        tracks_input = MultipleVideoTracksInput([1, 3])
+        timeline1 = TimelineContext(id="timeline1", name=..., video_tracks={})
+        timeline2 = TimelineContext(id="timeline2", name=..., video_tracks={})
+
+        tracks_input.on_events([TimelineSwitched(old_timeline_id="timeline1", timeline_context=timeline2)])
+
+        assert tracks_input == []
+
+        tracks_input.append(2)
+        tracks_input.on_events(
+            [
+                TimelineSwitched(old_timeline_id="timeline2", timeline_context=timeline1, restored=True),
+                TrackMoved(old_index=1, new_index=2),
+                TrackMoved(old_index=2, new_index=1),
+            ]
+        )
+
+        assert tracks_input == [2, 3]
+
+        tracks_input.on_events([TimelineSwitched(old_timeline_id="timeline1", timeline_context=timeline2, restored=False)])
+
+        assert tracks_input == []
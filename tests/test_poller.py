@@ -0,0 +1,47 @@
+import time
+
+from automate_davinci_resolve.app.poller import AppPoller
+from automate_davinci_resolve.davinci.enums import ResolveStatus
+
+
+def wait_for_contexts(poller: AppPoller, count: int, timeout: float = 5):
+    app_contexts = []
+    end_time = time.monotonic() + timeout
+
+    while len(app_contexts) < count and time.monotonic() < end_time:
+        app_contexts += poller.poll_contexts()
+        time.sleep(0.01)
+
+    return app_contexts
+
+
+class TestAppPoller:
+    def test_update_in_background(self, resolve_app, app):
+        resolve_app.mock_current_timeline({"tracks": {"video": {1: {"items": [{"id": "A"}]}}}})
+        poller = AppPoller(app, interval=0.01)
+
+        assert poller.poll_contexts() == []
+
+        poller.start()
+        app_contexts = wait_for_contexts(poller, 2)
+        poller.stop()
+
+        assert len(app_contexts) >= 2
+        assert all(app_context.resolve_context.resolve_status == ResolveStatus.TimelineOpen for app_context in app_contexts)
+
+    def test_commands(self, resolve_app, app):
+        resolve_app.mock_current_timeline({"tracks": {"video": {1: {"items": [{"id": "A"}]}}}})
+        poller = AppPoller(app, interval=0.01)
+        action = poller.get_action("auto_textplus_style")
+
+        poller.start()
+        wait_for_contexts(poller, 1)
+
+        poller.stop_action(action.name)
+        poller.apply_inputs(action.name, {"ignored_tracks": [1]})
+        wait_for_contexts(poller, 2)
+
+        poller.stop()
+
+        assert not action.is_starting
+        assert action.input_data.ignored_tracks == [1]
@@ -0,0 +1,40 @@
+from automate_davinci_resolve.app.actions.progress import Progress, ProgressReporter
+
+
+class Clock:
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self):
+        return self.time
+
+
+class TestProgressReporter:
+    def test_rate_limit(self):
+        clock = Clock()
+        published = []
+        progress_reporter = ProgressReporter(on_progress=published.append, clock=clock)
+
+        progress_reporter.start_phase("Syncing", 1000)
+
+        for i in range(1000):
+            clock.time += 1 / 128
+            progress_reporter.advance()
+
+        progress_reporter.finish_phase()
+
+        # start, once per interval (1s = 128 units), and finish
+        assert len(published) == 9
+        assert [progress.done for progress in published[1:-1]] == [128 * i for i in range(1, 8)]
+        assert published[0] == Progress("Syncing", 0, 1000, 0.0)
+        assert published[-1].done == 1000
+        assert published[-1].fraction == 1.0
+
+    def test_eta(self):
+        progress = Progress("Syncing", 250, 1000, 5.0)
+
+        assert progress.rate == 50.0
+        assert progress.eta == 15.0
+        assert progress.format() == "Syncing 250/1000 (25%), 50.0/s, ETA 15s"
+        assert Progress("Syncing", 0, 1000, 0.0).eta is None
+        assert Progress("Syncing", 0, 1000, 0.0).format() == "Syncing 0/1000 (0%)"
@@ -0,0 +1,64 @@
+from automate_davinci_resolve.davinci.enums import ResolveStatus
+
+
+class TestResolveApp:
+    def test_reuse_handles(self, resolve_app):
+        resolve_app.mock_current_timeline({"id": "T", "tracks": {"video": {1: {"items": [{"id": "A"}]}}}})
+
+        with resolve_app.measure_rpc_calls() as stats:
+            assert resolve_app.update() == ResolveStatus.TimelineOpen
+
+        assert resolve_app.changes == (False, False)
+        assert sorted(stats.latencies) == ["GetCurrentProject", "GetCurrentTimeline", "GetName", "GetUniqueId"]
+        assert stats.get_count() == 4
+
+    def test_probe_without_timeline(self, resolve_app):
+        resolve_app.mock_current_timeline({"id": "T"})
+        resolve_app.mock_data["project_manager"]["current_project"]["current_timeline"] = None
+        resolve_app.update()
+
+        with resolve_app.measure_rpc_calls() as stats:
+            assert resolve_app.update() == ResolveStatus.ProjectOpen
+
+        assert resolve_app.changes == (False, False)
+        assert sorted(stats.latencies) == ["GetCurrentProject", "GetCurrentTimeline", "GetName"]
+        assert stats.get_count() == 3
+
+    def test_reopened_project(self, resolve_app):
+        resolve_app.mock_current_timeline({"id": "T"})
+        project = resolve_app.project
+
+        # closed and reopened between two polls, the name and timeline are the same but the handle is new
+        resolve_app.mock_data["project_manager"]["current_project"] = dict(resolve_app.mock_data["project_manager"]["current_project"])
+
+        assert resolve_app.update() == ResolveStatus.TimelineOpen
+        assert resolve_app.changes == (False, False)
+        assert resolve_app.project is not project
+        assert resolve_app.media_pool is not None
+
+    def test_detect_changes(self, resolve_app):
+        resolve_app.mock_current_timeline({"id": "T1"})
+        project_data = resolve_app.mock_data["project_manager"]["current_project"]
+
+        project_data["current_timeline"] = dict(project_data["current_timeline"], id="T2")
+
+        assert resolve_app.update() == ResolveStatus.TimelineOpen
+        assert resolve_app.changes == (False, True)
+        assert resolve_app.timeline_id == "T2"
+
+        resolve_app.mock_data["project_manager"]["current_project"] = {"name": "Other", "media_pool": {}}
+
+        assert resolve_app.update() == ResolveStatus.ProjectOpen
+        assert resolve_app.changes == (True, True)
+        assert resolve_app.project_name == "Other"
+
+    def test_resolve_down(self, resolve_app):
+        resolve_app.mock_current_timeline({"id": "T"})
+        # the old connection stops answering
+        resolve_app.mock_data["product_name"] = None
+        resolve_app.mock_data["project_manager"]["current_project"] = None
+        resolve_app.mock_data = None
+
+        assert resolve_app.update() == ResolveStatus.Unavailable
+        assert resolve_app.project is None
+        assert resolve_app.timeline is None
@@ -0,0 +1,71 @@
+import time
+
+from automate_davinci_resolve.davinci import textplus_utils
+from automate_davinci_resolve.davinci.enums import ResolveStatus
+from .utils.resolve_mock import MockLatency
+
+
+class TestResolveMock:
+    def test_latency(self, resolve_app):
+        resolve_app.mock_current_timeline({"id": "T", "tracks": {"video": {1: {"items": [{"id": "A"}]}}}})
+        resolve_app.set_latency(MockLatency(latencies={"GetItemListInTrack": 0.05}))
+        resolve_app.reset_call_counts()
+
+        start_time = time.perf_counter()
+        resolve_app.get_current_timeline().capture_context()
+
+        assert time.perf_counter() - start_time >= 0.05
+        # timeline settings read while listing items are served inside Resolve, not counted
+        assert resolve_app.call_counts == {"GetItemListInTrack": 1, "GetTrackCount": 1, "GetTrackName": 1, "GetName": 1, "GetUniqueId": 1}
+
+    def test_settings_files(self, resolve_app, tmp_path):
+        resolve_app.mock_current_timeline(
+            {
+                "tracks": {
+                    "video": {
+                        1: {
+                            "items": [
+                                {"id": "A", "fusion_comps": {1: {"TextPlus": {"StyledText": "Item A", "Size": 10}}}},
+                                {"id": "B", "fusion_comps": {1: {"TextPlus": {"StyledText": "Item B", "Size": 20}}}},
+                            ]
+                        }
+                    }
+                }
+            }
+        )
+        settings_path = tmp_path / "test_settings_files.setting"
+        textplus_a, textplus_b = [textplus_utils.find_textplus(item) for item in resolve_app.get_current_timeline().get_track("video", 1).timeline_items]
+
+        assert textplus_utils.save_settings(textplus_a, str(settings_path))
+        assert settings_path.exists()
+        assert textplus_utils.load_settings(textplus_b, str(settings_path), exclude_data_ids=["StyledText"])
+        assert resolve_app.update_mocked_item("B")["fusion_comps"][1]["TextPlus"] == {"StyledText": "Item B", "Size": 10}
+        assert not textplus_b.LoadSettings(str(tmp_path / "missing.setting"))
+
+    def test_append_to_timeline(self, resolve_app):
+        resolve_app.mock_current_timeline({"id": "T", "name": "Timeline60fps"})
+        resolve_app.mock_media_pool_clips([{"name": "Text+60fps", "fusion_comps": {1: {"TextPlus": {"StyledText": "", "Size": 10}}}}])
+        media_pool = resolve_app.get_media_pool()
+        textplus_clip = media_pool.find_item(lambda item: item.GetClipProperty("Clip Name") == "Text+60fps")
+
+        timeline = resolve_app.find_timeline("Timeline60fps").DuplicateTimeline("Subtitles")
+        items = resolve_app.media_pool.AppendToTimeline([{"mediaPoolItem": textplus_clip, "startFrame": 0, "endFrame": 30, "recordFrame": 216000}])
+
+        assert resolve_app.update() == ResolveStatus.TimelineOpen
+        assert resolve_app.changes.timeline_changed
+        assert timeline.GetName() == "Subtitles"
+        assert [(item.GetStart(), item.GetEnd()) for item in items] == [(216000, 216030)]
+        assert resolve_app.project.GetTimelineCount() == 2
+
+    def test_temp_project(self, resolve_app, tmp_path):
+        resolve_app.mock_current_timeline({"id": "T"})
+        project_path = tmp_path / "test_temp_project.drp"
+
+        assert resolve_app.project_manager.ExportProject("Project", str(project_path))
+
+        with resolve_app.import_temp_project(str(project_path), "Temp") as project:
+            assert project.GetName() == "Temp"
+            assert resolve_app.project_name == "Temp"
+
+        assert resolve_app.project_name == "Project"
+        assert resolve_app.project_manager.LoadProject("Temp") is None
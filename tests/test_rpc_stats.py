@@ -0,0 +1,107 @@
+import threading
+
+from automate_davinci_resolve.davinci.rpc_stats import LatencyEstimates, RpcMonitor, RpcProxy, RpcStats
+
+
+class Gradient:
+    def __init__(self):
+        self.Value = {0.0: [1, 1, 1, 1]}
+
+
+class Node:
+    def __init__(self):
+        self.inputs = {}
+
+    def GetInput(self, name):
+        return self.inputs.get(name)
+
+    def SetInput(self, name, value):
+        self.inputs[name] = value
+
+
+class TestRpcStats:
+    def test_percentile(self):
+        stats = RpcStats()
+
+        for i in range(1, 101):
+            stats.record("GetName", i / 1000)
+
+        method_stats = stats.get_method_stats("GetName")
+
+        assert method_stats.count == 100
+        assert method_stats.p50 == 0.05
+        assert method_stats.p99 == 0.099
+        assert stats.get_method_stats("GetStart") is None
+
+    def test_latency_estimates(self):
+        latency_estimates = LatencyEstimates()
+        latency_estimates.record("SaveSettings", 0.01)
+        latency_estimates.record("SaveSettings", 0.03)
+
+        assert latency_estimates.get("SaveSettings") == 0.02
+        # not called yet, typical figure
+        assert latency_estimates.get("LoadSettings") == LatencyEstimates.typical_latencies["LoadSettings"]
+        assert latency_estimates.estimate({"SaveSettings": 10, "GetName": 5}) == 0.2 + 5 * LatencyEstimates.default_latency
+
+    def test_nested_measure(self):
+        with RpcMonitor.measure() as outer_stats:
+            RpcMonitor.record("GetName", 0.1)
+
+            with RpcMonitor.measure() as inner_stats:
+                RpcMonitor.record("GetStart", 0.2)
+
+        RpcMonitor.record("GetEnd", 0.3)
+
+        assert outer_stats.get_count() == 2
+        assert inner_stats.get_count() == 1
+        assert inner_stats.get_count("GetStart") == 1
+
+    def test_record_from_threads(self):
+        latency_estimates = LatencyEstimates()
+        RpcMonitor.latency_estimates, default_latency_estimates = latency_estimates, RpcMonitor.latency_estimates
+
+        def record_calls():
+            for _ in range(1000):
+                RpcMonitor.record("GetName", 0.001)
+
+        try:
+            with RpcMonitor.measure() as stats:
+                threads = [threading.Thread(target=record_calls) for _ in range(8)]
+
+                for thread in threads:
+                    thread.start()
+
+                for thread in threads:
+                    thread.join()
+        finally:
+            RpcMonitor.latency_estimates = default_latency_estimates
+
+        assert stats.get_count("GetName") == 8000
+        assert latency_estimates.counts["GetName"] == 8000
+
+
+class TestRpcProxy:
+    def test_count_nested_objects(self):
+        raw_node = Node()
+        node = RpcProxy.wrap(raw_node)
+        node.SetInput("Gradient", RpcProxy.wrap(Gradient()))
+
+        with RpcMonitor.measure() as stats:
+            gradient = node.GetInput("Gradient")
+            gradient.Value = {1.0: [0, 0, 0, 1]}
+            node.SetInput("Size", 1)
+
+        assert isinstance(gradient, RpcProxy)
+        assert type(raw_node.inputs["Gradient"]) is Gradient  # arguments are unwrapped before calling
+        assert raw_node.inputs["Gradient"].Value == {1.0: [0, 0, 0, 1]}
+        assert stats.get_count("GetInput") == 1
+        assert stats.get_count("SetInput") == 1
+
+    def test_resolve_app(self, resolve_app):
+        resolve_app.mock_current_timeline({"tracks": {"video": {1: {"items": [{"id": "A"}, {"id": "B"}]}}}})
+
+        with resolve_app.measure_rpc_calls() as stats:
+            resolve_app.get_current_timeline().capture_context()
+
+        assert stats.get_count("GetItemListInTrack") == 1
+        assert stats.get_count("GetUniqueId") == 2  # 1 call per item, timeline id is probed by update()
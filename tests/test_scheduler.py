@@ -0,0 +1,24 @@
+from automate_davinci_resolve.app.scheduler import PollScheduler, RefreshRate
+
+
+class TestPollScheduler:
+    def test_backoff_when_idle(self):
+        scheduler = PollScheduler()
+        refresh_rates = [RefreshRate(min_interval=0.5, max_interval=3)]
+
+        intervals = [scheduler.schedule(available=True, changed=False, refresh_rates=refresh_rates) for _ in range(4)]
+
+        assert intervals == [0.5, 1, 2, 3]
+        assert scheduler.schedule(available=True, changed=True, refresh_rates=refresh_rates) == 0.5
+
+    def test_backoff_when_unavailable(self):
+        scheduler = PollScheduler()
+
+        intervals = [scheduler.schedule(available=False, changed=False, refresh_rates=[]) for _ in range(7)]
+
+        assert intervals == [1, 2, 4, 8, 16, 30, 30]
+        assert scheduler.schedule(available=True, changed=True, refresh_rates=[]) == PollScheduler.idle_refresh_rate.min_interval
+
+    def test_combine_refresh_rates(self):
+        assert PollScheduler.combine([]) == PollScheduler.idle_refresh_rate
+        assert PollScheduler.combine([RefreshRate(1, 10), RefreshRate(0.2, 4)]) == RefreshRate(0.2, 4)
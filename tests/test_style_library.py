@@ -0,0 +1,83 @@
+from automate_davinci_resolve.davinci import textplus_utils
+from automate_davinci_resolve.davinci.style_library import StyleLibrary
+from automate_davinci_resolve.davinci.textplus_style import TextplusStyle
+
+
+class TestStyleLibrary:
+    def save_styles(self, resolve_app, tmp_path):
+        resolve_app.mock_current_timeline(
+            {
+                "tracks": {
+                    "video": {
+                        1: {
+                            "items": [
+                                {"id": "A", "fusion_comps": {1: {"TextPlus": {"StyledText": "Item A", "Size": 10, "Font": "Arial"}}}},
+                                {"id": "B", "fusion_comps": {1: {"TextPlus": {"StyledText": "Item B", "Size": 10, "Font": "Arial"}}}},
+                                {"id": "C", "fusion_comps": {1: {"TextPlus": {"StyledText": "Item C", "Size": 20, "Font": "Arial"}}}},
+                            ]
+                        }
+                    }
+                }
+            }
+        )
+        items = resolve_app.get_current_timeline().get_track("video", 1).timeline_items
+
+        return [TextplusStyle.save(textplus_utils.find_textplus(item), str(tmp_path / f"{i}.setting")) for i, item in enumerate(items)]
+
+    def test_add_and_get(self, resolve_app, tmp_path):
+        style_a, style_b, style_c = self.save_styles(resolve_app, tmp_path)
+        library = StyleLibrary(tmp_path / "styles")
+
+        library.add("house", style_a)
+        library.add("same", style_b)
+        library.add("large", style_c)
+
+        # equal styles are stored once, without the text of the saved clip
+        settings_paths = list((tmp_path / "styles" / "objects").iterdir())
+        assert len(settings_paths) == 2
+        assert all("Item" not in path.read_text(encoding="utf-8") for path in settings_paths)
+
+        reopened_library = StyleLibrary(tmp_path / "styles")
+
+        assert reopened_library.names() == ["house", "large", "same"]
+        assert reopened_library.get("house").fingerprint == style_a.fingerprint
+        assert reopened_library.get("large").fingerprint == style_c.fingerprint
+        assert reopened_library.get("missing") is None
+
+    def test_cached_styles(self, resolve_app, tmp_path):
+        style_a, style_b, _ = self.save_styles(resolve_app, tmp_path)
+        library = StyleLibrary(tmp_path / "styles")
+        library.add("house", style_a)
+        library.add("same", style_b)
+
+        style = library.get("house")
+
+        # parsed once, shared by all names of the style
+        assert library.get("house") is style
+        assert library.get("same") is style
+        assert StyleLibrary.open(tmp_path / "styles") is StyleLibrary.open(tmp_path / "styles")
+
+    def test_remove(self, resolve_app, tmp_path):
+        style_a, style_b, _ = self.save_styles(resolve_app, tmp_path)
+        library = StyleLibrary(tmp_path / "styles")
+        library.add("house", style_a)
+        library.add("same", style_b)
+
+        library.remove("house")
+
+        assert library.get("house") is None
+        assert library.get("same").fingerprint == style_a.fingerprint
+        assert StyleLibrary(tmp_path / "styles").names() == ["same"]
+
+    def test_reload_names(self, resolve_app, tmp_path):
+        style_a, _, style_c = self.save_styles(resolve_app, tmp_path)
+        library = StyleLibrary(tmp_path / "styles")
+        library.add("house", style_a)
+
+        assert library.names() == ["house"]
+
+        # saved by another run of the app
+        StyleLibrary(tmp_path / "styles").add("large", style_c)
+
+        assert library.names() == ["house", "large"]
+        assert library.get("large").fingerprint == style_c.fingerprint
@@ -0,0 +1,114 @@
+import pytest
+
+from automate_davinci_resolve.davinci import textplus_utils
+from automate_davinci_resolve.davinci.textplus_style import ApplyResult, StyleFingerprints, TextplusStyle
+
+from .utils.resolve_mock import ResolveFusionGradientMock
+
+
+class TestTextplusStyle:
+    @pytest.fixture(autouse=True)
+    def mock_timeline(self, resolve_app):
+        resolve_app.mock_current_timeline(
+            {
+                "tracks": {
+                    "video": {
+                        1: {
+                            "items": [
+                                {
+                                    "id": "A",
+                                    "fusion_comps": {
+                                        1: {
+                                            "TextPlus": {
+                                                "StyledText": "Item A",
+                                                "Size": 10,
+                                                "Font": "Arial",
+                                                "ShadingGradient1": ResolveFusionGradientMock({0: "red"}),
+                                            }
+                                        }
+                                    },
+                                },
+                                {"id": "B", "fusion_comps": {1: {"TextPlus": {"StyledText": "Item B", "Size": 20, "Font": "Arial"}}}},
+                                {
+                                    "id": "C",
+                                    "fusion_comps": {
+                                        1: {
+                                            "TextPlus": {
+                                                "StyledText": "Item C",
+                                                "Size": 10,
+                                                "Font": "Arial",
+                                                "ShadingGradient1": ResolveFusionGradientMock({0: "blue"}),
+                                            }
+                                        }
+                                    },
+                                },
+                            ]
+                        }
+                    }
+                }
+            }
+        )
+
+    def get_textplus_list(self, resolve_app):
+        return [textplus_utils.find_textplus(item) for item in resolve_app.get_current_timeline().get_track("video", 1).timeline_items]
+
+    def test_apply_settings(self, resolve_app, tmp_path):
+        textplus_a, textplus_b, textplus_c = self.get_textplus_list(resolve_app)
+
+        style = TextplusStyle.save(textplus_a, str(tmp_path / "test_apply_settings.setting"), exclude_data_ids=["StyledText"])
+
+        assert list(style.inputs.keys()) == ["Size", "Font", "ShadingGradient1"]
+
+        resolve_app.reset_call_counts()
+
+        assert style.apply(textplus_b)
+        assert style.apply(textplus_c)
+        assert dict(resolve_app.call_counts) == {"GetInput": 2, "LoadSettings": 2}  # StyledText is patched into the settings
+        assert resolve_app.update_mocked_item("B")["fusion_comps"][1]["TextPlus"] == {
+            "StyledText": "Item B",
+            "Size": 10,
+            "Font": "Arial",
+            "ShadingGradient1": ResolveFusionGradientMock({0: "red"}),
+        }
+        assert resolve_app.update_mocked_item("C")["fusion_comps"][1]["TextPlus"]["StyledText"] == "Item C"
+
+    def test_fingerprint(self, resolve_app, tmp_path):
+        textplus_a, textplus_b, textplus_c = self.get_textplus_list(resolve_app)
+        settings_path = str(tmp_path / "test_fingerprint.setting")
+
+        style_a = TextplusStyle.save(textplus_a, settings_path)
+        style_c = TextplusStyle.save(textplus_c, settings_path)
+
+        assert style_a.fingerprint != style_c.fingerprint
+
+        textplus_c.SetInput("ShadingGradient1", ResolveFusionGradientMock({0: "red"}))
+        textplus_c.SetInput("GlobalOut", 119)  # follows clip duration, not style
+
+        assert TextplusStyle.save(textplus_c, settings_path).fingerprint == style_a.fingerprint
+
+    def test_apply_if_changed(self, resolve_app, tmp_path):
+        textplus_a, textplus_b, textplus_c = self.get_textplus_list(resolve_app)
+        style = TextplusStyle.save(textplus_a, str(tmp_path / "test_apply_if_changed.setting"))
+        target_settings_path = str(tmp_path / "test_apply_if_changed.target.setting")
+
+        assert style.apply_if_changed(textplus_b, "B", target_settings_path) == ApplyResult.Applied
+        assert StyleFingerprints.get("B") == style.fingerprint
+
+        resolve_app.reset_call_counts()
+
+        # the target is read again even when known in style
+        assert style.apply_if_changed(textplus_b, "B", target_settings_path) == ApplyResult.Unchanged
+        assert dict(resolve_app.call_counts) == {"SaveSettings": 1}
+        assert resolve_app.update_mocked_item("B")["fusion_comps"][1]["TextPlus"]["StyledText"] == "Item B"
+
+    def test_apply_to_item(self, resolve_app, tmp_path):
+        textplus_a, textplus_b, textplus_c = self.get_textplus_list(resolve_app)
+        style = TextplusStyle.save(textplus_a, str(tmp_path / "test_apply_to_item.setting"))
+
+        resolve_app.reset_call_counts()
+
+        # the target is not read, StyledText is kept with one GetInput
+        assert style.apply_to_item(textplus_c, "C", str(tmp_path / "test_apply_to_item.patched.setting")) == ApplyResult.Applied
+        assert dict(resolve_app.call_counts) == {"GetInput": 1, "LoadSettings": 1}
+        assert StyleFingerprints.get("C") == style.fingerprint
+        assert resolve_app.update_mocked_item("C")["fusion_comps"][1]["TextPlus"]["StyledText"] == "Item C"
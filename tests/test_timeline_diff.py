@@ -193,3 +193,101 @@ class TestTimelineDiff:
                 }
             },
         }
+        # found from the ids already diffed, B1 and B2 now on track 1, E2 on the added track 6
+        assert diff.moved_items == {"B1": Diff(2, 1), "B2": Diff(2, 1), "E2": Diff(5, 6)}
+
+    def test_typed_view(self):
+        diff_dict = {
+            "added": {"video_tracks": {"root": [3], 1: {"items": {"root": {"B1"}}}}},
+            "changed": {"video_tracks": {2: {"index": Diff(2, 1), "name": Diff("a", "b")}}},
+            "removed": {"video_tracks": {"root": [1]}},
+        }
+        diff = TimelineDiff()
+        diff.diff = diff_dict
+
+        assert diff.moved_tracks == {2: 1}
+        assert diff.renamed_tracks == {2: Diff("a", "b")}
+        assert diff.added_tracks == {3}
+        assert diff.removed_tracks == {1}
+        assert diff.get_added_items(1) == {"B1"}
+        assert diff.get_removed_items(1) == set()
+        assert [diff.get_new_track_index(i) for i in [1, 2, 3]] == [None, 1, 3]
+        assert diff.diff == diff_dict
+        assert not diff.is_empty()
+        assert TimelineDiff().is_empty()
+
+    def test_inserted_track(self):
+        old = TimelineContext(
+            id="x",
+            name="x",
+            video_tracks={i: TrackContext(index=i, name="", items={f"{i}-{j}": TimelineItemContext(id=f"{i}-{j}") for j in range(3)}) for i in range(1, 61)},
+        )
+        new = TimelineContext(
+            id="x",
+            name="x",
+            video_tracks={
+                **{i: TrackContext(index=i, name="", items=dict(old.video_tracks[i].items)) for i in range(1, 31)},
+                31: TrackContext(index=31, name="", items={}),
+                **{i + 1: TrackContext(index=i + 1, name="", items=dict(old.video_tracks[i].items)) for i in range(31, 61)},
+            },
+        )
+
+        diff = TimelineDiff.create(old, new)
+
+        assert diff.added_tracks == {31}
+        assert diff.moved_tracks == {i: i + 1 for i in range(31, 61)}
+        assert diff.removed_tracks == set()
+        assert diff.added_items == {}
+        assert diff.removed_items == {}
+
+    def test_split_track(self):
+        old = TimelineContext(
+            id="x",
+            name="x",
+            video_tracks={
+                1: TrackContext(index=1, name="", items={"A": TimelineItemContext(id="A"), "B": TimelineItemContext(id="B"), "C": TimelineItemContext(id="C")}),
+                2: TrackContext(index=2, name="", items={"D": TimelineItemContext(id="D")}),
+            },
+        )
+        new = TimelineContext(
+            id="x",
+            name="x",
+            video_tracks={
+                1: TrackContext(index=1, name="", items={"A": TimelineItemContext(id="A")}),
+                2: TrackContext(index=2, name="", items={"D": TimelineItemContext(id="D")}),
+                3: TrackContext(index=3, name="", items={"B": TimelineItemContext(id="B"), "C": TimelineItemContext(id="C")}),
+            },
+        )
+
+        diff = TimelineDiff.create(old, new)
+
+        # unmoved track is preferred over the track holding most of its items
+        assert diff.moved_tracks == {}
+        assert diff.added_tracks == {3}
+        assert diff.removed_items == {1: {"B", "C"}}
+
+    def test_moved_track_follows_most_items(self):
+        old = TimelineContext(
+            id="x",
+            name="x",
+            video_tracks={
+                1: TrackContext(index=1, name="", items={"A": TimelineItemContext(id="A"), "B": TimelineItemContext(id="B"), "C": TimelineItemContext(id="C")}),
+                2: TrackContext(index=2, name="", items={"D": TimelineItemContext(id="D")}),
+            },
+        )
+        new = TimelineContext(
+            id="x",
+            name="x",
+            video_tracks={
+                1: TrackContext(index=1, name="", items={"D": TimelineItemContext(id="D")}),
+                2: TrackContext(index=2, name="", items={"A": TimelineItemContext(id="A")}),
+                3: TrackContext(index=3, name="", items={"B": TimelineItemContext(id="B"), "C": TimelineItemContext(id="C")}),
+            },
+        )
+
+        diff = TimelineDiff.create(old, new)
+
+        # the first new track sharing an item is not enough, the track holding most items wins
+        assert diff.moved_tracks == {1: 3, 2: 1}
+        assert diff.added_tracks == {2}
+        assert diff.removed_items == {1: {"A"}}
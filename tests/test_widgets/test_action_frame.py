@@ -1,3 +1,4 @@
+from automate_davinci_resolve.app.actions.progress import Progress
 from automate_davinci_resolve.gui.widgets.action_frame import ActionFrame
 
 
@@ -39,10 +40,35 @@ class TestActionFrame:
         for checkbox in action_frame.input_widgets["ignored_tracks"].checkboxes:
             checkbox.toggle()
 
-        assert action_frame.get_input_data() == {"ignored_tracks": [1, 2]}
+        assert action_frame.get_input_data() == {"ignored_tracks": [1, 2], "library_style": None, "dry_run": False}
 
         app.apply_inputs(action.name, action_frame.get_input_data())
         app_context = app.update()
         action_frame.update(app_context)
 
-        assert action_frame.get_input_data() == {"ignored_tracks": [1, 2]}
+        assert action_frame.get_input_data() == {"ignored_tracks": [1, 2], "library_style": None, "dry_run": False}
+
+    def test_progress(self, app):
+        action = app.get_action("sync_textplus_style")
+        action_frame = ActionFrame(app, action, master=None)
+
+        action_frame.update_progress()
+
+        assert action_frame.progress_bar.get() == 0
+        assert action_frame.progress_label.cget("text") == ""
+
+        action.set_progress(Progress("Syncing Text+ style", 250, 1000, 5.0))
+        action_frame.update_progress()
+
+        assert action_frame.progress_bar.get() == 0.25
+        assert action_frame.progress_label.cget("text") == "Syncing Text+ style 250/1000 (25%), 50.0/s, ETA 15s"
+
+    def test_button_while_running(self, app):
+        action = app.get_action("sync_textplus_style")
+        action_frame = ActionFrame(app, action, master=None)
+
+        # started from the poller thread, no context is posted until start() returns
+        action.status_control.start()
+        action_frame.update_progress()
+
+        assert action_frame.action_button.cget("text") == "Stop Action"
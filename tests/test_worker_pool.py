@@ -0,0 +1,54 @@
+import threading
+import time
+
+import pytest
+
+from automate_davinci_resolve.davinci.worker_pool import ResolveWorkerPool
+
+
+class TestResolveWorkerPool:
+    def test_jobs_spread_over_connections(self, resolve_app):
+        resolve_app.mock_current_timeline({"tracks": {"video": {1: {"items": [{"id": "A"}]}}}})
+        pool = ResolveWorkerPool(resolve_app, worker_count=3)
+        # each job waits for the others, so no worker can take all jobs
+        barrier = threading.Barrier(3, timeout=5)
+
+        def run(timeline, worker_index, job):
+            barrier.wait()
+            return worker_index, timeline.get_track("video", 1).get_item("A") is not None
+
+        with resolve_app.measure_rpc_calls() as stats:
+            results = dict(pool.run(run, ["a", "b", "c"]))
+
+        assert sorted(worker_index for worker_index, _ in results.values()) == [1, 2, 3]
+        assert all(found for _, found in results.values())
+        # one connection per worker, none on the main connection
+        assert stats.get_count("GetProjectManager") == 3
+
+    def test_serial(self, resolve_app):
+        resolve_app.mock_current_timeline({"tracks": {"video": {1: {"items": [{"id": "A"}]}}}})
+        pool = ResolveWorkerPool(resolve_app, worker_count=1)
+
+        with resolve_app.measure_rpc_calls() as stats:
+            results = list(pool.run(lambda timeline, worker_index, job: worker_index, ["a", "b"]))
+
+        assert results == [("a", 0), ("b", 0)]
+        assert stats.get_count("GetProjectManager") == 0
+
+    def test_failed_job_cancels_queued_jobs(self, resolve_app):
+        resolve_app.mock_current_timeline({"tracks": {"video": {1: {"items": [{"id": "A"}]}}}})
+        pool = ResolveWorkerPool(resolve_app, worker_count=2)
+        done_jobs = []
+
+        def run(timeline, worker_index, job):
+            if job == 0:
+                raise RuntimeError("failed")
+
+            time.sleep(0.2)
+            done_jobs.append(job)
+
+        with pytest.raises(RuntimeError):
+            list(pool.run(run, list(range(10))))
+
+        # only the job running next to the failed one completes
+        assert len(done_jobs) <= 2
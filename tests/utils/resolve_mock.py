@@ -1,24 +1,164 @@
+import copy
+import itertools
+import json
+import random
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+from automate_davinci_resolve.davinci import fusion_settings
+from automate_davinci_resolve.davinci.fusion_settings import FusionTable, to_fusion_value
 from automate_davinci_resolve.davinci.resolve_app import ResolveApp
+from automate_davinci_resolve.davinci.rpc_stats import LatencyEstimates, RpcMonitor
 from automate_davinci_resolve.davinci.timecode import Timecode, TimecodeSettings
 from automate_davinci_resolve.davinci.timeline import Timeline
 
 
+# Simulated cost of a scripting call, in seconds.
+# Calls made by a mock while serving another call are free, like work done inside Resolve.
+class MockLatency:
+    realistic_latencies = LatencyEstimates.typical_latencies
+
+    def __init__(self, default: float = 0, latencies: Optional[dict[str, float]] = None, jitter: float = 0, seed: int = 0):
+        self.default = default
+        self.latencies = latencies or {}
+        self.jitter = jitter
+        self.random = random.Random(seed)
+
+    @classmethod
+    def realistic(cls, jitter: float = 0.0005, seed: int = 0):
+        return cls(default=0.001, latencies=cls.realistic_latencies, jitter=jitter, seed=seed)
+
+    def get(self, method: str):
+        latency = self.latencies.get(method, self.default)
+
+        if self.jitter > 0:
+            latency += self.random.uniform(0, self.jitter)
+
+        return latency
+
+
 class ResolveMockBase:
+    latency = MockLatency()
+    call_counts = Counter()
+    call_counts_by_type = Counter()
+    call_state = threading.local()
+    call_counts_lock = threading.Lock()
+
     def __init__(self, data: dict):
         self._data = data
 
+    def __getattribute__(self, name):
+        attr = object.__getattribute__(self, name)
+
+        # scripting API methods are CamelCase
+        if name[:1].isupper() and callable(attr):
+            return ResolveMockBase._simulate_call(type(self).__name__, name, attr)
+
+        return attr
+
+    @staticmethod
+    def _simulate_call(type_name, name, method):
+        def call(*args, **kw):
+            depth = getattr(ResolveMockBase.call_state, "depth", 0)
+
+            if depth > 0:
+                return method(*args, **kw)
+
+            # counted from worker threads too
+            with ResolveMockBase.call_counts_lock:
+                ResolveMockBase.call_counts[name] += 1
+                ResolveMockBase.call_counts_by_type[type_name] += 1
+
+            latency = ResolveMockBase.latency.get(name)
+
+            if latency > 0:
+                time.sleep(latency)
+
+            ResolveMockBase.call_state.depth = depth + 1
+
+            try:
+                return method(*args, **kw)
+            finally:
+                ResolveMockBase.call_state.depth = depth
+
+        return call
+
+
+mock_ids = itertools.count(1)
+
+
+def new_mock_id(prefix: str):
+    return f"{prefix}-{next(mock_ids)}"
+
+
+class ResolveMediaPoolItemMock(ResolveMockBase):
+    def GetName(self) -> str:
+        return self._data.get("name")
+
+    def GetClipProperty(self, name: str):
+        return self._data.get("properties", {}).get(name, self._data.get("name") if name == "Clip Name" else None)
+
+
+class ResolveFolderMock(ResolveMockBase):
+    def GetName(self) -> str:
+        return self._data.get("name")
+
+    def GetClipList(self):
+        return [ResolveMediaPoolItemMock(clip) for clip in self._data.get("clips", [])]
+
+    def GetSubFolderList(self):
+        return [ResolveFolderMock(folder) for folder in self._data.get("folders", [])]
+
 
 class ResolveMediaPoolMock(ResolveMockBase):
-    pass
+    def __init__(self, data: dict, project: "ResolveProjectMock"):
+        super().__init__(data)
+        self.project = project
+
+    def GetRootFolder(self):
+        return ResolveFolderMock(self._data.setdefault("root_folder", {"name": "Master"}))
+
+    def AppendToTimeline(self, clip_infos: list[dict]):
+        timeline = self.project.GetCurrentTimeline()
+
+        if timeline is None:
+            return []
+
+        return [timeline.append_clip(**clip_info) for clip_info in clip_infos]
+
+    def ImportTimelineFromFile(self, path: str):
+        path = Path(path)
+
+        if not path.exists():
+            return None
+
+        timeline_data = json.loads(path.read_text(encoding="utf-8"), object_hook=ResolveTimelineMock.decode_track_indices)
+        timeline_data["id"] = new_mock_id("timeline")
+
+        return self.project.add_timeline(timeline_data)
 
 
 class ResolveMediaStorageMock(ResolveMockBase):
     pass
 
 
+class ResolveFusionGradientMock:
+    ID = "Gradient"
+
+    def __init__(self, value: dict):
+        self.Value = value
+
+    def __eq__(self, other):
+        return isinstance(other, ResolveFusionGradientMock) and self.Value == other.Value
+
+
 class ResolveFusionNodeInputMock(ResolveMockBase):
-    def GetAttrs(self, name: str):
-        return self._data.get(name)
+    def GetAttrs(self, name: Optional[str] = None):
+        return self._data.get(name) if name is not None else dict(self._data)
 
     def GetExpression(self):
         return self._data.get("expression")
@@ -28,26 +168,61 @@ class ResolveFusionNodeInputMock(ResolveMockBase):
 
 
 class ResolveFusionNodeMock(ResolveMockBase):
-    settings = {}
-
     def GetInput(self, name: str):
         return self._data.get(name)
 
     def GetInputList(self):
-        return {key: ResolveFusionNodeInputMock({"INPS_ID": key}) for key in self._data}
+        return {
+            index: ResolveFusionNodeInputMock({"INPS_ID": key, "INPS_DataType": self._get_data_type(value)})
+            for index, (key, value) in enumerate(self._data.items(), 1)
+        }
+
+    def _get_data_type(self, value):
+        if isinstance(value, ResolveFusionGradientMock):
+            return "Gradient"
+
+        return "Text" if isinstance(value, str) else "Number"
 
     def SetInput(self, name: str, value):
-        self._data[name] = value
+        # fusion objects are copied into the tool
+        self._data[name] = copy.deepcopy(value) if isinstance(value, ResolveFusionGradientMock) else value
 
     def SaveSettings(self, path):
-        self.settings[path] = self._data
+        path = Path(path)
+
+        if not path.parent.exists():
+            return False
+
+        inputs = FusionTable(fields={key: FusionTable("Input", {"Value": to_fusion_value(value)}) for key, value in self._data.items()})
+        tool = FusionTable("TextPlus", {"Inputs": inputs})
+        fusion_settings.write_settings(path, FusionTable(fields={"Tools": FusionTable("ordered()", {"Template": tool}), "ActiveTool": "Template"}))
         return True
 
     def LoadSettings(self, path):
+        settings = fusion_settings.read_settings(path)
+
+        if settings is None:
+            return False
+
         self._data.clear()
-        self._data.update(**self.settings[path])
+
+        for key, input in fusion_settings.get_inputs(fusion_settings.get_tool(settings)).fields.items():
+            self._data[key] = self._from_fusion_value(input.get("Value"))
+
         return True
 
+    def _from_fusion_value(self, value):
+        if not isinstance(value, FusionTable):
+            return value
+
+        if value.type_name == "Gradient":
+            return ResolveFusionGradientMock(self._from_fusion_value(value.get("Colors")))
+
+        if len(value.fields) == 0:
+            return {i: self._from_fusion_value(item) for i, item in enumerate(value.array, 1)}
+
+        return {key: self._from_fusion_value(item) for key, item in value.fields.items()}
+
 
 class ResolveFusionCompMock(ResolveMockBase):
     def FindToolByID(self, id: str):
@@ -68,10 +243,19 @@ class ResolveTimelineItemMock(ResolveMockBase):
         return self._data.get("name")
 
     def GetStart(self) -> int:
-        return Timecode.from_str(self._data["start"], self.timecode_settings, True).get_frame(True)
+        return self._get_frame("start")
 
     def GetEnd(self) -> int:
-        return Timecode.from_str(self._data["end"], self.timecode_settings, True).get_frame(True)
+        return self._get_frame("end")
+
+    def _get_frame(self, key: str) -> int:
+        # frames are stored either as timecode string or as frame number
+        value = self._data.get(key, 0)
+
+        if isinstance(value, str):
+            return Timecode.from_str(value, self.timecode_settings, True).get_frame(True)
+
+        return value
 
     def GetFusionCompCount(self) -> int:
         return len(self._data.get("fusion_comps", {}))
@@ -84,8 +268,16 @@ class ResolveTimelineItemMock(ResolveMockBase):
     def GetClipColor(self) -> str:
         return self._data.get("clip_color", "")
 
+    def SetClipColor(self, color: str) -> bool:
+        self._data["clip_color"] = color
+        return True
+
 
 class ResolveTimelineMock(ResolveMockBase):
+    def __init__(self, data: dict, project: Optional["ResolveProjectMock"] = None):
+        super().__init__(data)
+        self.project = project
+
     def GetUniqueId(self):
         return self._data.get("id")
 
@@ -98,6 +290,9 @@ class ResolveTimelineMock(ResolveMockBase):
     def GetStartTimecode(self) -> str:
         return self._data["start_timecode"]
 
+    def GetCurrentTimecode(self) -> str:
+        return self._data.get("current_timecode", self._data["start_timecode"])
+
     def GetTrackCount(self, track_type: str) -> int:
         return len(self._data.get("tracks", {}).get(track_type, {}))
 
@@ -111,24 +306,154 @@ class ResolveTimelineMock(ResolveMockBase):
 
         return [ResolveTimelineItemMock(item, timecode_settings) for item in items] if items is not None else None
 
+    def DuplicateTimeline(self, timeline_name: str):
+        if self.project is None:
+            return None
+
+        timeline_data = copy.deepcopy(self._data)
+        timeline_data.update(id=new_mock_id("timeline"), name=timeline_name)
+
+        for track in timeline_data.get("tracks", {}).get("video", {}).values():
+            for item in track.get("items", []):
+                item["id"] = new_mock_id("item")
+
+        timeline = self.project.add_timeline(timeline_data)
+        self.project.SetCurrentTimeline(timeline)
+
+        return timeline
+
+    def Export(self, path: str, export_type, export_subtype) -> bool:
+        path = Path(path)
+
+        if not path.parent.exists():
+            return False
+
+        path.write_text(json.dumps(self._data), encoding="utf-8")
+        return True
+
+    @staticmethod
+    def decode_track_indices(obj: dict):
+        # json turns track indices into strings
+        return {int(key) if key.isdigit() else key: value for key, value in obj.items()}
+
+    def append_clip(self, mediaPoolItem: ResolveMediaPoolItemMock, startFrame: int, endFrame: int, recordFrame: int, trackIndex: int = 1):
+        clip_data = mediaPoolItem._data
+        item = {
+            "id": new_mock_id("item"),
+            "name": clip_data.get("name"),
+            "start": recordFrame,
+            "end": recordFrame + endFrame - startFrame,
+            "fusion_comps": copy.deepcopy(clip_data.get("fusion_comps", {})),
+        }
+
+        track = self._data.setdefault("tracks", {}).setdefault("video", {}).setdefault(trackIndex, {})
+        track.setdefault("items", []).append(item)
+
+        return ResolveTimelineItemMock(item, Timeline(self).get_timecode_settings())
+
 
 class ResolveProjectMock(ResolveMockBase):
+    def GetName(self) -> str:
+        return self._data.get("name")
+
     def GetMediaPool(self):
-        return ResolveMediaPoolMock(self._data["media_pool"])
+        return ResolveMediaPoolMock(self._data["media_pool"], self)
 
     def GetCurrentTimeline(self):
-        return ResolveTimelineMock(self._data.get("current_timeline"))
+        timeline = self._data.get("current_timeline")
+
+        return ResolveTimelineMock(timeline, self) if timeline is not None else None
+
+    def SetCurrentTimeline(self, timeline: ResolveTimelineMock) -> bool:
+        self._data["current_timeline"] = timeline._data
+        return True
+
+    def GetTimelineCount(self) -> int:
+        return len(self._get_timelines())
+
+    def GetTimelineByIndex(self, index: int):
+        timelines = self._get_timelines()
+
+        return ResolveTimelineMock(timelines[index - 1], self) if 1 <= index <= len(timelines) else None
 
     def GetSetting(self, name):
         return self._data["setting"][name]
 
+    def _get_timelines(self) -> list[dict]:
+        timelines = self._data.setdefault("timelines", [])
+        current_timeline = self._data.get("current_timeline")
+
+        if current_timeline is not None and all(timeline is not current_timeline for timeline in timelines):
+            timelines.insert(0, current_timeline)
+
+        return timelines
+
+    def add_timeline(self, timeline_data: dict):
+        self._get_timelines().append(timeline_data)
+        return ResolveTimelineMock(timeline_data, self)
+
 
 class ResolveProjectManagerMock(ResolveMockBase):
     def GetCurrentProject(self):
-        return ResolveProjectMock(self._data["current_project"])
+        project = self._data.get("current_project")
+
+        return ResolveProjectMock(project) if project is not None else None
+
+    def ImportProject(self, path: str, project_name: str) -> bool:
+        path = Path(path)
+        projects = self._get_projects()
+
+        if not path.exists() or project_name in projects:
+            return False
+
+        project_data = json.loads(path.read_text(encoding="utf-8"), object_hook=ResolveTimelineMock.decode_track_indices)
+        project_data["name"] = project_name
+        projects[project_name] = project_data
+
+        return True
+
+    def ExportProject(self, project_name: str, path: str) -> bool:
+        project_data = self._get_projects().get(project_name)
+
+        if project_data is None or not Path(path).parent.exists():
+            return False
+
+        Path(path).write_text(json.dumps(project_data), encoding="utf-8")
+        return True
+
+    def LoadProject(self, project_name: str):
+        project_data = self._get_projects().get(project_name)
+
+        if project_data is None:
+            return None
+
+        self._data["current_project"] = project_data
+        return ResolveProjectMock(project_data)
+
+    def DeleteProject(self, project_name: str) -> bool:
+        projects = self._get_projects()
+
+        # Resolve refuses to delete the opened project
+        if project_name not in projects or projects[project_name] is self._data.get("current_project"):
+            return False
+
+        del projects[project_name]
+        return True
+
+    def _get_projects(self) -> dict[str, dict]:
+        projects = self._data.setdefault("projects", {})
+        current_project = self._data.get("current_project")
+
+        if current_project is not None:
+            projects.setdefault(current_project.get("name"), current_project)
+
+        return projects
 
 
 class ResolveScriptAppMock(ResolveMockBase):
+    EXPORT_DRT = "EXPORT_DRT"
+    EXPORT_NONE = "EXPORT_NONE"
+
     def GetProductName(self):
         return self._data.get("product_name")
 
@@ -140,11 +465,30 @@ class ResolveScriptAppMock(ResolveMockBase):
 
 
 class ResolveAppMock(ResolveApp):
-    def __init__(self):
+    def __init__(self, latency: Optional[MockLatency] = None):
         super().__init__()
 
         self.mock_data = None
 
+        ResolveMockBase.latency = latency or MockLatency()
+        ResolveMockBase.call_counts = Counter()
+        ResolveMockBase.call_counts_by_type = Counter()
+
+    @property
+    def call_counts(self) -> Counter:
+        return ResolveMockBase.call_counts
+
+    def set_latency(self, latency: MockLatency):
+        ResolveMockBase.latency = latency
+
+    @property
+    def call_counts_by_type(self) -> Counter:
+        return ResolveMockBase.call_counts_by_type
+
+    def reset_call_counts(self):
+        ResolveMockBase.call_counts.clear()
+        ResolveMockBase.call_counts_by_type.clear()
+
     def load_script_app(self):
         if self.mock_data is None:
             return None
@@ -157,6 +501,7 @@ class ResolveAppMock(ResolveApp):
                 "product_name": "resolve",
                 "project_manager": {
                     "current_project": {
+                        "name": "Project",
                         "media_pool": {},
                     }
                 },
@@ -172,6 +517,7 @@ class ResolveAppMock(ResolveApp):
                 "product_name": "resolve",
                 "project_manager": {
                     "current_project": {
+                        "name": "Project",
                         "media_pool": {},
                         "current_timeline": {
                             "setting": {"timelineFrameRate": 60.0},
@@ -185,5 +531,40 @@ class ResolveAppMock(ResolveApp):
         self.mock_data["project_manager"]["current_project"]["current_timeline"].update(data)
         self.update()
 
+    def mock_media_pool_clips(self, clips: list[dict]):
+        root_folder = self.mock_data["project_manager"]["current_project"]["media_pool"].setdefault("root_folder", {"name": "Master"})
+        root_folder.setdefault("clips", []).extend(clips)
+
+    @contextmanager
+    def measure_rpc_calls(self):
+        with RpcMonitor.measure() as rpc_stats:
+            yield rpc_stats
+
     def get_mocked_current_timeline(self):
         return self.mock_data.get("project_manager", {}).get("current_project", {}).get("current_timeline", None)
+
+    # helpers to mutate the mocked timeline between updates, as an editor would do
+
+    def get_mocked_track(self, track_index: int, track_type: str = "video"):
+        return self.get_mocked_current_timeline().setdefault("tracks", {}).setdefault(track_type, {}).setdefault(track_index, {"items": []})
+
+    def add_mocked_items(self, track_index: int, items: list[dict], track_type: str = "video"):
+        self.get_mocked_track(track_index, track_type).setdefault("items", []).extend(items)
+
+    def remove_mocked_items(self, track_index: int, item_ids: set[str], track_type: str = "video"):
+        track = self.get_mocked_track(track_index, track_type)
+        track["items"] = [item for item in track.get("items", []) if item.get("id") not in item_ids]
+
+    def update_mocked_item(self, item_id: str, **data):
+        for tracks in self.get_mocked_current_timeline().get("tracks", {}).values():
+            for track in tracks.values():
+                for item in track.get("items", []):
+                    if item.get("id") == item_id:
+                        item.update(data)
+                        return item
+
+        return None
+
+    def swap_mocked_tracks(self, track_index_1: int, track_index_2: int, track_type: str = "video"):
+        tracks = self.get_mocked_current_timeline()["tracks"][track_type]
+        tracks[track_index_1], tracks[track_index_2] = tracks[track_index_2], tracks[track_index_1]
@@ -0,0 +1,46 @@
+from contextlib import contextmanager
+from typing import Optional
+
+import pytest
+
+from .resolve_mock import ResolveAppMock
+
+
+# Fails the test when a block makes more scripting calls than declared by @pytest.mark.rpc_budget.
+class RpcBudget:
+    item_types = {"ResolveTimelineItemMock", "ResolveFusionCompMock", "ResolveFusionNodeMock", "ResolveFusionNodeInputMock"}
+    track_types = {"ResolveTimelineMock"}
+
+    def __init__(self, resolve_app: ResolveAppMock, per_item: Optional[float] = None, per_track: Optional[float] = None, total: Optional[int] = None):
+        self.resolve_app = resolve_app
+        self.per_item = per_item
+        self.per_track = per_track
+        self.total = total
+
+    @contextmanager
+    def measure(self, items: int = 0, tracks: int = 0):
+        self.resolve_app.reset_call_counts()
+
+        yield
+
+        self.check(items, tracks)
+
+    def check(self, items: int, tracks: int):
+        counts_by_type = self.resolve_app.call_counts_by_type
+        item_calls = sum(count for type_name, count in counts_by_type.items() if type_name in self.item_types)
+        track_calls = sum(count for type_name, count in counts_by_type.items() if type_name in self.track_types)
+        total_calls = sum(counts_by_type.values())
+
+        errors = []
+
+        if self.per_item is not None and item_calls > self.per_item * items:
+            errors.append(f"{item_calls} item calls for {items} items exceed {self.per_item} per item")
+
+        if self.per_track is not None and track_calls > self.per_track * tracks:
+            errors.append(f"{track_calls} track calls for {tracks} tracks exceed {self.per_track} per track")
+
+        if self.total is not None and total_calls > self.total:
+            errors.append(f"{total_calls} calls exceed {self.total} in total")
+
+        if len(errors) > 0:
+            pytest.fail(f"Scripting call budget exceeded: {'; '.join(errors)}. Calls: {dict(self.resolve_app.call_counts.most_common())}")